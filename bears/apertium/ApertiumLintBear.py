@@ -4,7 +4,10 @@ from coalib.bearlib.abstractions.Linter import linter
 from dependency_management.requirements.PipRequirement import PipRequirement
 from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
 
+from bears.utils.MemoizedConfig import memoized_config
 
+
+@memoized_config
 @linter(executable='apertium_lint',
         output_format='regex',
         output_regex=r'(?P<severity>\w+) : (?P<message>[^:\n]+: '
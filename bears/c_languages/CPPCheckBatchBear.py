@@ -0,0 +1,21 @@
+from bears.c_languages.CPPCheckBear import CPPCheckBear
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(CPPCheckBear,
+                output_filename_regex=r'(?P<filename>.+?):(?=\d+:[a-zA-Z]+:)',
+                use_stdout=False,
+                use_stderr=True,
+                strip_filename=True)
+class CPPCheckBatchBear:
+    """
+    Report possible security weaknesses for C/C++, running ``cppcheck`` once
+    for many files instead of once per file.
+    For more information, consult <https://github.com/danmar/cppcheck>.
+    """
+
+    @staticmethod
+    def create_batch_arguments(arguments):
+        return tuple('--template={file}:' + arg[len('--template='):]
+                     if arg.startswith('--template=') else arg
+                     for arg in arguments)
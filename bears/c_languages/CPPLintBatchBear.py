@@ -0,0 +1,14 @@
+from bears.c_languages.CPPLintBear import CPPLintBear
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(CPPLintBear,
+                output_filename_regex=r'(?P<filename>.+?):\d+: ',
+                use_stdout=False,
+                use_stderr=True)
+class CPPLintBatchBear:
+    """
+    Check C++ code for Google's C++ style guide, running ``cpplint`` once for
+    many files instead of once per file.
+    For more information, consult <https://github.com/theandrewdavis/cpplint>.
+    """
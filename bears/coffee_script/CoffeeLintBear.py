@@ -7,7 +7,10 @@ from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
 from coalib.results.Result import Result
 from coala_utils.param_conversion import negate
 
+from bears.utils.MemoizedConfig import memoized_config
 
+
+@memoized_config
 @linter(executable='coffeelint',
         use_stdin=True)
 class CoffeeLintBear:
@@ -4,7 +4,10 @@ from coalib.bearlib.abstractions.Linter import linter
 
 from dependency_management.requirements.NpmRequirement import NpmRequirement
 
+from bears.utils.MemoizedConfig import memoized_config
 
+
+@memoized_config
 @linter(executable='csscomb',
         output_format='corrected',
         use_stdin=True,
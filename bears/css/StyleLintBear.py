@@ -2,7 +2,10 @@ import json
 from coalib.bearlib.abstractions.Linter import linter
 from dependency_management.requirements.NpmRequirement import NpmRequirement
 
+from bears.utils.MemoizedConfig import memoized_config
 
+
+@memoized_config
 @linter(executable='stylelint',
         output_format='regex',
         output_regex=r'\s*(?P<filename>.+)\s*(?P<line>\d+):(?P<column>\d+)\s*'
@@ -1,3 +1,5 @@
+import hashlib
+
 from coalib.bearlib.languages.LanguageDefinition import LanguageDefinition
 from coalib.bears.LocalBear import LocalBear
 from coalib.results.HiddenResult import HiddenResult
@@ -6,13 +8,72 @@ from coalib.results.SourceRange import SourceRange
 from coalib.results.AbsolutePosition import AbsolutePosition
 from coala_utils.string_processing.Core import unescaped_search_for
 
+from bears.general.AnnotationRanges import AnnotationRanges, get_line_starts
+from bears.utils.LinterResultCache import result_cache
+
+# Change this whenever the ranges found for the same file change, so ranges
+# cached by older versions are not used anymore.
+ANNOTATION_CACHE_VERSION = '1'
+
+_language_delimiters = {}
+
+
+def get_delimiters(language, coalang_dir=None):
+    """
+    Returns the string and comment delimiters of a language, reading its
+    language definition only once per process.
+
+    >>> get_delimiters('python 3')['comment_delimiter']
+    {'#': ''}
+
+    :param language:           The programming language.
+    :param coalang_dir:        External directory for coalang file.
+    :return:                   A dictionary mapping ``string_delimiters``,
+                               ``multiline_string_delimiters``,
+                               ``comment_delimiter`` and
+                               ``multiline_comment_delimiters`` to
+                               dictionaries mapping the start delimiters to
+                               the end delimiters.
+    :raises FileNotFoundError: If the language is not known.
+    """
+    key = (language, coalang_dir)
+    if key not in _language_delimiters:
+        lang_dict = LanguageDefinition(language, coalang_dir=coalang_dir)
+        _language_delimiters[key] = {
+            name: dict(lang_dict[name])
+            for name in ('string_delimiters', 'multiline_string_delimiters',
+                         'comment_delimiter', 'multiline_comment_delimiters')}
+    return _language_delimiters[key]
+
+
+def get_annotation_key(file, delimiters):
+    """
+    Computes the key the annotations of a file are cached under, from its
+    contents and the delimiters of its language. The name of the file is not
+    part of the key, so files with the same contents share the entry.
+
+    :param file:       The lines of the file.
+    :param delimiters: The delimiters as returned by ``get_delimiters``.
+    :return:           The key.
+    """
+    key = hashlib.sha256()
+    for part in ('AnnotationBear',
+                 ANNOTATION_CACHE_VERSION,
+                 repr(sorted((name, sorted(value.items()))
+                             for name, value in delimiters.items())),
+                 ''.join(file)):
+        key.update(part.encode('utf-8', 'surrogateescape'))
+        key.update(b'\0')
+    return key.hexdigest()
+
 
 class AnnotationBear(LocalBear):
     AUTHORS = {'The coala developers'}
     AUTHORS_EMAILS = {'coala-devel@googlegroups.com'}
     LICENSE = 'AGPL-3.0'
 
-    def run(self, filename, file, language: str, coalang_dir: str = None):
+    def run(self, filename, file, language: str, coalang_dir: str = None,
+            use_result_cache: bool = False):
         """
         Finds out all the positions of strings and comments in a file.
         The Bear searches for valid comments and strings and yields their
@@ -22,44 +83,87 @@ class AnnotationBear(LocalBear):
             The programming language of the source code.
         :param coalang_dir:
             External directory for coalang file.
+        :param use_result_cache:
+            Whether to keep the ranges found for every file on disk, keyed by
+            the contents of the file and the delimiters of the language, so
+            other sections and later runs do not need to scan unchanged files
+            again. Looking up the ranges may take longer than scanning small
+            files, so this only pays off for large files.
         :return:
             One HiddenResult containing a dictionary with keys being 'strings'
-            or 'comments' and values being a tuple of SourceRanges pointing to
-            the strings and a tuple of SourceRanges pointing to all comments
-            respectively. The ranges do include string quotes or the comment
-            starting separator but not anything before (e.g. when using
-            ``u"string"``, the ``u`` will not be in the source range).
+            or 'comments' and values being ``AnnotationRanges`` holding the
+            ranges of the strings and of all comments respectively. These
+            are sequences of SourceRanges, which are only created when
+            accessed, and support fast lookups of positions. The ranges do
+            include string quotes or the comment starting separator but not
+            anything before (e.g. when using ``u"string"``, the ``u`` will
+            not be in the source range).
         """
         try:
-            lang_dict = LanguageDefinition(language, coalang_dir=coalang_dir)
+            delimiters = get_delimiters(language, coalang_dir)
         except FileNotFoundError:
             content = ('coalang specification for ' + language +
                        ' not found.')
             yield HiddenResult(self, content)
             return
 
-        string_delimiters = dict(lang_dict['string_delimiters'])
-        multiline_string_delimiters = dict(
-            lang_dict['multiline_string_delimiters'])
-        multiline_comment_delimiters = dict(
-            lang_dict['multiline_comment_delimiters'])
-        comment_delimiter = dict(lang_dict['comment_delimiter'])
-        string_ranges = comment_ranges = ()
+        annotations = None
+        if use_result_cache:
+            key = get_annotation_key(file, delimiters)
+            annotations = result_cache.get(key)
+        if annotations is None:
+            annotations = self.get_annotations(file, filename, delimiters)
+            if use_result_cache:
+                result_cache.set(key, annotations)
+
+        strings, comments, error = annotations
+        line_starts = get_line_starts(file)
+        if error is not None:
+            message, line, column = error
+            yield Result(self, message, severity=RESULT_SEVERITY.MAJOR,
+                         affected_code=(SourceRange.from_values(
+                             filename, line, column),))
+
+        content = {'strings': AnnotationRanges(filename, line_starts,
+                                               *strings),
+                   'comments': AnnotationRanges(filename, line_starts,
+                                                *comments)}
+        yield HiddenResult(self, content)
+
+    def get_annotations(self, file, filename, delimiters):
+        """
+        Finds the ranges of all annotations of a file, in a form independent
+        of the name of the file that can be cached.
+
+        :param file:
+            A tuple of strings, with each string being a line in the file.
+        :param filename:
+            The name of the file.
+        :param delimiters:
+            The delimiters of the language, as returned by
+            ``get_delimiters``.
+        :return:
+            A tuple of the start and end positions of the strings, the start
+            and end positions of the comments, both as tuples of two
+            ``array`` objects, and the message, line and column of the
+            error if an annotation is not closed, else ``None``.
+        """
         try:
             string_ranges, comment_ranges = self.find_annotation_ranges(
                 file,
                 filename,
-                string_delimiters,
-                multiline_string_delimiters,
-                comment_delimiter,
-                multiline_comment_delimiters)
-
+                delimiters['string_delimiters'],
+                delimiters['multiline_string_delimiters'],
+                delimiters['comment_delimiter'],
+                delimiters['multiline_comment_delimiters'])
         except NoCloseError as e:
-            yield Result(self, str(e), severity=RESULT_SEVERITY.MAJOR,
-                         affected_code=(e.code,))
+            no_ranges = ((), ())
+            return (no_ranges, no_ranges,
+                    (str(e), e.code.start.line, e.code.start.column))
 
-        content = {'strings': string_ranges, 'comments': comment_ranges}
-        yield HiddenResult(self, content)
+        return ((string_ranges.starts, string_ranges.ends),
+                (comment_ranges.starts, comment_ranges.ends),
+                None)
 
     def find_annotation_ranges(self,
                                file,
@@ -88,8 +192,8 @@ class AnnotationBear(LocalBear):
             A dictionary containing the various ways to define multi-line
             comments in a language.
         :return:
-            Two tuples first containing a tuple of strings, the second a tuple
-            of comments.
+            Two ``AnnotationRanges``, the first holding the ranges of the
+            strings, the second the ranges of the comments.
         """
         text = ''.join(file)
         strings_range = []
@@ -147,7 +251,13 @@ class AnnotationBear(LocalBear):
 
             position = get_new_position()
 
-        return tuple(strings_range), tuple(comments_range)
+        line_starts = get_line_starts(file)
+        return (AnnotationRanges(filename, line_starts,
+                                 (start for start, _ in strings_range),
+                                 (end for _, end in strings_range)),
+                AnnotationRanges(filename, line_starts,
+                                 (start for start, _ in comments_range),
+                                 (end for _, end in comments_range)))
 
     @staticmethod
     def get_range_end_position(file,
@@ -159,7 +269,7 @@ class AnnotationBear(LocalBear):
                                single_comment=False):
         _range = end_position = None
         for annotation in annotations.keys():
-            if text[position:].startswith(annotation):
+            if text.startswith(annotation, position):
                 if not single_comment:
                     ret_val = func(file,
                                    filename,
@@ -200,8 +310,8 @@ class AnnotationBear(LocalBear):
         :param position:
             An integer identifying the position where the annotation started.
         :return:
-            A SourceRange object holding the range of the multi-line annotation
-            and the end_position of the annotation as an integer.
+            A tuple of the start and end position of the multi-line
+            annotation and the end_position of the annotation as an integer.
         """
         end_end = get_end_position(annotation_end,
                                    text,
@@ -212,11 +322,7 @@ class AnnotationBear(LocalBear):
                 AbsolutePosition(file, position))
             raise NoCloseError(annotation_start, _range)
 
-        return (SourceRange.from_absolute_position(
-                    filename,
-                    AbsolutePosition(file, position),
-                    AbsolutePosition(file, end_end)),
-                end_end)
+        return (position, end_end), end_end
 
     @staticmethod
     def get_singleline_strings(file,
@@ -239,8 +345,8 @@ class AnnotationBear(LocalBear):
         :position:
             An integer identifying the position where the string started.
         :return:
-            A SourceRange object identifying the range of the single-line
-            string and the end_position of the string as an integer.
+            A tuple of the start and end position of the single-line string
+            and the end_position of the string as an integer.
         """
         end_position = get_end_position(string_end,
                                         text,
@@ -254,11 +360,7 @@ class AnnotationBear(LocalBear):
                 AbsolutePosition(file, position))
             raise NoCloseError(string_start, _range)
         if newline > end_position:
-            return (SourceRange.from_absolute_position(
-                        filename,
-                        AbsolutePosition(file, position),
-                        AbsolutePosition(file, end_position)),
-                    end_position)
+            return (position, end_position), end_position
 
     @staticmethod
     def get_singleline_comment(file, filename, text, comment, position):
@@ -275,19 +377,15 @@ class AnnotationBear(LocalBear):
         :position:
             An integer identifying the position where the string started.
         :return:
-            A SourceRange object identifying the range of the single-line
-            comment and the end_position of the comment as an integer.
+            A tuple of the start and end position of the single-line comment
+            and the end_position of the comment as an integer.
         """
         end_position = get_end_position('\n',
                                         text,
                                         position + len(comment) - 1)
         if end_position == -1:
             end_position = len(text) - 1
-        return (SourceRange.from_absolute_position(
-                    filename,
-                    AbsolutePosition(file, position),
-                    AbsolutePosition(file, end_position)),
-                end_position)
+        return (position, end_position), end_position
 
 
 def get_end_position(end_marker, text, position):
@@ -0,0 +1,198 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from itertools import accumulate, chain
+
+from coalib.results.SourceRange import SourceRange
+
+
+def get_line_starts(file):
+    """
+    Computes the absolute position every line of a file starts at.
+
+    >>> list(get_line_starts(['a\\n', 'bc\\n']))
+    [0, 2, 5]
+
+    :param file: The lines of the file.
+    :return:     An ``array`` of the positions, with the length of the whole
+                 file appended.
+    """
+    return array('l', accumulate(chain((0,), map(len, file))))
+
+
+class AnnotationRanges(Sequence):
+    """
+    The ranges of the strings or the comments of a file, as found by the
+    ``AnnotationBear``.
+
+    The ranges are stored as arrays of the absolute positions of their first
+    and last characters, which are sorted and do not overlap. Used as a
+    sequence, the ranges are given as ``SourceRange`` objects, which are
+    only created when accessed.
+
+    >>> file = ['a = "b"  # c\\n', 'd = "e"\\n']
+    >>> strings = AnnotationRanges('f', get_line_starts(file),
+    ...                            [4, 17], [6, 19])
+    >>> len(strings)
+    2
+    >>> strings[1].start.line, strings[1].start.column
+    (2, 5)
+    >>> strings.contains(5), strings.contains(7)
+    (True, False)
+    >>> strings.contains_position(2, 7)
+    True
+    """
+
+    def __init__(self, filename, line_starts, starts=(), ends=()):
+        """
+        :param filename:    The name of the file.
+        :param line_starts: The positions the lines of the file start at,
+                            as returned by ``get_line_starts``.
+        :param starts:      The positions the ranges start at.
+        :param ends:        The positions of the last characters of the
+                            ranges.
+        """
+        self.filename = filename
+        self.line_starts = line_starts
+        self.starts = array('l', starts)
+        self.ends = array('l', ends)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[item]
+                         for item in range(*index.indices(len(self))))
+
+        start_line, start_column = self.get_position(self.starts[index])
+        end_line, end_column = self.get_position(self.ends[index])
+        return SourceRange.from_values(self.filename, start_line, start_column,
+                                       end_line, end_column)
+
+    def __eq__(self, other):
+        if isinstance(other, AnnotationRanges):
+            return (self.filename == other.filename and
+                    self.starts == other.starts and
+                    self.ends == other.ends)
+        if isinstance(other, (tuple, list)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<{} of {!r} with {} ranges>'.format(
+            type(self).__name__, self.filename, len(self))
+
+    def get_position(self, offset):
+        """
+        :param offset: An absolute position in the file.
+        :return:       A tuple of the line and the column of the position,
+                       both starting at 1.
+        """
+        line = bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1] + 1
+
+    def get_offset(self, line, column):
+        """
+        :param line:   A line of the file, starting at 1.
+        :param column: A column of the line, starting at 1.
+        :return:       The absolute position in the file.
+        """
+        return self.line_starts[line - 1] + column - 1
+
+    def find(self, offset):
+        """
+        :param offset: An absolute position in the file.
+        :return:       The index of the range containing the position or
+                       ``-1`` if no range contains it.
+        """
+        index = bisect_right(self.starts, offset) - 1
+        if index >= 0 and offset <= self.ends[index]:
+            return index
+        return -1
+
+    def contains(self, offset):
+        """
+        :param offset: An absolute position in the file.
+        :return:       Whether any range contains the position.
+        """
+        return self.find(offset) != -1
+
+    def contains_position(self, line, column):
+        """
+        :param line:   A line of the file, starting at 1.
+        :param column: A column of the line, starting at 1.
+        :return:       Whether any range contains the position.
+        """
+        return self.contains(self.get_offset(line, column))
+
+    def get_line_ranges(self, line):
+        """
+        Finds the ranges starting and ending in the given line.
+
+        :param line: A line of the file, starting at 1.
+        :return:     A list of tuples of the first and last column of every
+                     range, in the order of the ranges.
+        """
+        line_start = self.line_starts[line - 1]
+        next_line_start = self.line_starts[line]
+        return [(self.starts[index] - line_start + 1,
+                 self.ends[index] - line_start + 1)
+                for index in range(bisect_left(self.starts, line_start),
+                                   bisect_left(self.starts, next_line_start))
+                if self.ends[index] < next_line_start]
+
+    def iter_positions(self):
+        """
+        Yields the ranges without creating ``SourceRange`` objects.
+
+        :return: A generator of tuples of the start line, the start column,
+                 the end line and the end column of every range.
+        """
+        for start, end in zip(self.starts, self.ends):
+            yield self.get_position(start) + self.get_position(end)
+
+
+def as_annotation_ranges(filename, file, ranges):
+    """
+    Converts ranges of strings or comments given as ``SourceRange`` objects
+    to ``AnnotationRanges``, so bears depending on the ``AnnotationBear`` can
+    handle both the same way.
+
+    >>> from coalib.results.SourceRange import SourceRange
+    >>> file = ['a = "b"  # c\\n', 'd = "e"\\n']
+    >>> strings = as_annotation_ranges(
+    ...     'f', file, (SourceRange.from_values('f', 2, 5, 2, 7),
+    ...                 SourceRange.from_values('f', 1, 5, 1, 7)))
+    >>> list(strings.starts), list(strings.ends)
+    ([4, 17], [6, 19])
+    >>> as_annotation_ranges('f', file, strings) is strings
+    True
+
+    :param filename: The name of the file.
+    :param file:     The lines of the file.
+    :param ranges:   The ``AnnotationRanges`` or a sequence of
+                     ``SourceRange`` objects not overlapping each other.
+                     Columns past the end of their line are taken as the
+                     last character of the line.
+    :return:         The given ``AnnotationRanges`` or ``AnnotationRanges``
+                     holding the given ranges.
+    """
+    if isinstance(ranges, AnnotationRanges):
+        return ranges
+
+    result = AnnotationRanges(filename, get_line_starts(file))
+
+    def get_offset(line, column):
+        # Columns past the end of a line stand for its last character.
+        return result.get_offset(line, min(column, len(file[line - 1])))
+
+    positions = sorted(
+        (get_offset(source_range.start.line, source_range.start.column),
+         get_offset(source_range.end.line, source_range.end.column))
+        for source_range in ranges)
+    result.starts.extend(start for start, _ in positions)
+    result.ends.extend(end for _, end in positions)
+    return result
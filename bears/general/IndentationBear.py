@@ -9,6 +9,7 @@ from coalib.results.AbsolutePosition import AbsolutePosition
 from coalib.results.Diff import Diff
 
 from bears.general.AnnotationBear import AnnotationBear
+from bears.general.AnnotationRanges import as_annotation_ranges
 
 
 class IndentationBear(LocalBear):
@@ -383,6 +384,9 @@ class IndentationBear(LocalBear):
                                 of sequence outside of string's and comments.
         """
         file_string = ''.join(file)
+        strings = as_annotation_ranges(None, file, annotation_dict['strings'])
+        comments = as_annotation_ranges(None, file,
+                                        annotation_dict['comments'])
         # tuple since order is important
         sequence_positions = tuple()
 
@@ -392,24 +396,17 @@ class IndentationBear(LocalBear):
                                     file, sequence_match.start())
             sequence_line_text = file[sequence_position.line - 1]
 
-            # ignore if within string
-            for string in annotation_dict['strings']:
-                if(gt_eq(sequence_position, string.start) and
-                   lt_eq(sequence_position, string.end)):
-                    valid = False
-
-            # ignore if within comments
-            for comment in annotation_dict['comments']:
-                if(gt_eq(sequence_position, comment.start) and
-                   lt_eq(sequence_position, comment.end)):
-                    valid = False
-
-                if(comment.start.line == sequence_position.line and
-                        comment.end.line == sequence_position.line and
-                        check_ending):
+            # ignore if within string or comments
+            if (strings.contains(sequence_match.start()) or
+                    comments.contains(sequence_match.start())):
+                valid = False
+
+            if check_ending:
+                for start_column, end_column in comments.get_line_ranges(
+                        sequence_position.line):
                     sequence_line_text = sequence_line_text[
-                        :comment.start.column - 1] + sequence_line_text[
-                        comment.end.column-1:]
+                        :start_column - 1] + sequence_line_text[
+                        end_column-1:]
 
             if encapsulators:
                 for encapsulator in encapsulators:
@@ -471,17 +468,22 @@ def get_first_unindent(indent,
     :return:                The line where unindent is found (intial 0).
     """
     line_nr = start_line
+    comment_ranges = as_annotation_ranges(None, file,
+                                          annotation_dict['comments'])
 
     while line_nr < len(file):
         valid = True
 
-        for comment in annotation_dict['comments']:
-            if(comment.start.line < line_nr + 1 and
-               comment.end.line >= line_nr + 1):
+        if comment_ranges:
+            # A comment started on an earlier line contains the first
+            # character of the line.
+            line_start = comment_ranges.get_offset(line_nr + 1, 1)
+            index = comment_ranges.find(line_start)
+            if index != -1 and comment_ranges.starts[index] < line_start:
                 valid = False
 
-            first_char = file[line_nr].lstrip()[0] if file[line_nr].strip()\
-                else ''
+            first_char = (file[line_nr].lstrip()[0]
+                          if file[line_nr].strip() else '')
             if first_char in comments:
                 valid = False
 
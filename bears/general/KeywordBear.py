@@ -5,9 +5,9 @@ from coalib.bearlib import deprecate_settings
 from coalib.bears.LocalBear import LocalBear
 from coalib.results.Diff import Diff
 from coalib.results.Result import RESULT_SEVERITY, Result
-from coalib.results.SourceRange import SourceRange
 
 from bears.general.AnnotationBear import AnnotationBear
+from bears.general.AnnotationRanges import as_annotation_ranges
 
 
 def _get_comments(dependency_results):
@@ -20,15 +20,18 @@ def _get_comments(dependency_results):
         if isinstance(result.contents, str):
             logging.error(result.contents)
         else:
-            yield from result.contents.get('comments', [])
+            yield result.contents.get('comments', [])
 
 
 def generate_diff(comments, file, filename,
                   line, line_number, pos):
-    todo_source_range = SourceRange.from_values(filename, line_number,
-                                                pos + 1)
-    affected_comment_sourcerange = [
-        c for c in comments if todo_source_range in c]
+    affected_comment_sourcerange = []
+    for comment_ranges in comments:
+        comment_ranges = as_annotation_ranges(filename, file, comment_ranges)
+        index = comment_ranges.find(
+            comment_ranges.get_offset(line_number, pos + 1))
+        if index != -1:
+            affected_comment_sourcerange.append(comment_ranges[index])
 
     affected_len = len(affected_comment_sourcerange)
 
@@ -1,5 +1,3 @@
-import re
-
 from coalib.bears.LocalBear import LocalBear
 from coalib.results.Result import Result
 from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
@@ -13,9 +11,8 @@ class LineCountBear(LocalBear):
     CAN_DETECT = {'Formatting'}
 
     def _get_blank_line_count(self, file):
-        num_blank_lines = len(
-            list(filter(lambda x: re.match(r'^\s*$', x), file)))
-        return num_blank_lines
+        # A line is blank if nothing is left after stripping the whitespace.
+        return len(file) - sum(map(bool, map(str.strip, file)))
 
     def run(self, filename, file, max_lines_per_file: int,
             exclude_blank_lines: bool=False):
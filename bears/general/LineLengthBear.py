@@ -33,7 +33,15 @@ class LineLengthBear(LocalBear):
         spacing_helper = SpacingHelper(indent_size)
         ignore_regexes = [re.compile(regex) for regex in ignore_length_regex]
 
+        # A tab is expanded to at most ``indent_size`` spaces, so lines that
+        # are short enough even then need not be expanded.
+        tab_growth = max(indent_size - 1, 0)
+
         for line_number, line in enumerate(file):
+            if (len(line) + line.count('\t') * tab_growth <=
+                    max_line_length + 1):
+                continue
+
             line = spacing_helper.replace_tabs_with_spaces(line)
             if len(line) > max_line_length + 1:
                 if any(regex.search(line) for regex in ignore_regexes):
@@ -1,5 +1,6 @@
 from coalib.bears.LocalBear import LocalBear
 from bears.general.AnnotationBear import AnnotationBear
+from bears.general.AnnotationRanges import as_annotation_ranges
 from coalib.results.Diff import Diff
 from coalib.results.HiddenResult import HiddenResult
 from coalib.results.Result import Result
@@ -70,13 +71,16 @@ class QuotesBear(LocalBear):
             self.err(dependency_results[AnnotationBear.name][0].contents)
             return
 
-        ranges = dependency_results[AnnotationBear.name][0].contents['strings']
+        ranges = as_annotation_ranges(
+            filename, file,
+            dependency_results[AnnotationBear.name][0].contents['strings'])
 
-        for string_range in ranges:
-            if (file[string_range.start.line-1][string_range.start.column-1] ==
-                    preferred_quotation):
+        # Only the strings to correct are turned into SourceRanges.
+        for index, (start_line, start_column, end_line, _) in enumerate(
+                ranges.iter_positions()):
+            if file[start_line-1][start_column-1] == preferred_quotation:
                 continue
 
-            if string_range.start.line == string_range.end.line:
+            if start_line == end_line:
                 yield from self.correct_single_line_str(
-                    filename, file, string_range, preferred_quotation)
+                    filename, file, ranges[index], preferred_quotation)
@@ -1,9 +1,79 @@
+from bisect import bisect_right
+from functools import lru_cache
+import re
+
 from coalib.bearlib import deprecate_settings
 from coalib.bearlib.spacing.SpacingHelper import SpacingHelper
 from coalib.bears.LocalBear import LocalBear
 from coalib.results.Diff import Diff
 from coalib.results.Result import Result
 
+from bears.general.AnnotationRanges import get_line_starts
+
+# Patterns matching somewhere in every line the checks of the
+# ``SpaceConsistencyBear`` could change. Spaces are only replaced by tabs if
+# there are at least two of them or if they are followed by a tab.
+TAB_PATTERN = r'\t'
+SPACES_PATTERN = r'  | \t'
+TRAILING_WHITESPACE_PATTERN = r'[ \t]$'
+
+
+@lru_cache()
+def get_candidate_regex(use_spaces, allow_trailing_whitespace):
+    """
+    :param use_spaces:                Whether spaces are to be used instead
+                                      of tabs.
+    :param allow_trailing_whitespace: Whether trailing whitespace is allowed.
+    :return:                          The compiled regex matching in the lines
+                                      to check.
+    """
+    patterns = [TAB_PATTERN if use_spaces else SPACES_PATTERN]
+    if not allow_trailing_whitespace:
+        patterns.append(TRAILING_WHITESPACE_PATTERN)
+    return re.compile('|'.join(patterns), re.MULTILINE)
+
+
+def get_candidate_lines(file, use_spaces, allow_trailing_whitespace):
+    """
+    Finds the lines that may contain spacing inconsistencies, scanning the
+    whole file with a single regex instead of checking every line on its own.
+
+    >>> get_candidate_lines(['a\\n', '\\tb\\n', 'c \\n', 'd'], True, False)
+    [2, 3, 4]
+    >>> get_candidate_lines(['a\\n', '\\tb\\n', 'c \\n', 'd'], False, True)
+    [4]
+
+    :param file:                      The lines of the file.
+    :param use_spaces:                Whether spaces are to be used instead
+                                      of tabs.
+    :param allow_trailing_whitespace: Whether trailing whitespace is allowed.
+    :return:                          A sorted list of the numbers of the
+                                      lines, starting at 1.
+    """
+    if not file:
+        return []
+
+    text = ''.join(file)
+    line_starts = get_line_starts(file)
+    regex = get_candidate_regex(use_spaces, allow_trailing_whitespace)
+    candidates = set()
+    match = regex.search(text)
+    while match:
+        line_number = bisect_right(line_starts, match.start())
+        candidates.add(line_number)
+        match = regex.search(text, line_starts[line_number])
+
+    # Usually only the last line can lack a newline, which is checked
+    # for every line only if there are fewer newlines than expected.
+    missing_newline = not file[-1].endswith('\n')
+    if text.count('\n') < len(file) - missing_newline:
+        candidates.update(line_number
+                          for line_number, line in enumerate(file, start=1)
+                          if not line.endswith('\n'))
+    elif missing_newline:
+        candidates.add(len(file))
+    return sorted(candidates)
+
 
 class SpaceConsistencyBear(LocalBear):
     LANGUAGES = {'All'}
@@ -38,7 +108,9 @@ class SpaceConsistencyBear(LocalBear):
         result_texts = []
         additional_info_texts = []
 
-        for line_number, line in enumerate(file, start=1):
+        for line_number in get_candidate_lines(file, use_spaces,
+                                               allow_trailing_whitespace):
+            line = file[line_number - 1]
             replacement = line
 
             if enforce_newline_at_EOF:
@@ -5,7 +5,10 @@ from coalib.settings.Setting import typed_list
 from dependency_management.requirements.NpmRequirement import NpmRequirement
 from dependency_management.requirements.PipRequirement import PipRequirement
 
+from bears.utils.MemoizedConfig import memoized_config
 
+
+@memoized_config
 @linter(executable='textlint',
         output_format='regex',
         output_regex=r'(?P<line>\d+):(?P<column>\d+)(?:\s|\u2713)*'
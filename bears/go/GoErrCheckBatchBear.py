@@ -0,0 +1,12 @@
+from bears.go.GoErrCheckBear import GoErrCheckBear
+from bears.go.GoPackage import GoPackageBatch
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(GoErrCheckBear,
+                output_filename_regex=r'(?P<filename>.+?):\d+:')
+class GoErrCheckBatchBear(GoPackageBatch):
+    """
+    Checks Go code for function calls with unchecked errors using
+    ``errcheck``, running it once per package instead of once per file.
+    """
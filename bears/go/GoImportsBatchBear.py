@@ -0,0 +1,14 @@
+from bears.go.GoImportsBear import GoImportsBear
+from bears.go.GoPackage import GoListedFilesBatch
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(GoImportsBear,
+                output_filename_regex=r'(?P<filename>.+?)(?::\d+:\d+: .*)?$')
+class GoImportsBatchBear(GoListedFilesBatch):
+    """
+    Adds and removes imports of Go code using ``goimports``. All files are
+    checked with a single ``goimports -l`` invocation and only the files it
+    lists are run through ``goimports`` on their own to get the
+    corrections.
+    """
@@ -0,0 +1,12 @@
+from bears.go.GoLintBear import GoLintBear
+from bears.go.GoPackage import GoPackageBatch
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(GoLintBear,
+                output_filename_regex=r'(?P<filename>.+?):\d+:')
+class GoLintBatchBear(GoPackageBatch):
+    """
+    Checks Go code using ``golint``, running it once per package instead of
+    once per file.
+    """
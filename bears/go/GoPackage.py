@@ -0,0 +1,87 @@
+import os
+import re
+
+from coalib.misc.Shell import run_shell_command
+from coalib.settings.FunctionMetadata import FunctionMetadata
+
+from bears.utils.BatchedLinter import chunk_filenames
+
+
+PACKAGE_CLAUSE_REGEX = re.compile(r'package\s+(\w+)')
+
+
+def get_package_key(filename, file):
+    """
+    Returns the directory and the package name of the given Go file, which
+    together identify the package the file belongs to.
+
+    >>> get_package_key('/src/main.go', ['// Main\\n', 'package main\\n'])
+    ('/src', 'main')
+    >>> get_package_key('/src/empty.go', [])
+    ('/src', None)
+
+    :param filename: The name of the Go file.
+    :param file:     The lines of the Go file.
+    :return:         A tuple of the directory and the package name, which is
+                     ``None`` if the file has no package clause.
+    """
+    for line in file:
+        match = PACKAGE_CLAUSE_REGEX.match(line)
+        if match:
+            return os.path.dirname(filename), match.group(1)
+
+    return os.path.dirname(filename), None
+
+
+class GoPackageBatch:
+    """
+    Base class for batched Go bears checking all files of a package in one
+    invocation, as Go tools only accept files of a single package.
+    """
+
+    @staticmethod
+    def get_batch_key(filename, file):
+        return get_package_key(filename, file)
+
+
+class GoListedFilesBatch:
+    """
+    Base class for batched versions of Go bears correcting a file read from
+    stdin, like ``GofmtBear``.
+
+    All files are passed to the tool at once with ``-l``, making it list the
+    files it would change or cannot parse. Only those files are then run
+    through the wrapped bear to get the corrections.
+    """
+
+    def run(self, **kwargs):
+        filenames = sorted(self.file_dict)
+        if not filenames:
+            return
+
+        create_arguments_kwargs = FunctionMetadata.filter_parameters(
+            self.linter._get_create_arguments_metadata(), kwargs)
+        args = tuple(self.linter.create_arguments(
+            filenames[0], self.file_dict[filenames[0]], None,
+            **create_arguments_kwargs))
+        prefix = (self.linter.get_executable(),) + args + ('-l',)
+        fixed_length = sum(len(str(arg)) + 1 for arg in prefix)
+
+        listed = set()
+        for chunk in chunk_filenames(filenames, fixed_length,
+                                     self.max_arguments_length):
+            arguments = prefix + tuple(chunk)
+            self.debug("Running '{}'".format(' '.join(arguments)))
+            for output in run_shell_command(arguments,
+                                            cwd=self.get_config_dir()):
+                listed.update(
+                    filename
+                    for filename, lines in self.split_output(
+                        output, chunk).items()
+                    if lines)
+
+        for filename in filenames:
+            if filename in listed:
+                yield from self.linter.run(filename,
+                                           self.file_dict[filename],
+                                           **kwargs) or ()
@@ -0,0 +1,14 @@
+from bears.go.GoPackage import GoListedFilesBatch
+from bears.go.GoReturnsBear import GoReturnsBear
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(GoReturnsBear,
+                output_filename_regex=r'(?P<filename>.+?)(?::\d+:\d+: .*)?$')
+class GoReturnsBatchBear(GoListedFilesBatch):
+    """
+    Proposes corrections of Go code using ``goreturns``. All files are
+    checked with a single ``goreturns -l`` invocation and only the files it
+    lists are run through ``goreturns`` on their own to get the
+    corrections.
+    """
@@ -0,0 +1,16 @@
+from bears.go.GoPackage import GoPackageBatch
+from bears.go.GoTypeBear import GoTypeBear
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(GoTypeBear,
+                output_filename_regex=r'(?P<filename>.+?):\d+:',
+                use_stdout=False,
+                use_stderr=True)
+class GoTypeBatchBear(GoPackageBatch):
+    """
+    Checks Go code using ``gotype``, running it once per package instead of
+    once per file. As all files of a package are type-checked together,
+    identifiers declared in other files of the package are not reported as
+    undeclared.
+    """
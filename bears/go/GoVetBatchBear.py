@@ -0,0 +1,14 @@
+from bears.go.GoPackage import GoPackageBatch
+from bears.go.GoVetBear import GoVetBear
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(GoVetBear,
+                output_filename_regex=r'(?P<filename>.+?):\d+:',
+                use_stdout=False,
+                use_stderr=True)
+class GoVetBatchBear(GoPackageBatch):
+    """
+    Analyzes Go code for suspicious constructs using ``go vet``, running it
+    once per package instead of once per file.
+    """
@@ -0,0 +1,13 @@
+from bears.go.GoPackage import GoListedFilesBatch
+from bears.go.GofmtBear import GofmtBear
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(GofmtBear,
+                output_filename_regex=r'(?P<filename>.+?)(?::\d+:\d+: .*)?$')
+class GofmtBatchBear(GoListedFilesBatch):
+    """
+    Suggests better formatting of Go code using ``gofmt``. All files are
+    checked with a single ``gofmt -l`` invocation and only the files it
+    lists are run through ``gofmt`` on their own to get the corrections.
+    """
@@ -1,7 +1,10 @@
 from coalib.bearlib.abstractions.Linter import linter
 from dependency_management.requirements.GoRequirement import GoRequirement
 
+from bears.utils.LinterResultCache import cached_linter
 
+
+@cached_linter
 @linter(executable='gofmt',
         use_stdin=True,
         output_format='corrected',
@@ -5,7 +5,10 @@ from coalib.bearlib.abstractions.Linter import linter
 from dependency_management.requirements.PipRequirement import PipRequirement
 from coalib.settings.Setting import typed_list
 
+from bears.utils.LinterResultCache import cached_linter
 
+
+@cached_linter
 @linter(executable=sys.executable,
         output_format='regex',
         output_regex=r'(?P<line>\d+):(?P<column>\d+): '
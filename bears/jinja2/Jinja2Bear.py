@@ -1,9 +1,61 @@
+from bisect import bisect_right
+from itertools import groupby
 import re
 
 from coalib.bears.LocalBear import LocalBear
 from coalib.results.Result import Result, RESULT_SEVERITY
 from coalib.results.Diff import Diff
 
+from bears.general.AnnotationRanges import get_line_starts
+
+# Every Jinja2 tag starts with ``{{`` or ``{%``.
+TAG_OPENING_REGEX = re.compile(r'{(?=[{%])')
+
+
+def iter_tags(file, tag_regexes):
+    """
+    Tokenizes a template in a single pass, yielding the tags of every kind in
+    the order they start at. A tag is matched within its line, and the tags
+    of one kind do not overlap, like the matches of ``re.finditer`` over
+    every line.
+
+    >>> tags = iter_tags(['{{ x }}{% if y %}\\n', 'z\\n', '{% endif %}'],
+    ...                  (('variable', re.compile('{{.*?}}')),
+    ...                   ('control', re.compile('{%.*?%}'))))
+    >>> [(kind, line_number, match.group())
+    ...  for kind, line_number, match in tags]
+    [('variable', 1, '{{ x }}'), ('control', 1, '{% if y %}'), \
+('control', 3, '{% endif %}')]
+
+    :param file:        The lines of the template.
+    :param tag_regexes: A sequence of tuples of the kinds of tags and the
+                        compiled regexes matching them, which have to match
+                        at a ``{{`` or ``{%``.
+    :return:            A generator of tuples of the kind, the line number
+                        and the match object of every tag, with the match
+                        object being relative to the line.
+    """
+    text = ''.join(file)
+    line_starts = get_line_starts(file)
+    line_number = 0
+
+    for opening in TAG_OPENING_REGEX.finditer(text):
+        position = opening.start()
+        if position >= line_starts[line_number]:
+            line_number = bisect_right(line_starts, position)
+            line = file[line_number - 1]
+            line_start = line_starts[line_number - 1]
+            # The column at which the next tag of every kind may start.
+            next_columns = [0] * len(tag_regexes)
+
+        column = position - line_start
+        for index, (kind, regex) in enumerate(tag_regexes):
+            if column >= next_columns[index]:
+                match = regex.match(line, column)
+                if match:
+                    next_columns[index] = match.end()
+                    yield kind, line_number, match
+
 
 def generate_spacing_diff(file, filename, line, line_number,
                           match_object, required_spacing):
@@ -150,7 +202,8 @@ class Jinja2Bear(LocalBear):
                                           filename,
                                           line,
                                           line_number,
-                                          variable_spacing):
+                                          variable_spacing,
+                                          matches=None):
         """
         Checks any variable in the given line for spacing issues.
         Yields a Result for each issue found.
@@ -165,8 +218,14 @@ class Jinja2Bear(LocalBear):
             The current line number.
         :param variable_spacing:
             The number of spaces required on each side of a variable tag.
+        :param matches:
+            The matches of the ``VARIABLE_REGEX`` in the line, if they were
+            already found.
         """
-        for m in self.VARIABLE_REGEX.finditer(line):
+        if matches is None:
+            matches = self.VARIABLE_REGEX.finditer(line)
+
+        for m in matches:
             match = m.group('content')
             if not has_required_spacing(match, variable_spacing):
                 diff = generate_spacing_diff(
@@ -189,7 +248,8 @@ class Jinja2Bear(LocalBear):
                                  filename,
                                  line,
                                  line_number,
-                                 control_spacing):
+                                 control_spacing,
+                                 matches=None):
         """
         Checks any control start tag in the given line for spacing issues
         and puts the expected label on the ``control_stack``
@@ -205,8 +265,14 @@ class Jinja2Bear(LocalBear):
             The current line number.
         :param control_spacing:
             The number of spaces required on each side of a control tag.
+        :param matches:
+            The matches of the ``CONTROL_START_REGEX`` in the line, if they
+            were already found.
         """
-        for m in self.CONTROL_START_REGEX.finditer(line):
+        if matches is None:
+            matches = self.CONTROL_START_REGEX.finditer(line)
+
+        for m in matches:
             # build the label which is expected at the end of this block
             end_label = '{{#{spacing}{content}{spacing}#}}'.format(
                 content=m.group('content').strip(),
@@ -223,7 +289,8 @@ class Jinja2Bear(LocalBear):
                                filename,
                                line,
                                line_number,
-                               control_spacing):
+                               control_spacing,
+                               matches=None):
         """
         Checks any control end tag in the given line for spacing issues,
         missing/wrong labels or missing corresponding opening tag.
@@ -239,8 +306,14 @@ class Jinja2Bear(LocalBear):
             The current line number.
         :param control_spacing:
             The number of spaces required on each side of a control tag.
+        :param matches:
+            The matches of the ``CONTROL_END_REGEX`` in the line, if they
+            were already found.
         """
-        for m in self.CONTROL_END_REGEX.finditer(line):
+        if matches is None:
+            matches = self.CONTROL_END_REGEX.finditer(line)
+
+        for m in matches:
             label = m.group('label')
             try:
                 expected_label, start_in_line = self.control_stack.pop()
@@ -355,16 +428,28 @@ class Jinja2Bear(LocalBear):
         # Whenever an end tag is encountered the last item added is popped.
         self.control_stack = []
 
-        for line_number, line in enumerate(file, start=1):
-
+        tag_regexes = (('variable', self.VARIABLE_REGEX),
+                       ('control_start', self.CONTROL_START_REGEX),
+                       ('control_end', self.CONTROL_END_REGEX))
+        for line_number, tags in groupby(iter_tags(file, tag_regexes),
+                                         lambda tag: tag[1]):
+            line = file[line_number - 1]
+            matches = {kind: [] for kind, _ in tag_regexes}
+            for kind, _, match in tags:
+                matches[kind].append(match)
+
+            # All start tags of a line are handled before its end tags.
             yield from self.check_for_variable_spacing_issues(
-                file, filename, line, line_number, variable_spacing)
+                file, filename, line, line_number, variable_spacing,
+                matches['variable'])
 
             yield from self.check_control_start_tags(
-                file, filename, line, line_number, control_spacing)
+                file, filename, line, line_number, control_spacing,
+                matches['control_start'])
 
             yield from self.check_control_end_tags(
-                file, filename, line, line_number, control_spacing)
+                file, filename, line, line_number, control_spacing,
+                matches['control_end'])
 
         # We've reached the end of the file.
         # Check if all control blocks have been closed
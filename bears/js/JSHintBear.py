@@ -5,6 +5,8 @@ from coalib.bearlib.abstractions.Linter import linter
 from dependency_management.requirements.NpmRequirement import NpmRequirement
 from coala_utils.param_conversion import negate
 
+from bears.utils.MemoizedConfig import memoized_config
+
 
 def bool_or_str(value):
     try:
@@ -20,6 +22,7 @@ def bool_or_int(value):
         return int(value)
 
 
+@memoized_config
 @linter(executable='jshint',
         output_format='regex',
         output_regex=r'.+?: line (?P<line>\d+), col (?P<column>\d+), '
@@ -1,5 +1,6 @@
 import json
 from collections import OrderedDict
+from itertools import islice, zip_longest
 from re import match
 
 from coala_utils.param_conversion import negate
@@ -11,6 +12,66 @@ from coalib.results.Diff import Diff
 from coalib.results.Result import Result
 
 
+def get_formatted_lines(json_content, json_sort, indent_size, escape_unicode):
+    """
+    Pretty-prints JSON content line by line, as the encoder emits it, so the
+    whole output never needs to be held in memory.
+
+    >>> list(get_formatted_lines({'a': [1]}, False, 2, True))
+    ['{\\n', '  "a": [\\n', '    1\\n', '  ]\\n', '}\\n']
+
+    :param json_content:   The parsed JSON content.
+    :param json_sort:      Whether or not keys should be sorted.
+    :param indent_size:    Number of spaces per indentation level.
+    :param escape_unicode: Whether or not to escape unicode values using
+                           ASCII.
+    :return:               A generator of the lines, all ending with a
+                           newline.
+    """
+    encoder = json.JSONEncoder(sort_keys=json_sort,
+                               indent=indent_size,
+                               ensure_ascii=escape_unicode)
+    chunks = encoder.iterencode(json_content)
+    pending = ''
+    while True:
+        # Splitting every chunk on its own would take longer than encoding.
+        batch = list(islice(chunks, 4096))
+        if not batch:
+            break
+
+        lines = (pending + ''.join(batch)).splitlines(True)
+        # The last line may be continued by the next chunks.
+        pending = lines.pop() if lines else ''
+        # Because of a bug in several python versions we have to correct
+        # whitespace here.
+        for line in lines:
+            yield line.rstrip(' \n') + '\n'
+
+    for line in pending.splitlines(True):
+        yield line.rstrip(' \n') + '\n'
+
+
+def get_first_deviation(file, formatted_lines):
+    """
+    Compares a file with its pretty-printed lines, stopping at the first
+    line that differs.
+
+    >>> get_first_deviation(['{\\n', '}\\n'], iter(['{\\n', '}\\n']))
+    >>> get_first_deviation(['{\\n', '  }'], iter(['{\\n', '}\\n']))
+    2
+
+    :param file:            The lines of the file.
+    :param formatted_lines: An iterable of the pretty-printed lines.
+    :return:                The number of the first line that differs, or
+                            ``None`` if the file is pretty-printed.
+    """
+    for line_number, (line, formatted_line) in enumerate(
+            zip_longest(file, formatted_lines), start=1):
+        if line != formatted_line:
+            return min(line_number, len(file))
+    return None
+
+
 class JSONFormatBear(LocalBear):
 
     LANGUAGES = {'JSON'}
@@ -25,7 +86,8 @@ class JSONFormatBear(LocalBear):
     def run(self, filename, file,
             json_sort: bool=False,
             indent_size: int=SpacingHelper.DEFAULT_TAB_WIDTH,
-            escape_unicode: bool=True):
+            escape_unicode: bool=True,
+            max_diff_lines: int=5000):
         """
         Raises issues for any deviations from the pretty-printed JSON.
 
@@ -33,6 +95,13 @@ class JSONFormatBear(LocalBear):
         :param indent_size:    Number of spaces per indentation level.
         :param escape_unicode: Whether or not to escape unicode values using
                                ASCII.
+        :param max_diff_lines: The maximum number of lines of files to
+                               suggest a reformatting for. For longer files
+                               only the first line deviating from the
+                               pretty-printed JSON is reported, as diffing
+                               them takes long. ``0`` diffs files of any
+                               length, which can take minutes for files of
+                               a few hundred thousand lines.
         """
         # Output a meaningful message if empty file given as input
         if len(file) == 0:
@@ -55,14 +124,25 @@ class JSONFormatBear(LocalBear):
                 column=int(err_content.group(3)))
             return
 
-        corrected = json.dumps(json_content,
-                               sort_keys=json_sort,
-                               indent=indent_size,
-                               ensure_ascii=escape_unicode
-                               ).splitlines(True)
-        # Because of a bug in several python versions we have to correct
-        # whitespace here.
-        corrected = tuple(line.rstrip(' \n') + '\n' for line in corrected)
+        # Most files are pretty-printed already, which is checked without
+        # holding the whole output in memory or diffing it.
+        first_deviation = get_first_deviation(
+            file, get_formatted_lines(json_content, json_sort, indent_size,
+                                      escape_unicode))
+        if first_deviation is None:
+            return
+
+        if max_diff_lines and len(file) > max_diff_lines:
+            yield Result.from_values(
+                self,
+                'This file can be reformatted by sorting keys and '
+                'following indentation.',
+                file=filename,
+                line=first_deviation)
+            return
+
+        corrected = tuple(get_formatted_lines(json_content, json_sort,
+                                              indent_size, escape_unicode))
         diff = Diff.from_string_arrays(file, corrected)
 
         if len(diff) > 0:
@@ -4,7 +4,11 @@ from dependency_management.requirements.JuliaRequirement import (
     JuliaRequirement)
 from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
 
+from bears.utils.InterpreterSession import (
+    interpreter_session, JULIA_SESSION_LOOP)
 
+
+@interpreter_session('-e', 'import Lint.lintfile; ' + JULIA_SESSION_LOOP)
 @linter(executable='julia',
         output_format='regex',
         output_regex=r'.+:(?P<line>\d+) (?P<severity>.)\d+ (?P<message>.*)',
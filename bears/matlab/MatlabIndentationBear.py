@@ -6,6 +6,23 @@ from coalib.results.Diff import Diff
 from coalib.results.Result import Result
 from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
 
+# Classifies a line by the control keyword it starts with, if any.
+LINE_REGEX = re.compile(
+    r'\s*(?:'
+    r'(?P<start>function|if|while|for|switch)|'
+    r'(?P<continuation>elseif|else|case|catch|otherwise)|'
+    r'(?P<end>end|endfunction|endif|endwhile|endfor|endswitch))?')
+
+# Maps the kinds of lines to functions computing the indentation of the line
+# and of the next line from the indentation of the line and the indentation
+# of the next line so far.
+INDENT_TABLE = {
+    'start': lambda indent, nextindent: (indent, nextindent + 1),
+    'continuation': lambda indent, nextindent: (indent - 1, nextindent),
+    'end': lambda indent, nextindent: (indent - 1, nextindent - 1),
+    None: lambda indent, nextindent: (indent, indent),
+}
+
 
 class MatlabIndentationBear(LocalBear):
     LANGUAGES = {'Matlab', 'Octave'}
@@ -23,42 +40,85 @@ class MatlabIndentationBear(LocalBear):
 
         :param indent_size: Number of spaces per indentation level.
         """
-        new_file = tuple(self.reindent(file, indent_size))
-
-        if new_file != tuple(file):
-            wholediff = Diff.from_string_arrays(file, new_file)
-            for diff in wholediff.split_diff():
-                yield Result(
-                    self,
-                    'The indentation could be changed to improve readability.',
-                    severity=RESULT_SEVERITY.INFO,
-                    affected_code=(diff.range(filename),),
-                    diffs={filename: diff})
+        changes = self.get_changed_lines(file, indent_size)
+        if not changes:
+            return
+
+        # Every line keeps its place, so the changes need not be diffed.
+        wholediff = Diff(file)
+        for line_nr, replacement in changes:
+            wholediff.modify_line(line_nr, replacement)
+
+        for diff in wholediff.split_diff():
+            yield Result(
+                self,
+                'The indentation could be changed to improve readability.',
+                severity=RESULT_SEVERITY.INFO,
+                affected_code=(diff.range(filename),),
+                diffs={filename: diff})
+
+    @staticmethod
+    def get_changed_lines(file, indentation):
+        """
+        Reindents a file, skipping the lines that are indented right.
+
+        >>> MatlabIndentationBear.get_changed_lines(
+        ...     ['if a\\n', 'b\\n', '  end\\n'], 2)
+        [(2, '  b\\n'), (3, 'end\\n')]
+
+        :param file:        The lines of the file.
+        :param indentation: Number of spaces per indentation level.
+        :return:            A list of tuples of the number and the reindented
+                            contents of every line that changes.
+        """
+        return [(line_nr, new_line)
+                for line_nr, (line, new_line) in enumerate(
+                    zip(file, MatlabIndentationBear.reindent(file,
+                                                             indentation)),
+                    start=1)
+                if new_line is not line]
+
+    @staticmethod
+    def get_changed_lines_of_files(file_dict, indentation):
+        """
+        Reindents many files at once, e.g. all files of an Octave project.
+
+        >>> MatlabIndentationBear.get_changed_lines_of_files(
+        ...     {'a.m': ['if a\\n', '  b\\n', 'end\\n'],
+        ...      'b.m': ['for i\\n', 'b\\n', 'end\\n']}, 2)
+        {'b.m': [(2, '  b\\n')]}
+
+        :param file_dict:   A dict mapping filenames to the lines of the
+                            files.
+        :param indentation: Number of spaces per indentation level.
+        :return:            A dict mapping the names of the files that change
+                            to what ``get_changed_lines`` returns for them.
+        """
+        changes = {}
+        for filename, file in file_dict.items():
+            file_changes = MatlabIndentationBear.get_changed_lines(
+                file, indentation)
+            if file_changes:
+                changes[filename] = file_changes
+        return changes
 
     @staticmethod
     def reindent(file, indentation):
         indent, nextindent = 0, 0
-        for line_nr, line in enumerate(file, start=1):
+        for line in file:
             indent = nextindent
             indent, nextindent = MatlabIndentationBear.get_indent(line,
                                                                   indent,
                                                                   nextindent)
             stripped = line.lstrip()
-            if stripped:
-                yield indent*indentation*' ' + stripped
+            new_line = indent*indentation*' ' + stripped
+            # Yield unchanged lines as they are, so they are easy to skip.
+            if stripped and new_line != line:
+                yield new_line
             else:
                 yield line
 
     @staticmethod
     def get_indent(line, indent, nextindent):
-        ctrlstart = r'\s*(function|if|while|for|switch)'
-        ctrlcont = r'\s*(elseif|else|case|catch|otherwise)'
-        ctrlend = r'\s*(end|endfunction|endif|endwhile|endfor|endswitch)'
-        if re.match(ctrlstart, line) is not None:
-            return indent, nextindent+1
-        elif re.match(ctrlcont, line) is not None:
-            return indent-1, nextindent
-        elif re.match(ctrlend, line) is not None:
-            return indent-1, nextindent-1
-        else:
-            return indent, indent
+        return INDENT_TABLE[LINE_REGEX.match(line).lastgroup](indent,
+                                                              nextindent)
@@ -0,0 +1,12 @@
+from bears.natural_language.ProseLintBear import ProseLintBear
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(ProseLintBear,
+                output_filename_regex=r'(?P<filename>.+?):\d+:\d+: ')
+class ProseLintBatchBear:
+    """
+    Lints the files using `proselint <https://github.com/amperser/proselint>`__
+    once for many files instead of once per file.
+    Works only with English language text.
+    """
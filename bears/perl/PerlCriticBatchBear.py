@@ -0,0 +1,14 @@
+from bears.perl.PerlCriticBear import PerlCriticBear
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(PerlCriticBear,
+                output_filename_regex=r'(?P<filename>.+?): '
+                                      r'(?=.+ at line \d+, column \d+\.)',
+                strip_filename=True)
+class PerlCriticBatchBear:
+    """
+    Check the code with perlcritic, running it once for many files instead of
+    once per file. ``perlcritic`` prefixes each issue with the filename in
+    that case, which is stripped again before processing.
+    """
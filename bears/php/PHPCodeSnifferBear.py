@@ -7,7 +7,10 @@ from dependency_management.requirements.AnyOneOfRequirements import (
 from dependency_management.requirements.ComposerRequirement import (
     ComposerRequirement)
 
+from bears.utils.MemoizedConfig import memoized_config
 
+
+@memoized_config
 @linter(executable='phpcs',
         output_format='regex',
         config_suffix='.xml',
@@ -3,7 +3,10 @@ from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
 from dependency_management.requirements.DistributionRequirement import (
     DistributionRequirement)
 
+from bears.utils.LinterResultCache import cached_linter
 
+
+@cached_linter
 @linter(executable='php',
         output_format='regex',
         output_regex=r'(?P<severity>Parse|Fatal) error: (?P<message>.*) in '
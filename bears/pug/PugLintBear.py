@@ -5,7 +5,10 @@ from coalib.settings.Setting import typed_list
 
 from dependency_management.requirements.NpmRequirement import NpmRequirement
 
+from bears.utils.MemoizedConfig import memoized_config
 
+
+@memoized_config
 @linter(executable='pug-lint',
         output_format='regex',
         output_regex=r'(?P<line>\d+):?(?P<column>\d+)? (?P<message>.+)',
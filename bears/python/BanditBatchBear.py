@@ -0,0 +1,24 @@
+from collections import OrderedDict
+import json
+
+from bears.python.BanditBear import BanditBear
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(BanditBear)
+class BanditBatchBear:
+    """
+    Performs security analysis on Python source code, running ``bandit`` once
+    for many files instead of once per file.
+    """
+
+    def split_output(self, output, filenames):
+        outputs = OrderedDict((filename, {'errors': [], 'results': []})
+                              for filename in filenames)
+        output = json.loads(output)
+        for kind in ('errors', 'results'):
+            for entry in output[kind]:
+                outputs[entry['filename']][kind].append(entry)
+
+        return {filename: json.dumps(file_output)
+                for filename, file_output in outputs.items()}
@@ -6,7 +6,10 @@ from coalib.results.Result import Result
 from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
 from coalib.settings.Setting import typed_list
 
+from bears.utils.LinterResultCache import cached_linter
 
+
+@cached_linter
 @linter(executable='bandit')
 class BanditBear:
     """
@@ -8,6 +8,8 @@ from coalib.results.Diff import Diff
 from coalib.results.Result import Result
 from coalib.settings.Setting import typed_list
 
+from bears.python.SourceCache import get_python_source
+
 
 class PEP8Bear(LocalBear):
     LANGUAGES = {'Python', 'Python 2', 'Python 3'}
@@ -41,7 +43,7 @@ class PEP8Bear(LocalBear):
                    'max_line_length': max_line_length,
                    'indent_size': indent_size}
 
-        corrected = autopep8.fix_code(''.join(file),
+        corrected = autopep8.fix_code(get_python_source(file).text,
                                       apply_config=local_pep8_config,
                                       options=options).splitlines(True)
 
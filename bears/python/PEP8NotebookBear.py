@@ -1,3 +1,8 @@
+from collections import OrderedDict
+import difflib
+import hashlib
+import itertools
+
 import autopep8
 import nbformat
 
@@ -17,6 +22,10 @@ from coalib.settings.Setting import typed_list
 # dictionaries, but allow attribute access. The structure of these objects
 # matches the notebook format specification.
 
+# Maps hashes of code cells and autopep8 options to the fixed code cells.
+_fixed_cells = OrderedDict()
+MAX_FIXED_CELLS = 4096
+
 
 def notebook_node_from_string_list(string_list):
     """
@@ -62,6 +71,115 @@ def autopep8_fix_code_cell(source, options=None, apply_config=None):
     return source_corrected
 
 
+def cached_autopep8_fix_code_cell(source, options=None, apply_config=None):
+    """
+    Applies ``autopep8_fix_code_cell`` unless the same cell was already fixed
+    with the same options, in which case the previous result is returned.
+    """
+    key = hashlib.sha1(repr((source, options, apply_config)).encode()
+                       ).hexdigest()
+    source_corrected = _fixed_cells.get(key)
+    if source_corrected is None:
+        source_corrected = autopep8_fix_code_cell(source, options,
+                                                  apply_config)
+        if len(_fixed_cells) >= MAX_FIXED_CELLS:
+            _fixed_cells.popitem(last=False)
+    else:
+        _fixed_cells.move_to_end(key)
+    _fixed_cells[key] = source_corrected
+    return source_corrected
+
+
+def get_source_ranges(string_list):
+    """
+    Finds the lines holding the sources of the cells in a notebook written
+    by ``nbformat``.
+
+    >>> get_source_ranges(['{\\n', ' "cells": [\\n', '  {\\n',
+    ...                    '   "source": [\\n', '    "a\\\\n",\\n',
+    ...                    '    "b"\\n', '   ]\\n', '  },\\n', '  {\\n',
+    ...                    '   "source": []\\n', '  }\\n'])
+    [(3, 7), (9, 10)]
+
+    :param string_list: The notebook file contents as list of strings
+                        (linewise).
+    :return:            A list of the start and end indices of the lines of
+                        the sources of all cells.
+    """
+    ranges = []
+    start = None
+    for index, line in enumerate(string_list):
+        if start is not None:
+            if line.rstrip().rstrip(',') == '   ]':
+                ranges.append((start, index + 1))
+                start = None
+        elif line.startswith('   "source": '):
+            if line.rstrip().endswith('['):
+                start = index
+            else:
+                ranges.append((index, index + 1))
+    return ranges
+
+
+def add_changes(diff, offset, old_lines, new_lines):
+    """
+    Adds the changes turning ``old_lines`` into ``new_lines`` to a diff.
+
+    :param diff:      The diff of the whole file.
+    :param offset:    The number of lines in the file before ``old_lines``.
+    :param old_lines: The original lines.
+    :param new_lines: The lines to replace them with.
+    """
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+    for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+        if tag in ('replace', 'delete'):
+            for line_nr in range(offset + old_start + 1,
+                                 offset + old_end + 1):
+                diff.delete_line(line_nr)
+        if tag in ('replace', 'insert'):
+            diff.add_lines(offset + old_start, new_lines[new_start:new_end])
+
+
+def get_cells_diff(file, corrected, changed_cells):
+    """
+    Creates a diff changing only the sources of the given cells, which avoids
+    comparing the whole notebook. This is only possible if the notebook was
+    written by ``nbformat`` before, i.e. everything apart from the sources
+    is the same in both files.
+
+    :param file:          The original notebook as list of strings.
+    :param corrected:     The corrected notebook as list of strings.
+    :param changed_cells: The indices of the changed cells.
+    :return:              The diff or ``None`` if the notebook was not
+                          written by ``nbformat`` before.
+    """
+    ranges = get_source_ranges(file)
+    corrected_ranges = get_source_ranges(corrected)
+    if len(ranges) != len(corrected_ranges):
+        return None
+
+    def other_lines(string_list, source_ranges):
+        end = 0
+        for source_start, source_end in source_ranges:
+            yield from string_list[end:source_start]
+            end = source_end
+        yield from string_list[end:]
+
+    if any(line != corrected_line
+           for line, corrected_line in itertools.zip_longest(
+               other_lines(file, ranges),
+               other_lines(corrected, corrected_ranges))):
+        return None
+
+    diff = Diff(file)
+    for index in changed_cells:
+        start, end = ranges[index]
+        corrected_start, corrected_end = corrected_ranges[index]
+        add_changes(diff, start, file[start:end],
+                    corrected[corrected_start:corrected_end])
+    return diff
+
+
 class PEP8NotebookBear(LocalBear):
     LANGUAGES = {'Python', 'Python 2', 'Python 3'}
     REQUIREMENTS = {PipRequirement('autopep8', '1.2'),
@@ -97,12 +215,19 @@ class PEP8NotebookBear(LocalBear):
         notebook_node = notebook_node_from_string_list(file)
         cells = notebook_node['cells']
 
-        for cell in cells:
+        changed_cells = []
+        for index, cell in enumerate(cells):
             if cell['cell_type'] != 'code':
                 continue
-            cell['source'] = autopep8_fix_code_cell(cell['source'],
-                                                    local_pep8_config,
-                                                    options)
+            source = cell['source']
+            cell['source'] = cached_autopep8_fix_code_cell(source,
+                                                           local_pep8_config,
+                                                           options)
+            if cell['source'] != source:
+                changed_cells.append(index)
+
+        if not changed_cells:
+            return
 
         corrected = notebook_node_to_string_list(notebook_node)
 
@@ -112,7 +237,10 @@ class PEP8NotebookBear(LocalBear):
         if file[-1].endswith('\n') and not corrected[-1].endswith('\n'):
             corrected[-1] += '\n'
 
-        diffs = Diff.from_string_arrays(file, corrected).split_diff()
+        diff = get_cells_diff(list(file), corrected, changed_cells)
+        if diff is None:
+            diff = Diff.from_string_arrays(file, corrected)
+        diffs = diff.split_diff()
 
         for diff in diffs:
             yield Result(self,
@@ -5,6 +5,8 @@ from dependency_management.requirements.PipRequirement import PipRequirement
 from coalib.results.Diff import Diff
 from coalib.results.Result import Result
 
+from bears.python.SourceCache import get_python_source
+
 
 class PyCommentedCodeBear(LocalBear):
     LANGUAGES = {'Python', 'Python 2', 'Python 3'}
@@ -18,7 +20,8 @@ class PyCommentedCodeBear(LocalBear):
         """
         Detects commented out source code in Python.
         """
-        corrected = tuple(eradicate.filter_commented_out_code(''.join(file)))
+        corrected = tuple(eradicate.filter_commented_out_code(
+            get_python_source(file).text))
 
         for diff in Diff.from_string_arrays(file, corrected).split_diff():
             yield Result(self,
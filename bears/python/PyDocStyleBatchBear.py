@@ -0,0 +1,12 @@
+from bears.python.PyDocStyleBear import PyDocStyleBear
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(PyDocStyleBear,
+                output_filename_regex=r'(?P<filename>.+?):\d+ ',
+                use_stderr=True)
+class PyDocStyleBatchBear:
+    """
+    Checks python docstrings, running ``pydocstyle`` once for many files
+    instead of once per file.
+    """
@@ -1,8 +1,80 @@
+import logging
+from tokenize import TokenError
+
 from coalib.bearlib.abstractions.Linter import linter
 from dependency_management.requirements.PipRequirement import PipRequirement
 from coalib.settings.Setting import typed_list
+from pydocstyle.checker import ConventionChecker
+from pydocstyle.cli import setup_stream_handlers
+from pydocstyle.config import ConfigurationParser, IllegalConfiguration
+from pydocstyle.parser import AllError, ParseError
+from pydocstyle.utils import log
+from pydocstyle.violations import Error
+
+from bears.python.SourceCache import get_python_source
+from bears.utils.InProcessLinter import (
+    captured_output, in_process_linter, log_exit)
+
+
+def run_pydocstyle(arguments, filename, file):
+    """
+    Checks the given file with ``pydocstyle`` like its executable does,
+    taking the source from ``file`` instead of reading the file.
+
+    :return: A tuple of the output on stdout and stderr.
+    """
+    argv = ('pydocstyle',) + tuple(arguments)
+    exit_error = None
+    # The state pydocstyle changes globally, restored after the run.
+    level, handlers, propagate = log.level, list(log.handlers), log.propagate
+    explain, source = Error.explain, Error.source
+    with captured_output(argv) as (stdout, stderr):
+        log.setLevel(logging.DEBUG)
+        log.propagate = False
+        # pydocstyle amends its default convention in place when given
+        # ``--add-ignore`` or ``--add-select``, which must not leak into
+        # later runs.
+        configuration = type(
+            'ConfigurationParser', (ConfigurationParser,),
+            {'DEFAULT_CONVENTION':
+             set(ConfigurationParser.DEFAULT_CONVENTION)})()
+        try:
+            setup_stream_handlers(
+                configuration.get_default_run_configuration())
+            configuration.parse()
+            run_configuration = configuration.get_user_run_configuration()
+            setup_stream_handlers(run_configuration)
+            Error.explain = run_configuration.explain
+            Error.source = run_configuration.source
+
+            for name, checked_codes, ignore_decorators in (
+                    configuration.get_files_to_check()):
+                try:
+                    for error in ConventionChecker().check_source(
+                            get_python_source(file).text, name,
+                            ignore_decorators):
+                        if getattr(error, 'code', None) in checked_codes:
+                            stdout.write('%s\n' % error)
+                except (AllError, ParseError) as error:
+                    log.warning('Error in file %s: %s', name, error)
+                except TokenError:
+                    pass
+        except IllegalConfiguration as error:
+            if error.args:
+                log.error(error.args[0])
+        except SystemExit as error:
+            exit_error = error
+        finally:
+            log.setLevel(level)
+            log.handlers, log.propagate = handlers, propagate
+            Error.explain, Error.source = explain, source
+
+    if exit_error is not None:
+        log_exit('pydocstyle', exit_error, stderr.getvalue())
+    return stdout.getvalue(), stderr.getvalue()
 
 
+@in_process_linter(run_pydocstyle)
 @linter(executable='pydocstyle',
         use_stdout=True,
         use_stderr=True,
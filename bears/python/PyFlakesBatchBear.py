@@ -0,0 +1,14 @@
+from bears.python.PyFlakesBear import PyFlakesBear
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(PyFlakesBear,
+                output_filename_regex=r'(?P<filename>.+?):\d+:',
+                use_stderr=True)
+class PyFlakesBatchBear:
+    """
+    Checks Python files for errors using ``pyflakes``, running it once for
+    many files instead of once per file.
+
+    See https://github.com/PyCQA/pyflakes for more info.
+    """
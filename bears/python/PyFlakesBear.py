@@ -1,8 +1,30 @@
+import io
+
 from coalib.bearlib.abstractions.Linter import linter
 from dependency_management.requirements.PipRequirement import PipRequirement
 from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
+import pyflakes.api
+from pyflakes.reporter import Reporter
+
+from bears.python.SourceCache import get_python_source
+from bears.utils.InProcessLinter import in_process_linter
+from bears.utils.LinterResultCache import cached_linter
+
+
+def run_pyflakes(arguments, filename, file):
+    """
+    Checks the given file with ``pyflakes`` like its executable does.
+
+    :return: A tuple of the output on stdout and stderr.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    pyflakes.api.check(get_python_source(file).text, filename,
+                       Reporter(stdout, stderr))
+    return stdout.getvalue(), stderr.getvalue()
 
 
+@cached_linter
+@in_process_linter(run_pyflakes)
 @linter(executable='pyflakes',
         use_stderr=True,
         output_format='regex',
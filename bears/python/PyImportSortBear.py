@@ -1,3 +1,8 @@
+from collections import OrderedDict
+import hashlib
+import re
+import tokenize
+
 from isort import SortImports
 
 from coalib.bearlib import deprecate_settings
@@ -8,6 +13,15 @@ from coalib.results.Diff import Diff
 from coalib.results.Result import Result
 from coalib.settings.Setting import typed_list
 
+from bears.python.SourceCache import get_python_source
+
+
+# Maps fingerprints of import blocks and isort settings to the sorted blocks.
+_sorted_blocks = OrderedDict()
+MAX_SORTED_BLOCKS = 1024
+
+IMPORT_LINE_REGEX = re.compile(r'(import|from)\s')
+
 
 class PyImportSortBear(LocalBear):
 
@@ -45,6 +59,101 @@ class PyImportSortBear(LocalBear):
             tmp = []
         return import_stmts
 
+    @staticmethod
+    def _find_import_block(file):
+        """
+        Finds the imports at the top of a file. The file is only tokenized
+        up to the end of the imports, so strings and comments looking like
+        imports are not taken into account there. The rest of the file is
+        only searched for lines starting like imports.
+
+        >>> PyImportSortBear._find_import_block(
+        ...     ['# Comment\\n', 'import os\\n', '\\n', 'x = 1\\n'])
+        (2, 4)
+
+        :param file: The lines of the file.
+        :return:     A tuple of the first line of the imports and the first
+                     line of the statement following them or the last line
+                     of the file, ``(0, 0)`` if the file has no imports or
+                     ``None`` if the imports cannot be sorted on their own,
+                     e.g. as the file cannot be tokenized or imports may
+                     follow other statements.
+        """
+        if not any(map(IMPORT_LINE_REGEX.match, file)):
+            return 0, 0
+
+        start = end = None
+        indent = 0
+        new_statement = True
+        try:
+            for token in tokenize.generate_tokens(iter(file).__next__):
+                if token.type == tokenize.INDENT:
+                    indent += 1
+                elif token.type == tokenize.DEDENT:
+                    indent -= 1
+                elif token.type == tokenize.NEWLINE:
+                    new_statement = True
+                elif (token.type not in (tokenize.NL, tokenize.COMMENT,
+                                         tokenize.ENDMARKER) and
+                        new_statement):
+                    new_statement = False
+                    is_import = (indent == 0 and
+                                 token.string in ('import', 'from'))
+                    if is_import and start is None:
+                        start = token.start[0]
+                    elif not is_import and start is not None:
+                        end = token.start[0]
+                        break
+        except (SyntaxError, tokenize.TokenError):
+            return None
+
+        if start is None:
+            return 0, 0
+        if end is None:
+            return start, len(file)
+        if any(map(IMPORT_LINE_REGEX.match, file[end:])):
+            return None
+        return start, end
+
+    def _sort_import_block(self):
+        """
+        Sorts only the imports at the top of the file.
+
+        :return: The sorted file or ``None`` if the whole file has to be
+                 sorted instead.
+        """
+        text = get_python_source(self.file).text
+        if 'isort:' in text:
+            return None
+
+        block = PyImportSortBear._find_import_block(self.file)
+        if block is None:
+            return None
+
+        start, end = block
+        if start == 0:
+            return tuple(self.file)
+
+        lines = tuple(self.file[start - 1:end])
+        fingerprint = hashlib.sha1(
+            (repr(sorted(self.isort_settings.items())) +
+             ''.join(lines)).encode()).hexdigest()
+        sorted_lines = _sorted_blocks.get(fingerprint)
+        if sorted_lines is None:
+            sorted_lines = tuple(SortImports(
+                file_contents=''.join(lines),
+                **self.isort_settings).output.splitlines(True))
+            if len(_sorted_blocks) >= MAX_SORTED_BLOCKS:
+                _sorted_blocks.popitem(last=False)
+        else:
+            _sorted_blocks.move_to_end(fingerprint)
+        _sorted_blocks[fingerprint] = sorted_lines
+
+        if sorted_lines == lines:
+            return tuple(self.file)
+        return (tuple(self.file[:start - 1]) + sorted_lines +
+                tuple(self.file[end:]))
+
     def _get_diff(self):
         if self.treat_seperated_imports_independently:
             import_stmts = PyImportSortBear._seperate_imports(self.file)
@@ -67,10 +176,15 @@ class PyImportSortBear(LocalBear):
             if diff.modified != diff._file:
                 return diff
         else:
-            sort_imports = SortImports(file_contents=''.join(self.file),
-                                       **self.isort_settings)
+            new_file = None
+            if self.sort_import_block_only:
+                new_file = self._sort_import_block()
+            if new_file is None:
+                sort_imports = SortImports(
+                    file_contents=get_python_source(self.file).text,
+                    **self.isort_settings)
+                new_file = tuple(sort_imports.output.splitlines(True))
 
-            new_file = tuple(sort_imports.output.splitlines(True))
             if new_file != tuple(self.file):
                 diff = Diff.from_string_arrays(self.file, new_file)
                 return diff
@@ -106,7 +220,8 @@ class PyImportSortBear(LocalBear):
             known_standard_library_imports: typed_list(str)=None,
             max_line_length: int=79,
             imports_forced_to_top: typed_list(str)=(),
-            treat_seperated_imports_independently: bool=False):
+            treat_seperated_imports_independently: bool=False,
+            sort_import_block_only: bool=False):
         """
         Raise issues related to sorting imports, segregating imports into
         various sections, and also adding comments on top of each import
@@ -207,6 +322,12 @@ class PyImportSortBear(LocalBear):
         :param treat_seperated_imports_independently:
             Treat import statements seperated by one or more blank line or any
             statement other than an import statement as an independent bunch.
+        :param sort_import_block_only:
+            Only pass the imports at the top of the file to ``isort`` instead
+            of the whole file, unless imports also follow other statements.
+            Import blocks already known to be sorted are not sorted again.
+            Has no effect if ``treat_seperated_imports_independently`` is
+            set.
         """
         isort_settings = dict(
             use_parentheses=use_parentheses_in_import,
@@ -244,6 +365,7 @@ class PyImportSortBear(LocalBear):
         self.filename = filename
         self.treat_seperated_imports_independently = \
             treat_seperated_imports_independently
+        self.sort_import_block_only = sort_import_block_only
 
         diff = self._get_diff()
 
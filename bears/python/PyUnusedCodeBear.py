@@ -5,6 +5,8 @@ from dependency_management.requirements.PipRequirement import PipRequirement
 from coalib.results.Diff import Diff
 from coalib.results.Result import Result
 
+from bears.python.SourceCache import get_python_source
+
 
 class PyUnusedCodeBear(LocalBear):
     LANGUAGES = {'Python', 'Python 2', 'Python 3'}
@@ -31,7 +33,7 @@ class PyUnusedCodeBear(LocalBear):
         """
 
         corrected = autoflake.fix_code(
-                       ''.join(file),
+                       get_python_source(file).text,
                        additional_imports=None,
                        remove_all_unused_imports=remove_all_unused_imports,
                        remove_unused_variables=remove_unused_variables
@@ -0,0 +1,18 @@
+from bears.python.PycodestyleBear import PycodestyleBear
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(PycodestyleBear,
+                output_filename_regex=r'(?P<filename>.+?):(?=\d+ \d+ )',
+                strip_filename=True)
+class PycodestyleBatchBear:
+    """
+    A wrapper for the tool ``pycodestyle`` formerly known as ``pep8``,
+    checking many files at once.
+    """
+
+    @staticmethod
+    def create_batch_arguments(arguments):
+        return tuple('--format=%(path)s:' + arg[len('--format='):]
+                     if arg.startswith('--format=') else arg
+                     for arg in arguments)
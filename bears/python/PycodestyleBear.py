@@ -2,8 +2,34 @@ from coalib.bearlib.abstractions.Linter import linter
 from coalib.settings.Setting import typed_list
 
 from dependency_management.requirements.PipRequirement import PipRequirement
+import pycodestyle
 
+from bears.utils.InProcessLinter import (
+    captured_output, in_process_linter, log_exit)
 
+
+def run_pycodestyle(arguments, filename, file):
+    """
+    Checks the given file with ``pycodestyle`` like its executable does.
+
+    :return: The output on stdout.
+    """
+    with captured_output() as (stdout, stderr):
+        try:
+            style_guide = pycodestyle.StyleGuide(paths=list(arguments))
+        except SystemExit as error:
+            exit_error = error
+        else:
+            exit_error = None
+            if not style_guide.excluded(filename):
+                style_guide.input_file(filename, lines=list(file))
+
+    if exit_error is not None:
+        log_exit('pycodestyle', exit_error, stderr.getvalue())
+    return stdout.getvalue()
+
+
+@in_process_linter(run_pycodestyle)
 @linter(executable='pycodestyle',
         output_format='regex',
         output_regex=r'(?P<line>\d+) (?P<column>\d+) '
@@ -1,10 +1,67 @@
+from functools import lru_cache
+import hashlib
+from multiprocessing import Pool
 import os.path
+
+import pkg_resources
 import pyroma
 
 from coalib.bears.GlobalBear import GlobalBear
 from dependency_management.requirements.PipRequirement import PipRequirement
 from coalib.results.Result import Result
 
+from bears.utils.LinterResultCache import result_cache
+
+# The files of a package the ratings are assumed to depend on.
+METADATA_FILES = ('setup.py', 'setup.cfg', 'MANIFEST.in', 'MANIFEST',
+                  'README', 'README.rst', 'README.md', 'README.txt')
+
+
+@lru_cache()
+def get_pyroma_version():
+    """
+    :return: The version of the installed pyroma package.
+    """
+    return pkg_resources.get_distribution('pyroma').version
+
+
+def get_package_key(directory):
+    """
+    Computes the key the ratings of the package in the given directory are
+    cached under, from the contents of its metadata files.
+
+    :param directory: The directory containing the ``setup.py`` file.
+    :return:          The key.
+    """
+    key = hashlib.sha256()
+    for part in ('PyromaBear', get_pyroma_version(), directory):
+        key.update(part.encode('utf-8', 'surrogateescape'))
+        key.update(b'\0')
+
+    for name in METADATA_FILES:
+        try:
+            with open(os.path.join(directory, name), 'rb') as fl:
+                content = b'+' + fl.read()
+        except OSError:
+            content = b'-'
+        key.update(name.encode())
+        key.update(b'\0')
+        key.update(hashlib.sha256(content).digest())
+    return key.hexdigest()
+
+
+def rate_package(directory):
+    """
+    Rates the package in the given directory with pyroma, which runs its
+    ``setup.py``. Run this in a process of its own, as the setup script can
+    change the state of the process.
+
+    :param directory: The directory containing the ``setup.py`` file.
+    :return:          The list of messages pyroma gives.
+    """
+    data = pyroma.projectdata.get_data(directory)
+    return pyroma.ratings.rate(data)[1]
+
 
 class PyromaBear(GlobalBear):
     LANGUAGES = {'Python', 'Python 3'}
@@ -13,7 +70,7 @@ class PyromaBear(GlobalBear):
     AUTHORS_EMAILS = {'coala-devel@googlegroups.com'}
     LICENSE = 'AGPL-3.0'
 
-    def run(self):
+    def run(self, use_result_cache: bool=True, pyroma_jobs: int=0):
         """
         Checks for Python packaging best practices using `pyroma`.
 
@@ -23,6 +80,17 @@ class PyromaBear(GlobalBear):
         as well as a list of issues that could be improved.
 
         See <https://bitbucket.org/regebro/pyroma/> for more information.
+
+        Every ``setup.py`` is run in a worker process of its own, so setup
+        scripts cannot interfere with one another or with coala.
+
+        :param use_result_cache:
+            Whether to reuse the ratings of previous runs for packages whose
+            ``setup.py``, ``setup.cfg``, ``MANIFEST.in`` and ``README`` files
+            did not change.
+        :param pyroma_jobs:
+            The maximum number of packages to rate in parallel. ``0`` uses
+            one process per CPU.
         """
 
         setup_files = [setup_file for setup_file in self.file_dict
@@ -31,13 +99,28 @@ class PyromaBear(GlobalBear):
         if not setup_files:
             yield Result(self, 'Your package does'
                          ' not contain a setup file.')
-        else:
-            for setup_file in setup_files:
-                data = pyroma.projectdata.get_data(os.path.dirname(setup_file))
-                rating = pyroma.ratings.rate(data)
-                messages = rating[1]
-
-                for message in messages:
-                    yield Result.from_values(origin=self,
-                                             message=message,
-                                             file=setup_file)
+            return
+
+        keys = {setup_file: get_package_key(os.path.dirname(setup_file))
+                for setup_file in setup_files}
+        ratings = (result_cache.get_many(set(keys.values()))
+                   if use_result_cache else {})
+
+        missing = {keys[setup_file]: os.path.dirname(setup_file)
+                   for setup_file in setup_files
+                   if keys[setup_file] not in ratings}
+        if missing:
+            processes = min(len(missing), pyroma_jobs or os.cpu_count() or 1)
+            with Pool(processes, maxtasksperchild=1) as pool:
+                new_ratings = dict(zip(
+                    missing,
+                    pool.map(rate_package, missing.values(), chunksize=1)))
+            if use_result_cache:
+                result_cache.set_many(new_ratings)
+            ratings.update(new_ratings)
+
+        for setup_file in setup_files:
+            for message in ratings[keys[setup_file]]:
+                yield Result.from_values(origin=self,
+                                         message=message,
+                                         file=setup_file)
@@ -1,13 +1,38 @@
 import radon.complexity
+import radon.metrics
+import radon.raw
 import radon.visitors
 
 from coalib.bears.LocalBear import LocalBear
 from dependency_management.requirements.PipRequirement import PipRequirement
+from coalib.results.HiddenResult import HiddenResult
 from coalib.results.Result import Result
 from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
 from coalib.results.SourceRange import SourceRange
 from coalib.settings.Setting import typed_list
 
+from bears.python.SourceCache import get_python_source
+
+
+def get_severity(rank, severity_map):
+    """
+    Returns the severity the given rank is mapped to.
+
+    >>> get_severity('B', {RESULT_SEVERITY.INFO: ('A', 'B')})
+    0
+    >>> get_severity('C', {RESULT_SEVERITY.INFO: ('A', 'B')}) is None
+    True
+
+    :param rank:         The rank given by radon.
+    :param severity_map: A dictionary mapping severities to lists of ranks.
+    :return:             The severity or ``None`` if the rank is not mapped.
+    """
+    severity = None
+    for result_severity, rank_list in severity_map.items():
+        if rank in rank_list:
+            severity = result_severity
+    return severity
+
 
 class RadonBear(LocalBear):
     LANGUAGES = {'Python', 'Python 2', 'Python 3'}
@@ -20,28 +45,74 @@ class RadonBear(LocalBear):
     def run(self, filename, file,
             radon_ranks_info: typed_list(str)=(),
             radon_ranks_normal: typed_list(str)=('C', 'D'),
-            radon_ranks_major: typed_list(str)=('E', 'F')):
+            radon_ranks_major: typed_list(str)=('E', 'F'),
+            radon_mi_ranks_info: typed_list(str)=(),
+            radon_mi_ranks_normal: typed_list(str)=(),
+            radon_mi_ranks_major: typed_list(str)=(),
+            radon_max_halstead_effort: float=None,
+            radon_max_logical_lines: int=None,
+            radon_hidden_metrics: bool=False):
         """
         Uses radon to compute complexity of a given file.
 
-        :param radon_ranks_info:   The ranks (given by radon) to
-                                   treat as severity INFO.
-        :param radon_ranks_normal: The ranks (given by radon) to
-                                   treat as severity NORMAL.
-        :param radon_ranks_major:  The ranks (given by radon) to
-                                   treat as severity MAJOR.
+        The cyclomatic complexity, the Halstead metrics, the maintainability
+        index and the raw metrics are all computed from the same syntax
+        tree. Metric families without a threshold are only computed if
+        ``radon_hidden_metrics`` is set.
+
+        :param radon_ranks_info:          The cyclomatic complexity ranks
+                                          (given by radon) to treat as
+                                          severity INFO.
+        :param radon_ranks_normal:        The cyclomatic complexity ranks
+                                          (given by radon) to treat as
+                                          severity NORMAL.
+        :param radon_ranks_major:         The cyclomatic complexity ranks
+                                          (given by radon) to treat as
+                                          severity MAJOR.
+        :param radon_mi_ranks_info:       The maintainability index ranks
+                                          (given by radon) to treat as
+                                          severity INFO.
+        :param radon_mi_ranks_normal:     The maintainability index ranks
+                                          (given by radon) to treat as
+                                          severity NORMAL.
+        :param radon_mi_ranks_major:      The maintainability index ranks
+                                          (given by radon) to treat as
+                                          severity MAJOR.
+        :param radon_max_halstead_effort: The maximum Halstead effort of a
+                                          file.
+        :param radon_max_logical_lines:   The maximum number of logical lines
+                                          of code of a file.
+        :param radon_hidden_metrics:      Whether to yield all metrics of the
+                                          file in a ``HiddenResult`` for
+                                          other bears and tools to use.
         """
         severity_map = {
             RESULT_SEVERITY.INFO: radon_ranks_info,
             RESULT_SEVERITY.NORMAL: radon_ranks_normal,
             RESULT_SEVERITY.MAJOR: radon_ranks_major
         }
-        for visitor in radon.complexity.cc_visit(''.join(file)):
+        mi_severity_map = {
+            RESULT_SEVERITY.INFO: radon_mi_ranks_info,
+            RESULT_SEVERITY.NORMAL: radon_mi_ranks_normal,
+            RESULT_SEVERITY.MAJOR: radon_mi_ranks_major
+        }
+        check_mi = radon_hidden_metrics or any(mi_severity_map.values())
+        check_halstead = (radon_hidden_metrics or check_mi or
+                          radon_max_halstead_effort is not None)
+        check_raw = (radon_hidden_metrics or check_mi or
+                     radon_max_logical_lines is not None)
+
+        source = get_python_source(file)
+        complexity_visitor = radon.visitors.ComplexityVisitor.from_ast(
+            source.tree)
+        metrics = {'complexity': []}
+        for visitor in complexity_visitor.blocks:
             rank = radon.complexity.cc_rank(visitor.complexity)
-            severity = None
-            for result_severity, rank_list in severity_map.items():
-                if rank in rank_list:
-                    severity = result_severity
+            metrics['complexity'].append({'name': visitor.fullname,
+                                          'line': visitor.lineno,
+                                          'complexity': visitor.complexity,
+                                          'rank': rank})
+            severity = get_severity(rank, severity_map)
             if severity is None:
                 continue
 
@@ -53,3 +124,46 @@ class RadonBear(LocalBear):
 
             yield Result(self, message, severity=severity,
                          affected_code=(visitor_range,))
+
+        if check_halstead:
+            halstead = radon.metrics.h_visit_ast(source.tree)
+            metrics['halstead'] = halstead._asdict()
+            if (radon_max_halstead_effort is not None and
+                    halstead.effort > radon_max_halstead_effort):
+                yield Result.from_values(
+                    self,
+                    'The file has a Halstead effort of {:.0f}, the maximum '
+                    'is {:.0f}.'.format(halstead.effort,
+                                        radon_max_halstead_effort),
+                    filename)
+
+        if check_raw:
+            raw = radon.raw.analyze(source.text)
+            metrics['raw'] = raw._asdict()
+            if (radon_max_logical_lines is not None and
+                    raw.lloc > radon_max_logical_lines):
+                yield Result.from_values(
+                    self,
+                    'The file has {} logical lines of code, the maximum is '
+                    '{}.'.format(raw.lloc, radon_max_logical_lines),
+                    filename)
+
+        if check_mi:
+            comments = (raw.comments + raw.multi) / raw.sloc * 100 \
+                if raw.sloc else 0
+            score = radon.metrics.mi_compute(
+                halstead.volume, complexity_visitor.total_complexity,
+                raw.lloc, comments)
+            rank = radon.metrics.mi_rank(score)
+            metrics['maintainability'] = {'score': score, 'rank': rank}
+            severity = get_severity(rank, mi_severity_map)
+            if severity is not None:
+                yield Result.from_values(
+                    self,
+                    'The file has a maintainability index of {:.2f} '
+                    '(rank {}).'.format(score, rank),
+                    filename,
+                    severity=severity)
+
+        if radon_hidden_metrics:
+            yield HiddenResult(self, metrics)
@@ -0,0 +1,128 @@
+import ast
+from collections import OrderedDict
+
+
+DEFAULT_MAX_SIZE = 32 * 1024 * 1024
+
+
+class PythonSource:
+    """
+    The source of a Python file together with its syntax tree, which is only
+    computed when first needed.
+
+    >>> source = PythonSource(('x = 1\\n',))
+    >>> source.text
+    'x = 1\\n'
+    >>> type(source.tree).__name__
+    'Module'
+
+    Errors raised while parsing are raised again on every access:
+
+    >>> PythonSource(('x = (\\n',)).tree  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+     ...
+    SyntaxError: ...
+    """
+
+    def __init__(self, file):
+        """
+        :param file: The lines of the file.
+        """
+        self.text = ''.join(file)
+        self._tree = None
+
+    @staticmethod
+    def _compute(function):
+        try:
+            return function(), None
+        except Exception as exception:
+            return None, exception
+
+    @property
+    def tree(self):
+        """
+        The syntax tree of the source as returned by ``ast.parse()``. It is
+        shared by all users of the source and must not be modified.
+
+        :raises SyntaxError: If the source cannot be parsed.
+        :raises ValueError:  If the source contains null bytes.
+        """
+        if self._tree is None:
+            self._tree = self._compute(lambda: ast.parse(self.text))
+
+        tree, exception = self._tree
+        if exception is not None:
+            raise exception
+        return tree
+
+
+class SourceCache:
+    """
+    Keeps the ``PythonSource`` objects of recently checked files, so several
+    bears checking the same file in one process join and parse it only
+    once. Files are identified by their contents. When the total length
+    of the cached sources exceeds ``max_size``, the least recently used ones
+    are dropped.
+
+    >>> cache = SourceCache(max_size=10)
+    >>> cache.get(('a = 1\\n',)) is cache.get(('a = 1\\n',))
+    True
+    >>> cache.get(('b = 22222\\n',)).text
+    'b = 22222\\n'
+    >>> len(cache)
+    1
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """
+        :param max_size: The maximum total length of all cached sources.
+        """
+        self.max_size = max_size
+        self.size = 0
+        self._sources = OrderedDict()
+
+    def __len__(self):
+        return len(self._sources)
+
+    def get(self, file):
+        """
+        Returns the ``PythonSource`` of the given file.
+
+        :param file: The lines of the file.
+        :return:     The ``PythonSource`` object, shared with other callers
+                     passing the same contents.
+        """
+        key = tuple(file)
+        source = self._sources.get(key)
+        if source is not None:
+            self._sources.move_to_end(key)
+            return source
+
+        source = PythonSource(key)
+        self._sources[key] = source
+        self.size += len(source.text)
+        while self.size > self.max_size and len(self._sources) > 1:
+            _, evicted = self._sources.popitem(last=False)
+            self.size -= len(evicted.text)
+        return source
+
+    def clear(self):
+        """
+        Drops all cached sources.
+        """
+        self._sources.clear()
+        self.size = 0
+
+
+source_cache = SourceCache()
+
+
+def get_python_source(file):
+    """
+    Returns the ``PythonSource`` of the given file from the ``source_cache``
+    of the process.
+
+    :param file: The lines of the file.
+    :return:     The ``PythonSource`` object.
+    """
+    return source_cache.get(file)
@@ -1,7 +1,13 @@
+import hashlib
+import os
+
 from coalib.bears.GlobalBear import GlobalBear
 from coalib.results.Result import Result
 from dependency_management.requirements.PipRequirement import PipRequirement
-from vulture import Vulture
+import vulture
+from vulture import Item, Vulture
+
+from bears.utils.LinterResultCache import result_cache
 
 CONFIDENCE_MAP = {
     'attribute': 70,
@@ -12,22 +18,103 @@ CONFIDENCE_MAP = {
     'variable': 70,
 }
 
+# The lists of ``Vulture`` holding the items defined and the names used.
+DEFINITION_LISTS = ('defined_attrs', 'defined_funcs', 'defined_imports',
+                    'defined_props', 'defined_vars')
+USAGE_LISTS = ('used_attrs', 'used_vars', 'tuple_assign_vars',
+               'names_imported_as_aliases')
+
+
+def get_file_index(filename, file):
+    """
+    Scans a file with vulture and returns the names it defines and uses. The
+    index does not contain the filename, so it can be reused for files with
+    the same contents.
+
+    >>> definitions, usages = get_file_index('module.py', ['x = y\\n'])
+    >>> definitions['defined_vars']
+    [('x', 'variable', 1)]
+    >>> usages['used_vars']
+    ['y']
 
-def _find_unused_code(filenames):
+    :param filename: The name of the file.
+    :param file:     The lines of the file.
+    :return:         A tuple of a dictionary mapping the names of the
+                     definition lists of ``Vulture`` to lists of the name,
+                     type and line number of the items, and a dictionary
+                     mapping the names of the usage lists to lists of names.
     """
-    :param filenames: List of filenames to check.
+    scanner = Vulture()
+    scanner.scan(''.join(file), filename=filename)
+    definitions = {name: [(str(item), item.typ, item.lineno)
+                          for item in getattr(scanner, name)]
+                   for name in DEFINITION_LISTS}
+    usages = {name: [str(used) for used in getattr(scanner, name)]
+              for name in USAGE_LISTS}
+    return definitions, usages
+
+
+def get_index_key(filename, file):
+    """
+    Computes the key the index of the given file is cached under. Apart
+    from the contents, the index only depends on whether the file is named
+    like a test module.
+
+    :param filename: The name of the file.
+    :param file:     The lines of the file.
+    :return:         The key.
+    """
+    key = hashlib.sha256()
+    for part in ('VultureBear',
+                 vulture.__version__,
+                 str(os.path.basename(filename).startswith('test_')),
+                 ''.join(file)):
+        key.update(part.encode('utf-8', 'surrogateescape'))
+        key.update(b'\0')
+    return key.hexdigest()
+
+
+def _find_unused_code(file_dict, use_result_cache=True):
+    """
+    :param file_dict:        Dictionary mapping the filenames to check to
+                             the lines of the files.
+    :param use_result_cache: Whether to reuse the indices of files with the
+                             same contents from the ``result_cache``.
     :return: Generator of Result objects.
     """
 
     def file_lineno(item):
         return (item.filename.lower(), item.lineno)
 
-    vulture = Vulture()
-    vulture.scavenge(filenames)
+    keys = {filename: get_index_key(filename, file)
+            for filename, file in file_dict.items()}
+    indices = (result_cache.get_many(set(keys.values()))
+               if use_result_cache else {})
+    new_indices = {}
+
+    merged = Vulture()
+    for filename, file in file_dict.items():
+        key = keys[filename]
+        index = indices.get(key) or new_indices.get(key)
+        if index is None:
+            index = get_file_index(filename, file)
+            new_indices[key] = index
+
+        definitions, usages = index
+        for name, items in definitions.items():
+            getattr(merged, name).extend(
+                Item(item, typ, filename, lineno)
+                for item, typ, lineno in items)
+        for name, names in usages.items():
+            getattr(merged, name).extend(names)
+
+    if use_result_cache and new_indices:
+        result_cache.set_many(new_indices)
+
     for item in sorted(
-            vulture.unused_funcs + vulture.unused_imports +
-            vulture.unused_props + vulture.unused_vars +
-            vulture.unused_attrs, key=file_lineno):
+            merged.unused_funcs + merged.unused_imports +
+            merged.unused_props + merged.unused_vars +
+            merged.unused_attrs, key=file_lineno):
         message = 'Unused {0}: {1}'.format(item.typ, item)
         yield Result.from_values(origin='VultureBear',
                                  message=message,
@@ -46,9 +133,13 @@ class VultureBear(GlobalBear):
     CAN_DETECT = {'Unused Code'}
     SEE_MORE = 'https://github.com/jendrikseipp/vulture'
 
-    def run(self):
+    def run(self, use_result_cache: bool=True):
         """
         Check Python code for unused variables and functions using `vulture`.
+
+        :param use_result_cache:
+            Whether to keep the names defined and used by every file, so only
+            files whose contents changed since a previous run are scanned
+            again.
         """
-        filenames = list(self.file_dict.keys())
-        return _find_unused_code(filenames)
+        return _find_unused_code(self.file_dict, use_result_cache)
@@ -1,13 +1,89 @@
+from functools import lru_cache
+import os.path
+import re
+
+from yapf.yapflib import style
 from yapf.yapflib.yapf_api import FormatCode
 
 from coalib.bearlib import deprecate_settings
 from coalib.bearlib.spacing.SpacingHelper import SpacingHelper
 from coalib.bears.LocalBear import LocalBear
 from dependency_management.requirements.PipRequirement import PipRequirement
-from coala_utils.ContextManagers import prepare_file
 from coalib.results.Result import Result
 from coalib.results.Diff import Diff
 
+from bears.python.SourceCache import get_python_source
+
+HUNK_HEADER_REGEX = re.compile(r'@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+
+@lru_cache(maxsize=32)
+def get_style(options):
+    """
+    Creates the yapf style for the given options once, so it is shared by
+    all files checked with the same settings.
+
+    :param options: A tuple of tuples of the names and values of the yapf
+                    style options.
+    :return:        The yapf style dictionary.
+    """
+    return style.CreateStyleFromConfig(dict(options))
+
+
+def parse_changed_lines(diff):
+    """
+    Parses the line ranges changed in every file of a unified diff.
+
+    >>> parse_changed_lines(['--- a/x.py\\n', '+++ b/x.py\\n',
+    ...                      '@@ -1,2 +1,3 @@\\n', '@@ -10 +11 @@\\n',
+    ...                      '@@ -20,2 +21,0 @@\\n'])
+    {'x.py': [(1, 3), (11, 11), (21, 21)]}
+
+    :param diff: The lines of the unified diff, as given by ``git diff``.
+    :return:     A dictionary mapping the paths of the changed files, with
+                 the ``b/`` prefix of git removed, to lists of the first and
+                 last line of every changed range.
+    """
+    changed_lines = {}
+    lines = None
+    for line in diff:
+        if line.startswith('+++ '):
+            path = line[4:].rstrip('\n').split('\t')[0]
+            if path == '/dev/null':
+                lines = None
+                continue
+            if path.startswith('b/'):
+                path = path[2:]
+            lines = changed_lines.setdefault(path, [])
+            continue
+
+        match = HUNK_HEADER_REGEX.match(line)
+        if match and lines is not None:
+            start = int(match.group(1))
+            count = int(match.group(2)) if match.group(2) is not None else 1
+            # For removed lines, the line after the removal is checked.
+            lines.append((max(start, 1), max(start + count - 1, start, 1)))
+    return changed_lines
+
+
+@lru_cache(maxsize=4)
+def _read_changed_lines(diff_file, mtime):
+    with open(diff_file, encoding='utf-8', errors='replace') as fl:
+        return parse_changed_lines(fl)
+
+
+def read_changed_lines(diff_file):
+    """
+    Reads the line ranges changed in every file of a unified diff file. The
+    file is only parsed again if it was modified.
+
+    :param diff_file: The path of the diff file.
+    :return:          The changed lines as returned by
+                      ``parse_changed_lines``.
+    :raises OSError:  If the diff file cannot be read.
+    """
+    return _read_changed_lines(diff_file, os.path.getmtime(diff_file))
+
 
 class YapfBear(LocalBear):
     LANGUAGES = {'Python', 'Python 2', 'Python 3'}
@@ -39,7 +115,8 @@ class YapfBear(LocalBear):
             split_before_named_assigns: bool=True,
             use_spaces: bool=True,
             based_on_style: str='pep8',
-            prefer_line_break_after_opening_bracket: bool=True):
+            prefer_line_break_after_opening_bracket: bool=True,
+            vcs_diff_file: str=''):
         """
         Check and correct formatting of Python code using ``yapf`` utility.
 
@@ -113,6 +190,11 @@ class YapfBear(LocalBear):
         :param prefer_line_break_after_opening_bracket:
             If True, splitting right after a open bracket will not be
             preferred.
+        :param vcs_diff_file:
+            The path of a unified diff, e.g. written by
+            ``git diff -U0 origin/master``, with paths relative to the
+            project directory. If given, only the lines changed in the diff
+            are formatted and files not in the diff are skipped.
         """
         if not file:
             # Yapf cannot handle zero-byte files well, and adds a redundent
@@ -120,39 +202,53 @@ class YapfBear(LocalBear):
             # files as they cannot have anything to format either.
             return
 
-        options = """
-[style]
-indent_width = {indent_size}
-column_limit = {max_line_length}
-allow_multiline_lambdas = {allow_multiline_lambdas}
-continuation_indent_width = {continuation_tab_width}
-dedent_closing_brackets = {dedent_closing_brackets}
-indent_dictionary_value = {indent_dictionary_value}
-join_multiple_lines = {join_multiple_lines}
-spaces_around_power_operator = {spaces_around_power_operator}
-spaces_before_comment = {spaces_before_comment}
-coalesce_brackets = {coalesce_brackets}
-split_before_bitwise_operator = {split_before_bitwise_operator}
-split_before_first_argument = {split_before_first_argument}
-split_before_logical_operator = {split_before_logical_operator}
-split_before_named_assigns = {split_before_named_assigns}
-based_on_style = {based_on_style}
-blank_line_before_nested_class_or_def = {blank_line_before_nested_class_or_def}
-split_arguments_when_comma_terminated = {split_arguments_when_comma_terminated}
-space_between_ending_comma_and_closing_bracket= \
-{space_between_ending_comma_and_closing_bracket}
-"""
-        options += 'use_tabs = ' + str(not use_spaces) + '\n'
-        options += ('split_penalty_after_opening_bracket = ' +
-                    ('30' if prefer_line_break_after_opening_bracket
-                     else '0') + '\n')
-        options = options.format(**locals())
+        lines = None
+        if vcs_diff_file:
+            try:
+                changed_lines = read_changed_lines(vcs_diff_file)
+            except OSError as err:
+                self.err('The diff file {!r} cannot be read: {}'.format(
+                    vcs_diff_file, err))
+                return
+            path = os.path.relpath(
+                filename, self.get_config_dir() or os.getcwd())
+            lines = changed_lines.get(path.replace(os.sep, '/'))
+            if not lines:
+                return
+
+        options = (
+            ('indent_width', indent_size),
+            ('column_limit', max_line_length),
+            ('allow_multiline_lambdas', allow_multiline_lambdas),
+            ('continuation_indent_width', continuation_tab_width),
+            ('dedent_closing_brackets', dedent_closing_brackets),
+            ('indent_dictionary_value', indent_dictionary_value),
+            ('join_multiple_lines', join_multiple_lines),
+            ('spaces_around_power_operator', spaces_around_power_operator),
+            ('spaces_before_comment', spaces_before_comment),
+            ('coalesce_brackets', coalesce_brackets),
+            ('split_before_bitwise_operator', split_before_bitwise_operator),
+            ('split_before_first_argument', split_before_first_argument),
+            ('split_before_logical_operator', split_before_logical_operator),
+            ('split_before_named_assigns', split_before_named_assigns),
+            ('based_on_style', based_on_style),
+            ('blank_line_before_nested_class_or_def',
+             blank_line_before_nested_class_or_def),
+            ('split_arguments_when_comma_terminated',
+             split_arguments_when_comma_terminated),
+            ('space_between_ending_comma_and_closing_bracket',
+             space_between_ending_comma_and_closing_bracket),
+            ('use_tabs', not use_spaces),
+            ('split_penalty_after_opening_bracket',
+             30 if prefer_line_break_after_opening_bracket else 0))
 
         try:
-            with prepare_file(options.splitlines(keepends=True),
-                              None) as (file_, fname):
-                corrected = FormatCode(
-                    ''.join(file), style_config=fname)[0].splitlines(True)
+            # With no style_config given, yapf formats with the global style
+            # as it is instead of creating it again for every file.
+            style.SetGlobalStyle(get_style(options))
+            corrected = FormatCode(get_python_source(file).text,
+                                   style_config=None,
+                                   lines=lines)[0].splitlines(True)
         except SyntaxError as err:
             if isinstance(err, IndentationError):
                 error_type = 'indentation errors (' + err.args[0] + ')'
@@ -2,7 +2,7 @@ from collections import namedtuple
 import pkg_resources
 import re
 
-from safety import safety
+from safety.errors import DatabaseFetchError
 
 from coalib.bears.LocalBear import LocalBear
 from dependency_management.requirements.PipRequirement import PipRequirement
@@ -10,6 +10,9 @@ from coalib.results.Result import Result
 from coalib.results.SourceRange import SourceRange
 from coalib.settings.Setting import typed_list
 
+from bears.python.requirements.VulnerabilityIndex import (
+    get_vulnerability_index, normalize_package_name)
+
 
 # the safety module expects an object that looks like this
 # (not importing it from there because it's in a private-ish location)
@@ -35,20 +38,37 @@ class PySafetyBear(LocalBear):
     LICENSE = 'AGPL'
     CAN_DETECT = {'Security'}
 
-    def run(self, filename, file):
+    def run(self, filename, file, safety_database: str=''):
         """
         Checks for vulnerable package versions in requirements files.
+
+        :param safety_database:
+            The path or the URL of a copy of safety's full vulnerability
+            database (``insecure_full.json``). If not given, the database is
+            downloaded from the mirrors of safety. It is loaded only once and
+            all requirements files are checked against it.
         """
-        packages = list(
-            Package(key=req.key, version=req.specs[0][1])
-            for req in self.try_parse_requirements(file)
-            if len(req.specs) == 1 and req.specs[0][0] == '=='
-        )
+        packages = []
+        requirement_lines = {}
+        for line_number, line in enumerate(file, start=1):
+            for req in self.try_parse_requirements((line,)):
+                if len(req.specs) == 1 and req.specs[0][0] == '==':
+                    packages.append(
+                        Package(key=req.key, version=req.specs[0][1]))
+                    requirement_lines.setdefault(
+                        normalize_package_name(req.key), (line_number, line))
 
         if not packages:
             return
 
-        for vulnerability in safety.check(packages=packages):
+        try:
+            index = get_vulnerability_index(safety_database)
+        except (OSError, ValueError, DatabaseFetchError) as exception:
+            self.err('The vulnerability database could not be loaded: '
+                     '{}'.format(exception))
+            return
+
+        for vulnerability in index.check(packages):
             if vulnerability.is_cve:
                 message_template = (
                     '{vuln.name}{vuln.spec} is vulnerable to {vuln.cve_id} '
@@ -60,11 +80,7 @@ class PySafetyBear(LocalBear):
                     'using {vuln.version}.'
                 )
 
-            # StopIteration should not ever happen so skipping its branch
-            line_number, line = next(  # pragma: no branch
-                (index, line) for index, line in enumerate(file, start=1)
-                if vulnerability.name in line
-            )
+            line_number, line = requirement_lines[vulnerability.name]
             version_spec_match = re.search(r'[=<>]+(\S+?)(?:$|\s|#)', line)
             source_range = SourceRange.from_values(
                 filename,
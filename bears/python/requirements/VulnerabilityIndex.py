@@ -0,0 +1,125 @@
+import json
+
+from packaging.specifiers import SpecifierSet
+import requests
+from safety.constants import REQUEST_TIMEOUT
+from safety.safety import fetch_database, Vulnerability
+
+
+def normalize_package_name(name):
+    """
+    Normalizes a package name the way the safety database does.
+
+    >>> normalize_package_name('Foo_Bar')
+    'foo-bar'
+
+    :param name: The name of the package.
+    :return:     The normalized name.
+    """
+    return name.replace('_', '-').lower()
+
+
+class VulnerabilityIndex:
+    """
+    The vulnerabilities of the full safety database, keyed by normalized
+    package name, with the version specifiers parsed only once.
+
+    >>> index = VulnerabilityIndex({
+    ...     '$meta': {},
+    ...     'Foo_Bar': [{'v': '<1.0', 'changelog': 'Fixed.'},
+    ...                 {'v': '<1.0', 'cve': 'CVE-2017-0', 'description': ''},
+    ...                 {'v': '>2.0', 'changelog': 'Broken.'}]})
+    >>> [(vulnerability.name, vulnerability.source)
+    ...  for vulnerability in index.check([('foo-bar', '0.9')])]
+    [('foo-bar', 'changelog'), ('foo-bar', 'CVE-2017-0')]
+    >>> index.check([('foo_bar', '1.0'), ('baz', '0.9')])
+    []
+    """
+
+    def __init__(self, database):
+        """
+        :param database: The full safety database as loaded from its JSON
+                         file, i.e. a dictionary mapping package names to
+                         lists of vulnerabilities.
+        """
+        self.vulnerabilities = {}
+        for name, entries in database.items():
+            if name.startswith('$'):
+                continue
+
+            specs = {}
+            for entry in entries:
+                specs.setdefault(entry['v'], []).append(entry)
+            self.vulnerabilities[normalize_package_name(name)] = [
+                (SpecifierSet(spec), spec, spec_entries)
+                for spec, spec_entries in specs.items()]
+
+    @classmethod
+    def load(cls, database=''):
+        """
+        Loads the full safety database.
+
+        :param database: The path or the URL of a copy of the full safety
+                         database. If empty, it is downloaded from the
+                         mirrors of safety.
+        :return:         The ``VulnerabilityIndex``.
+        :raises OSError:             If the database cannot be read.
+        :raises ValueError:          If the database is no valid JSON.
+        :raises DatabaseFetchError:  If the database cannot be downloaded
+                                     from the mirrors of safety.
+        """
+        if not database:
+            return cls(fetch_database(full=True))
+        if database.startswith(('http://', 'https://')):
+            response = requests.get(url=database, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return cls(response.json())
+        with open(database, encoding='utf-8') as fl:
+            return cls(json.load(fl))
+
+    def check(self, packages):
+        """
+        Finds the known vulnerabilities of the given package versions.
+
+        :param packages: An iterable of tuples of package names and versions.
+        :return:         A list of ``safety.safety.Vulnerability`` objects.
+        """
+        vulnerable = []
+        for key, version in packages:
+            name = normalize_package_name(key)
+            for spec_set, spec, entries in self.vulnerabilities.get(name, ()):
+                if spec_set.contains(version):
+                    vulnerable += (Vulnerability(name=name, spec=spec,
+                                                 version=version, data=entry)
+                                   for entry in entries)
+        return vulnerable
+
+
+_indices = {}
+
+
+def get_vulnerability_index(database=''):
+    """
+    Returns the ``VulnerabilityIndex`` of the given database, loading it only
+    once per process, so all requirements files are checked against the same
+    index.
+
+    :param database: The path or the URL of a copy of the full safety
+                     database or an empty string to download it from the
+                     mirrors of safety.
+    :return:         The ``VulnerabilityIndex``.
+    :raises OSError:             If the database cannot be read.
+    :raises ValueError:          If the database is no valid JSON.
+    :raises DatabaseFetchError:  If the database cannot be downloaded from
+                                 the mirrors of safety.
+    """
+    if database not in _indices:
+        _indices[database] = VulnerabilityIndex.load(database)
+    return _indices[database]
+
+
+def clear_vulnerability_indices():
+    """
+    Drops all loaded indices, so they are loaded again on next use.
+    """
+    _indices.clear()
@@ -9,11 +9,15 @@ from dependency_management.requirements.RscriptRequirement import (
 from dependency_management.requirements.DistributionRequirement import (
     DistributionRequirement)
 
+from bears.utils.InterpreterSession import (
+    interpreter_session, R_SESSION_LOOP)
+
 
 def _map_to_r_bool(py_bool):
     return 'TRUE' if py_bool else 'FALSE'
 
 
+@interpreter_session('-e', 'library(formatR)', '-e', R_SESSION_LOOP)
 @linter(executable='Rscript',
         output_format='corrected',
         prerequisite_check_command=('Rscript', '-e', 'library(formatR)'),
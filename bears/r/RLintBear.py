@@ -7,7 +7,11 @@ from dependency_management.requirements.DistributionRequirement import (
     DistributionRequirement)
 from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
 
+from bears.utils.InterpreterSession import (
+    interpreter_session, R_SESSION_LOOP)
 
+
+@interpreter_session('-e', 'library(lintr)', '-e', R_SESSION_LOOP)
 @linter(executable='Rscript',
         output_format='regex',
         output_regex=r'.*?:(?P<line>\d+):(?P<column>\d+): '
@@ -7,7 +7,10 @@ from coalib.results.Result import Result
 from coalib.results.SourceRange import SourceRange
 from coala_utils.param_conversion import negate
 
+from bears.utils.MemoizedConfig import memoized_config
 
+
+@memoized_config
 @linter(executable='reek', use_stdin=True)
 class RubySmellBear:
     """
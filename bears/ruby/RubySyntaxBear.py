@@ -6,7 +6,10 @@ from dependency_management.requirements.CondaRequirement import (
 from dependency_management.requirements.DistributionRequirement import (
     DistributionRequirement)
 
+from bears.utils.LinterResultCache import cached_linter
 
+
+@cached_linter
 @linter(executable='ruby',
         use_stdout=False,
         use_stderr=True,
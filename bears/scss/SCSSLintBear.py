@@ -4,7 +4,10 @@ from coalib.bearlib.abstractions.Linter import linter
 from dependency_management.requirements.GemRequirement import GemRequirement
 from dependency_management.requirements.PipRequirement import PipRequirement
 
+from bears.utils.MemoizedConfig import memoized_config
 
+
+@memoized_config
 @linter(executable='scss-lint', output_format='regex',
         output_regex=r'.+:(?P<line>\d+):(?P<column>\d+)\s+'
                      r'\[(?P<severity>.)\]\s+'
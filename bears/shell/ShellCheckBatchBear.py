@@ -0,0 +1,12 @@
+from bears.shell.ShellCheckBear import ShellCheckBear
+from bears.utils.BatchedLinter import batched_linter
+
+
+@batched_linter(ShellCheckBear,
+                output_filename_regex=r'(?P<filename>.+?):\d+:\d+: ')
+class ShellCheckBatchBear:
+    """
+    Check bash/shell scripts for syntactical problems, semantical problems as
+    well as subtle caveats and pitfalls, running ``shellcheck`` once for many
+    files instead of once per file.
+    """
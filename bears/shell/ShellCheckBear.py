@@ -6,7 +6,10 @@ from dependency_management.requirements.AnyOneOfRequirements import (
 from dependency_management.requirements.CabalRequirement import (
      CabalRequirement)
 
+from bears.utils.LinterResultCache import cached_linter
 
+
+@cached_linter
 @linter(executable='shellcheck', output_format='regex',
         output_regex=r'.+:(?P<line>\d+):(?P<column>\d+): '
                      r'(?P<severity>error|warning|info): (?P<message>.+)')
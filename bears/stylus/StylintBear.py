@@ -3,11 +3,14 @@ import json
 from coalib.bearlib.abstractions.Linter import linter
 from dependency_management.requirements.NpmRequirement import NpmRequirement
 
+from bears.utils.MemoizedConfig import memoized_config
+
 _setting_map = {True: 'always',
                 False: 'never',
                 None: 'false'}
 
 
+@memoized_config
 @linter(executable='stylint',
         output_format='regex',
         output_regex=r'(?P<line>\d+):?(?P<column>\d+)?\s+.*?'
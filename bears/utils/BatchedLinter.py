@@ -0,0 +1,416 @@
+from collections import OrderedDict
+from contextlib import ExitStack
+import inspect
+from itertools import compress
+from multiprocessing import Pool
+import os
+import re
+
+from coalib.bears.GlobalBear import GlobalBear
+from coalib.misc.Shell import run_shell_command
+from coalib.settings.FunctionMetadata import FunctionMetadata
+
+
+# Passed to ``create_arguments()`` instead of the temporary config file while
+# grouping, so files sharing the same config contents end up in one group.
+CONFIG_FILE_PLACEHOLDER = '<config_file>'
+
+# Attributes taken over from the wrapped linter bear unless the batched bear
+# defines them itself.
+INHERITED_ATTRIBUTES = ('LANGUAGES', 'REQUIREMENTS', 'AUTHORS',
+                        'AUTHORS_EMAILS', 'LICENSE', 'CAN_DETECT', 'CAN_FIX',
+                        'ASCIINEMA_URL', 'SEE_MORE')
+
+
+def get_max_arguments_length():
+    """
+    Returns the number of characters the command line of a single linter
+    invocation may take up.
+
+    On POSIX systems this is half of ``SC_ARG_MAX`` minus the size of the
+    environment, elsewhere the Windows command line limit is used.
+
+    :return: The maximum length of all arguments joined by spaces.
+    """
+    try:
+        limit = os.sysconf('SC_ARG_MAX') // 2
+    except (AttributeError, ValueError, OSError):  # pragma: no cover
+        return 32767 // 2
+
+    environment_length = sum(len(key) + len(value) + 2
+                             for key, value in os.environ.items())
+    return max(limit - environment_length, 4096)
+
+
+def chunk_filenames(filenames, fixed_length, max_length):
+    """
+    Splits the given filenames into chunks whose command line does not exceed
+    ``max_length``.
+
+    >>> list(chunk_filenames(['a', 'b', 'c'], 4, 8))
+    [['a', 'b'], ['c']]
+
+    A filename exceeding the limit on its own still gets a chunk:
+
+    >>> list(chunk_filenames(['long_name'], 4, 8))
+    [['long_name']]
+
+    :param filenames:    The filenames to split.
+    :param fixed_length: The length of the command line without any
+                         filenames.
+    :param max_length:   The maximum length of the command line.
+    :return:             An iterator yielding lists of filenames.
+    """
+    chunk = []
+    length = fixed_length
+    for filename in filenames:
+        size = len(filename) + 1
+        if chunk and length + size > max_length:
+            yield chunk
+            chunk = []
+            length = fixed_length
+        chunk.append(filename)
+        length += size
+
+    if chunk:
+        yield chunk
+
+
+def _in_process_batch_settings(in_process_jobs: int=1):
+    """
+    :param in_process_jobs:
+        The number of processes to check the files in when running the tool
+        in process. ``0`` starts one process per CPU.
+    """
+
+
+def _run_engine(task):
+    engine, arguments, filename, file = task
+    return engine(arguments, filename, file)
+
+
+def _create_batched_linter(klass, linter_bear, options):
+    if (options['output_filename_regex'] is None and
+            not callable(getattr(klass, 'split_output', None))):
+        raise ValueError('Neither `output_filename_regex` nor '
+                         '`split_output` provided by given class '
+                         '{!r}.'.format(klass.__name__))
+
+    options['output_filename_regex'] = (
+        None if options['output_filename_regex'] is None
+        else re.compile(options['output_filename_regex']))
+
+    class BatchedLinterBase(GlobalBear):
+
+        def __init__(self, file_dict, section, message_queue, timeout=0):
+            GlobalBear.__init__(self, file_dict, section, message_queue,
+                                timeout)
+            self.linter = linter_bear(section, message_queue, timeout)
+            self.max_arguments_length = get_max_arguments_length()
+
+        @classmethod
+        def check_prerequisites(cls):
+            return linter_bear.check_prerequisites()
+
+        @classmethod
+        def get_metadata(cls):
+            metadata = linter_bear.get_metadata()
+            if hasattr(linter_bear, 'in_process_engine'):
+                metadata = FunctionMetadata.merge(
+                    metadata,
+                    FunctionMetadata.from_function(
+                        _in_process_batch_settings))
+            metadata.desc = inspect.getdoc(cls)
+            return metadata
+
+        @staticmethod
+        def create_batch_arguments(arguments):
+            """
+            Adapts the arguments of a single-file invocation for use with
+            several files. The arguments are used unchanged by default.
+
+            :param arguments:
+                The arguments as given by ``create_arguments()``.
+            :return:
+                A tuple of arguments for the batched invocation.
+            """
+            return arguments
+
+        def split_output(self, output, filenames):
+            """
+            Splits the output of a batched invocation into the outputs of the
+            single files.
+
+            Each line starting with one of the given filenames (as matched by
+            the ``filename`` group of ``output_filename_regex``) is assigned
+            to that file, all other lines belong to the file named last.
+            Relative filenames in the output are resolved against the
+            directory the linter runs in.
+
+            :param output:
+                The output of one stream of the linter.
+            :param filenames:
+                The filenames the linter was invoked with.
+            :return:
+                A dict mapping each filename to its output.
+            """
+            directory = self.get_config_dir() or os.getcwd()
+            paths = {os.path.normpath(os.path.join(directory, filename)):
+                     filename for filename in filenames}
+            outputs = OrderedDict((filename, []) for filename in filenames)
+            current = None
+            for line in output.splitlines(keepends=True):
+                match = options['output_filename_regex'].match(line)
+                filename = match and paths.get(os.path.normpath(
+                    os.path.join(directory, match.group('filename'))))
+                if filename:
+                    current = filename
+                    if options['strip_filename']:
+                        line = line[match.end():]
+                if current is not None:
+                    outputs[current].append(line)
+
+            return {filename: ''.join(lines)
+                    for filename, lines in outputs.items()}
+
+        @staticmethod
+        def get_batch_key(filename, file):
+            """
+            Returns a key files have to share to be checked in the same
+            invocation, in addition to their config and arguments. All files
+            share the same key by default.
+
+            :param filename: The name of the file.
+            :param file:     The lines of the file.
+            :return:         A hashable key.
+            """
+            return None
+
+        def _group_files(self, generate_config_kwargs,
+                         create_arguments_kwargs):
+            """
+            Groups the files by their batch key and the config and
+            arguments they need.
+
+            :return:
+                A tuple of an ``OrderedDict`` mapping each group key to its
+                filenames and a list of the files that cannot be batched.
+            """
+            groups = OrderedDict()
+            single_files = []
+            for filename in sorted(self.file_dict):
+                file = self.file_dict[filename]
+                config = self.linter.generate_config(
+                    filename, file, **generate_config_kwargs)
+                try:
+                    args = tuple(self.linter.create_arguments(
+                        filename, file,
+                        None if config is None else CONFIG_FILE_PLACEHOLDER,
+                        **create_arguments_kwargs))
+                except TypeError:
+                    args = ()
+
+                if args.count(filename) != 1:
+                    single_files.append(filename)
+                    continue
+
+                position = args.index(filename)
+                key = (self.get_batch_key(filename, file),
+                       config, args[:position], args[position + 1:])
+                groups.setdefault(key, []).append(filename)
+
+            return groups, single_files
+
+        def _run_group(self, filenames, generate_config_kwargs,
+                       create_arguments_kwargs, process_output_kwargs):
+            first_filename = filenames[0]
+            first_file = self.file_dict[first_filename]
+            with self.linter._create_config(
+                    first_filename,
+                    first_file,
+                    **generate_config_kwargs) as config_file:
+                args = tuple(self.linter.create_arguments(
+                    first_filename, first_file, config_file,
+                    **create_arguments_kwargs))
+                position = args.index(first_filename)
+                prefix = tuple(self.create_batch_arguments(
+                    (self.linter.get_executable(),) + args[:position]))
+                suffix = tuple(self.create_batch_arguments(
+                    args[position + 1:]))
+                fixed_length = sum(len(str(arg)) + 1
+                                   for arg in prefix + suffix)
+
+                for chunk in chunk_filenames(filenames, fixed_length,
+                                             self.max_arguments_length):
+                    arguments = prefix + tuple(chunk) + suffix
+                    self.debug("Running '{}'".format(
+                        ' '.join(str(arg) for arg in arguments)))
+
+                    output = run_shell_command(arguments,
+                                               cwd=self.get_config_dir())
+                    output = tuple(compress(
+                        output,
+                        (options['use_stdout'], options['use_stderr'])))
+                    outputs = [self.split_output(stream, chunk)
+                               for stream in output]
+
+                    for filename in chunk:
+                        file_output = tuple(stream_outputs[filename]
+                                            for stream_outputs in outputs)
+                        if len(file_output) == 1:
+                            file_output = file_output[0]
+
+                        yield from self.linter.process_output(
+                            file_output, filename, self.file_dict[filename],
+                            **process_output_kwargs)
+
+        def _run_in_process(self, jobs, generate_config_kwargs,
+                            create_arguments_kwargs, process_output_kwargs):
+            tasks = []
+            with ExitStack() as stack:
+                for filename in sorted(self.file_dict):
+                    file = self.file_dict[filename]
+                    config_file = stack.enter_context(
+                        self.linter._create_config(
+                            filename, file, **generate_config_kwargs))
+                    args = self.linter.create_arguments(
+                        filename, file, config_file,
+                        **create_arguments_kwargs)
+                    try:
+                        args = tuple(args)
+                    except TypeError:
+                        self.err('The given arguments '
+                                 '{!r} are not iterable.'.format(args))
+                        continue
+                    tasks.append((self.linter.in_process_engine, args,
+                                  filename, file))
+
+                if jobs == 1:
+                    outputs = map(_run_engine, tasks)
+                else:
+                    processes = jobs or os.cpu_count() or 1
+                    pool = stack.enter_context(Pool(processes))
+                    chunk_size = max(len(tasks) // (processes * 4), 1)
+                    outputs = pool.imap(_run_engine, tasks, chunk_size)
+
+                for (_, _, filename, file), output in zip(tasks, outputs):
+                    yield from self.linter.process_output(
+                        output, filename, file, **process_output_kwargs)
+
+        def run(self, in_process_jobs=1, **kwargs):
+            """
+            Runs the wrapped linter once per group of files sharing the same
+            arguments, splitting the command line into several invocations
+            if it gets too long.
+
+            Files whose arguments do not contain the filename as a separate
+            argument are linted one by one.
+
+            Linters able to run their tool in process check all files in
+            process instead, optionally spread over ``in_process_jobs``
+            processes which import the tool only once.
+            """
+            generate_config_kwargs = FunctionMetadata.filter_parameters(
+                self.linter._get_generate_config_metadata(), kwargs)
+            create_arguments_kwargs = FunctionMetadata.filter_parameters(
+                self.linter._get_create_arguments_metadata(), kwargs)
+            process_output_kwargs = FunctionMetadata.filter_parameters(
+                self.linter._get_process_output_metadata(), kwargs)
+
+            if (kwargs.get('in_process', True) and
+                    hasattr(self.linter, 'in_process_engine')):
+                yield from self._run_in_process(in_process_jobs,
+                                                generate_config_kwargs,
+                                                create_arguments_kwargs,
+                                                process_output_kwargs)
+                return
+
+            groups, single_files = self._group_files(
+                generate_config_kwargs, create_arguments_kwargs)
+
+            for filenames in groups.values():
+                yield from self._run_group(filenames,
+                                           generate_config_kwargs,
+                                           create_arguments_kwargs,
+                                           process_output_kwargs)
+
+            for filename in single_files:
+                yield from self.linter.run(filename,
+                                           self.file_dict[filename],
+                                           **kwargs) or ()
+
+        def __repr__(self):
+            return '<{} batched linter object (wrapping {!r}) at {}>'.format(
+                type(self).__name__, linter_bear.get_executable(),
+                hex(id(self)))
+
+    for attribute in INHERITED_ATTRIBUTES:
+        if hasattr(linter_bear, attribute):
+            setattr(BatchedLinterBase, attribute,
+                    getattr(linter_bear, attribute))
+
+    result_klass = type(klass.__name__, (klass, BatchedLinterBase), {
+        '__module__': klass.__module__})
+    result_klass.__doc__ = klass.__doc__ or ''
+    return result_klass
+
+
+def batched_linter(linter_bear,
+                   output_filename_regex: str=None,
+                   use_stdout: bool=True,
+                   use_stderr: bool=False,
+                   strip_filename: bool=False):
+    """
+    Decorator that creates a ``GlobalBear`` running the executable of the
+    given ``@linter`` bear once for many files instead of once per file.
+
+    Files are grouped by their generated config file and the arguments
+    ``create_arguments()`` returns for them, with the filename as the only
+    difference. Each group is run in as few invocations as the maximum
+    command line length allows. The output is then split back per file and
+    handed to the ``process_output()`` of the wrapped bear, so the results
+    are the same as those of the wrapped bear.
+
+    >>> from bears.python.PyFlakesBear import PyFlakesBear
+    >>> @batched_linter(PyFlakesBear,
+    ...                 output_filename_regex=r'(?P<filename>.+?):\\d+:',
+    ...                 use_stderr=True)
+    ... class PyFlakesBatchBear:
+    ...     '''Checks many Python files at once.'''
+    >>> PyFlakesBatchBear.LANGUAGES == PyFlakesBear.LANGUAGES
+    True
+
+    Bears whose output cannot be split by a regex can override
+    ``split_output()``, bears needing different arguments for batched
+    invocations can override ``create_batch_arguments()`` and bears that may
+    only check certain files together, e.g. those of one package, can
+    override ``get_batch_key()``.
+
+    :param linter_bear:
+        The ``@linter`` bear class to batch.
+    :param output_filename_regex:
+        The regex used to find the filename in each output line. It has to
+        contain a ``filename`` group and is matched at the start of the line.
+    :param use_stdout:
+        Whether the wrapped bear uses the stdout of the executable.
+    :param use_stderr:
+        Whether the wrapped bear uses the stderr of the executable.
+    :param strip_filename:
+        Whether to strip the part matched by ``output_filename_regex`` from
+        each line before processing it. Useful for executables only
+        prefixing the filename when given several files.
+    :return:
+        A decorator creating the batched bear class.
+    """
+    options = {'output_filename_regex': output_filename_regex,
+               'use_stdout': use_stdout,
+               'use_stderr': use_stderr,
+               'strip_filename': strip_filename}
+
+    if not use_stdout and not use_stderr:
+        raise ValueError('No output streams provided at all.')
+
+    def create_batched_linter(klass):
+        return _create_batched_linter(klass, linter_bear, options)
+
+    return create_batched_linter
@@ -0,0 +1,308 @@
+import argparse
+from collections import OrderedDict
+from contextlib import contextmanager
+import json
+import os
+import threading
+import time
+
+from coalib.misc import Shell
+from coalib.results.HiddenResult import HiddenResult
+from coalib.settings.FunctionMetadata import FunctionMetadata
+
+
+def _instrumentation_settings(instrumentation_file: str='',
+                              instrumentation_result: bool=False):
+    """
+    :param instrumentation_file:
+        The path of a JSON lines file to append a timing record to for every
+        run of the bear.
+    :param instrumentation_result:
+        Whether to yield the timing record of every run of the bear in a
+        ``HiddenResult``.
+    """
+
+
+INSTRUMENTATION_METADATA = FunctionMetadata.from_function(
+    _instrumentation_settings)
+
+# The fields of the records that are summed up when aggregating them.
+SUMMED_FIELDS = ('wall_time', 'cpu_time', 'subprocesses', 'spawn_time',
+                 'wait_time', 'bytes', 'results')
+
+
+def new_record(bear, filename, size):
+    """
+    Creates a timing record with all measurements set to zero.
+
+    >>> new_record('SpaceConsistencyBear', 'a.py', 42)['bytes']
+    42
+
+    :param bear:     The name of the bear.
+    :param filename: The name of the file checked or ``None`` for global
+                     bears.
+    :param size:     The number of bytes processed.
+    :return:         An ``OrderedDict`` holding the record.
+    """
+    record = OrderedDict((('bear', bear), ('file', filename)))
+    record.update((field, 0) for field in SUMMED_FIELDS)
+    record['bytes'] = size
+    return record
+
+
+@contextmanager
+def measure_subprocesses(record):
+    """
+    Adds the number of subprocesses started through ``coalib.misc.Shell``
+    within the context, and the time spent starting them and waiting for
+    them, to the given record. This is how ``@linter`` bears and the
+    batched bears run their executables.
+
+    Only subprocesses started by the thread entering the context are
+    counted. Still, ``Popen`` of ``coalib.misc.Shell`` is replaced for the
+    whole process while the context is active, so it is meant for measuring
+    runs, not to stay enabled in production. Subprocesses started with the
+    ``subprocess`` module directly, e.g. by ``platform``, are not counted.
+
+    >>> import subprocess, sys
+    >>> record = new_record('Bear', None, 0)
+    >>> with measure_subprocesses(record):
+    ...     _ = Shell.run_shell_command((sys.executable, '-c', 'pass'))
+    ...     _ = subprocess.call((sys.executable, '-c', 'pass'))
+    >>> record['subprocesses']
+    1
+
+    :param record: The record to add the measurements to.
+    """
+    original_popen = getattr(Shell, 'Popen', None)
+    if original_popen is None:  # pragma: no cover
+        yield record
+        return
+
+    thread = threading.get_ident()
+
+    class TimedPopen(original_popen):
+
+        def __init__(self, *args, **kwargs):
+            self._measured = threading.get_ident() == thread
+            self._waiting = False
+            if not self._measured:
+                super().__init__(*args, **kwargs)
+                return
+
+            start = time.perf_counter()
+            try:
+                super().__init__(*args, **kwargs)
+            finally:
+                record['spawn_time'] += time.perf_counter() - start
+            record['subprocesses'] += 1
+
+        def _timed(self, method, *args, **kwargs):
+            # communicate() calls wait(), which must not be counted twice.
+            if not self._measured or self._waiting:
+                return method(*args, **kwargs)
+            self._waiting = True
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                record['wait_time'] += time.perf_counter() - start
+                self._waiting = False
+
+        def communicate(self, *args, **kwargs):
+            return self._timed(super().communicate, *args, **kwargs)
+
+        def wait(self, *args, **kwargs):
+            return self._timed(super().wait, *args, **kwargs)
+
+    Shell.Popen = TimedPopen
+    try:
+        yield record
+    finally:
+        Shell.Popen = original_popen
+
+
+class InstrumentedBearMixin:
+    """
+    Mixin measuring every run of a ``LocalBear``, ``GlobalBear`` or
+    ``@linter`` bear. It has to come before the bear class in the bases.
+
+    The measurements are only taken if the ``instrumentation_file`` or the
+    ``instrumentation_result`` setting is given. Every run then produces a
+    record holding the wall and CPU time of the bear, the number of
+    subprocesses it started through ``coalib.misc.Shell`` along with the
+    time spent starting them and waiting for them (see
+    ``measure_subprocesses``), the number of bytes it checked and the number
+    of results it yielded.
+    """
+
+    def run_bear_from_section(self, args, kwargs):
+        settings = INSTRUMENTATION_METADATA.create_params_from_section(
+            self.section)
+        instrumentation_file = settings.get('instrumentation_file', '')
+        instrumentation_result = settings.get('instrumentation_result', False)
+        if not instrumentation_file and not instrumentation_result:
+            return super().run_bear_from_section(args, kwargs)
+
+        if len(args) >= 2:
+            filename, files = args[0], (args[1],)
+        else:
+            filename, files = None, getattr(self, 'file_dict', {}).values()
+        record = new_record(
+            self.name, filename,
+            sum(len(line.encode('utf-8', 'surrogateescape'))
+                for file in files for line in file))
+
+        with measure_subprocesses(record):
+            start_wall, start_cpu = time.perf_counter(), time.process_time()
+            results = list(super().run_bear_from_section(args, kwargs) or ())
+            record['wall_time'] = time.perf_counter() - start_wall
+            record['cpu_time'] = time.process_time() - start_cpu
+        record['results'] = len(results)
+
+        if instrumentation_file:
+            write_record(instrumentation_file, record)
+        if instrumentation_result:
+            results.append(HiddenResult(self, record))
+        return results
+
+
+def instrumented_bear(bear):
+    """
+    Decorator measuring every run of a ``LocalBear``, ``GlobalBear`` or
+    ``@linter`` bear, see ``InstrumentedBearMixin``.
+
+    :param bear: The bear class to measure.
+    :return:     A subclass of the bear taking the measurements.
+    """
+    class InstrumentedBear(InstrumentedBearMixin, bear):
+        pass
+
+    InstrumentedBear.__name__ = bear.__name__
+    InstrumentedBear.__qualname__ = bear.__qualname__
+    InstrumentedBear.__module__ = bear.__module__
+    InstrumentedBear.__doc__ = bear.__doc__
+    return InstrumentedBear
+
+
+def write_record(path, record):
+    """
+    Appends a record to a JSON lines file. Each record is written with a
+    single call, so processes can share the file.
+
+    :param path:   The path of the file.
+    :param record: The record to append.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, 'a') as file:
+        file.write(json.dumps(record) + '\n')
+
+
+def read_records(path):
+    """
+    Reads the records of a JSON lines file, skipping lines that are cut off
+    or otherwise broken.
+
+    :param path: The path of the file.
+    :return:     A list of the records.
+    """
+    records = []
+    with open(path) as file:
+        for line in file:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def aggregate_records(records, key=('bear', 'file')):
+    """
+    Sums up the measurements of all records with the same values for the
+    given fields, slowest first.
+
+    >>> records = [new_record('A', 'x', 1), new_record('A', 'x', 2),
+    ...            new_record('B', 'x', 5)]
+    >>> records[0]['wall_time'] = 1.0
+    >>> [(entry['bear'], entry['bytes'], entry['runs'])
+    ...  for entry in aggregate_records(records)]
+    [('A', 3, 2), ('B', 5, 1)]
+    >>> [entry['bytes'] for entry in aggregate_records(records, ('file',))]
+    [8]
+
+    :param records: The records to aggregate.
+    :param key:     The fields to group the records by.
+    :return:        A list of the aggregated records, sorted by wall time in
+                    descending order. Each of them holds the grouped fields,
+                    the sums of the measurements and the number of ``runs``.
+    """
+    entries = OrderedDict()
+    for record in records:
+        group = tuple(record.get(field) for field in key)
+        if group not in entries:
+            entries[group] = OrderedDict(zip(key, group))
+            entries[group].update((field, 0) for field in SUMMED_FIELDS)
+            entries[group]['runs'] = 0
+        entry = entries[group]
+        for field in SUMMED_FIELDS:
+            entry[field] += record.get(field, 0)
+        entry['runs'] += 1
+
+    return sorted(entries.values(), key=lambda entry: -entry['wall_time'])
+
+
+def format_report(records, count=20):
+    """
+    Formats a report of the bears and bear/file pairs taking the most time.
+
+    :param records: The records to report on.
+    :param count:   The number of bear/file pairs to list.
+    :return:        A list of the lines of the report.
+    """
+    row = ('{:<40} {:>9.3f}s {:>9.3f}s {:>5} {:>9.3f}s {:>9.3f}s {:>10} '
+           '{:>7}')
+    header = ('{:<40} {:>10} {:>10} {:>5} {:>10} {:>10} {:>10} {:>7}'.format(
+        '', 'wall', 'cpu', 'procs', 'spawn', 'wait', 'bytes', 'results'))
+
+    def format_entry(name, entry):
+        return row.format(name[-40:], entry['wall_time'], entry['cpu_time'],
+                          entry['subprocesses'], entry['spawn_time'],
+                          entry['wait_time'], entry['bytes'],
+                          entry['results'])
+
+    lines = ['Bears by total time:', header]
+    lines += [format_entry(entry['bear'], entry)
+              for entry in aggregate_records(records, ('bear',))]
+    lines += ['', 'Slowest bear/file pairs:', header]
+    for entry in aggregate_records(records)[:count]:
+        lines.append(format_entry(entry['bear'], entry))
+        if entry['file'] is not None:
+            lines.append('  ' + entry['file'])
+    return lines
+
+
+def create_arg_parser():
+    """
+    Creates a parser for command line arguments.
+
+    :return: Parser arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description='Reports the slowest bears and bear/file pairs of the '
+                    'runs recorded in an instrumentation file.')
+    parser.add_argument('file', help='JSON lines file written by bears with '
+                                     'the instrumentation_file setting')
+    parser.add_argument('--count', '-c', type=int, default=20,
+                        help='number of bear/file pairs to list')
+    return parser
+
+
+def main():
+    args = create_arg_parser().parse_args()
+    for line in format_report(read_records(args.file), args.count):
+        print(line)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
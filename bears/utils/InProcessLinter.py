@@ -0,0 +1,127 @@
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+import io
+import logging
+import sys
+
+from coalib.settings.FunctionMetadata import FunctionMetadata
+
+
+@contextmanager
+def captured_output(argv=None):
+    """
+    Captures everything written to ``sys.stdout`` and ``sys.stderr`` and
+    optionally replaces ``sys.argv``, so command line tools can be run from
+    within the process.
+
+    >>> with captured_output(['tool', '--flag']) as (stdout, stderr):
+    ...     print(sys.argv[1:])
+    >>> stdout.getvalue()
+    "['--flag']\\n"
+
+    :param argv: The arguments to set as ``sys.argv`` or ``None`` to keep
+                 them.
+    :return:     A context manager yielding ``StringIO`` objects for stdout
+                 and stderr.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    original_argv = sys.argv
+    if argv is not None:
+        sys.argv = list(argv)
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            yield stdout, stderr
+    finally:
+        sys.argv = original_argv
+
+
+def log_exit(tool, error, stderr):
+    """
+    Logs what a tool printed on stderr before exiting with an error, e.g.
+    because of invalid options, as its executable would have shown it.
+
+    :param tool:   The name of the tool.
+    :param error:  The ``SystemExit`` raised by the tool.
+    :param stderr: What the tool printed on stderr.
+    """
+    if error.code not in (None, 0):
+        logging.error('{} exited with {}: {}'.format(
+            tool, error.code, stderr.strip()))
+
+
+def _in_process_settings(in_process: bool=True):
+    """
+    :param in_process:
+        Whether to run the tool within the process of coala instead of
+        starting its executable for every file.
+    """
+
+
+def in_process_linter(engine):
+    """
+    Decorator making a ``@linter`` bear wrapping a pure Python tool run that
+    tool within the process instead of starting its executable.
+
+    ``engine(arguments, filename, file)`` has to emulate the executable: it
+    gets the arguments returned by ``create_arguments()`` and returns the
+    output the executable would give, as a string or as a tuple of stdout
+    and stderr, depending on the streams the bear uses. The output is handed
+    to ``process_output()``, so the results are the same in both modes. The
+    engine has to be a module level function, so batched bears can send it
+    to other processes.
+
+    :param engine: The function emulating the executable.
+    :return:       A decorator creating the in-process bear class.
+    """
+    def create_in_process_linter(bear):
+
+        class InProcessLinter(bear):
+
+            in_process_engine = staticmethod(engine)
+
+            @classmethod
+            def get_metadata(cls):
+                metadata = super().get_metadata()
+                merged_metadata = FunctionMetadata.merge(
+                    metadata,
+                    FunctionMetadata.from_function(_in_process_settings))
+                merged_metadata.desc = metadata.desc
+                return merged_metadata
+
+            def run(self, filename=None, file=None, in_process=True,
+                    **kwargs):
+                if not in_process or filename is None:
+                    return super().run(filename, file, **kwargs)
+
+                generate_config_kwargs = FunctionMetadata.filter_parameters(
+                    self._get_generate_config_metadata(), kwargs)
+                create_arguments_kwargs = FunctionMetadata.filter_parameters(
+                    self._get_create_arguments_metadata(), kwargs)
+                process_output_kwargs = FunctionMetadata.filter_parameters(
+                    self._get_process_output_metadata(), kwargs)
+
+                with self._create_config(
+                        filename,
+                        file,
+                        **generate_config_kwargs) as config_file:
+                    args = self.create_arguments(filename, file, config_file,
+                                                 **create_arguments_kwargs)
+                    try:
+                        args = tuple(args)
+                    except TypeError:
+                        self.err('The given arguments '
+                                 '{!r} are not iterable.'.format(args))
+                        return
+
+                    self.debug('Running {} in process with {!r}'.format(
+                        self.get_executable(), args))
+                    output = engine(args, filename, file)
+                    return self.process_output(output, filename, file,
+                                               **process_output_kwargs)
+
+        InProcessLinter.__name__ = bear.__name__
+        InProcessLinter.__qualname__ = bear.__qualname__
+        InProcessLinter.__module__ = bear.__module__
+        InProcessLinter.__doc__ = bear.__doc__
+        return InProcessLinter
+
+    return create_in_process_linter
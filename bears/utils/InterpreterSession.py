@@ -0,0 +1,228 @@
+from multiprocessing.util import Finalize
+import os
+from subprocess import DEVNULL, PIPE, Popen, TimeoutExpired
+from uuid import uuid4
+
+from coalib.settings.FunctionMetadata import FunctionMetadata
+
+
+# The environment variable telling the session loop which line to print
+# after the output of each evaluated line of code.
+DELIMITER_VARIABLE = 'COALA_SESSION_DELIMITER'
+
+# Reads lines of Julia code from stdin and evaluates them one by one.
+JULIA_SESSION_LOOP = (
+    'delimiter = ENV["' + DELIMITER_VARIABLE + '"]; '
+    'while !eof(STDIN) '
+    'try eval(parse(readline(STDIN))) '
+    'catch error println(STDERR, error) end; '
+    'print("\\n", delimiter, "\\n"); flush(STDOUT) end')
+
+# Reads lines of R code from stdin and evaluates them one by one, printing
+# visible values like ``Rscript -e`` does.
+R_SESSION_LOOP = (
+    'delimiter <- Sys.getenv("' + DELIMITER_VARIABLE + '"); '
+    'input <- file("stdin"); open(input); '
+    'while (length(line <- readLines(input, n=1)) > 0) { '
+    'tryCatch({ result <- withVisible(eval(parse(text=line))); '
+    'if (result$visible) print(result$value) }, '
+    'error=function(error) message(conditionMessage(error))); '
+    'cat("\\n", delimiter, "\\n", sep=""); flush(stdout()) }')
+
+_sessions = {}
+
+
+class InterpreterSession:
+    """
+    A long-running interpreter process evaluating one line of code at a time.
+
+    The interpreter is started with the given arguments, which have to run a
+    loop reading lines of code from stdin, evaluating each and printing an
+    empty line and the value of the ``COALA_SESSION_DELIMITER`` environment
+    variable after it, like ``JULIA_SESSION_LOOP`` and ``R_SESSION_LOOP`` do.
+
+    >>> import sys
+    >>> session = InterpreterSession(
+    ...     (sys.executable, '-c',
+    ...      'import os, sys\\n'
+    ...      'for line in sys.stdin:\\n'
+    ...      '    exec(line)\\n'
+    ...      '    print("\\\\n" + os.environ["COALA_SESSION_DELIMITER"],'
+    ...      ' flush=True)'))
+    >>> session.evaluate('value = 6 * 7')
+    ''
+    >>> session.evaluate('print(value)')
+    '42\\n'
+    >>> session.close()
+    """
+
+    def __init__(self, arguments, cwd=None):
+        """
+        :param arguments: The command starting the interpreter loop.
+        :param cwd:       The working directory of the interpreter.
+        """
+        self.arguments = tuple(arguments)
+        self.cwd = cwd
+        self.delimiter = uuid4().hex
+        self.process = None
+
+    def start(self):
+        """
+        Starts the interpreter, closing the previous one if any.
+        """
+        self.close()
+        self.process = Popen(self.arguments,
+                             stdin=PIPE,
+                             stdout=PIPE,
+                             stderr=DEVNULL,
+                             cwd=self.cwd,
+                             env=dict(os.environ,
+                                      **{DELIMITER_VARIABLE: self.delimiter}),
+                             universal_newlines=True)
+
+    def evaluate(self, code):
+        """
+        Evaluates the given code in the interpreter, starting it if it is
+        not running. The interpreter is restarted on the next evaluation if
+        it exits while evaluating the code.
+
+        :param code: The code to evaluate, newlines are replaced by spaces.
+        :return:     Everything printed to stdout while evaluating the code.
+        """
+        if self.process is None or self.process.poll() is not None:
+            self.start()
+
+        try:
+            self.process.stdin.write(code.replace('\n', ' ') + '\n')
+            self.process.stdin.flush()
+        except BrokenPipeError:
+            self.close()
+            return ''
+
+        lines = []
+        for line in self.process.stdout:
+            if line.rstrip('\n') == self.delimiter:
+                # Drop the newline printed in front of the delimiter.
+                return ''.join(lines)[:-1]
+            lines.append(line)
+
+        self.close()
+        return ''.join(lines)
+
+    def close(self):
+        """
+        Stops the interpreter, if it is running.
+        """
+        if self.process is None:
+            return
+
+        process, self.process = self.process, None
+        try:
+            process.stdin.close()
+        except BrokenPipeError:  # pragma: no cover
+            pass
+        try:
+            process.wait(timeout=5)
+        except TimeoutExpired:  # pragma: no cover
+            process.kill()
+            process.wait()
+        process.stdout.close()
+
+
+def get_session(arguments, cwd=None):
+    """
+    Returns the session of the current process for the given command and
+    working directory, creating it if needed. All sessions are closed when
+    the process exits.
+
+    :param arguments: The command starting the interpreter loop.
+    :param cwd:       The working directory of the interpreter.
+    :return:          The ``InterpreterSession``.
+    """
+    key = (os.getpid(), tuple(arguments), cwd)
+    if key not in _sessions:
+        if not any(pid == os.getpid() for pid, _, _ in _sessions):
+            Finalize(None, close_sessions, exitpriority=10)
+        _sessions[key] = InterpreterSession(arguments, cwd)
+    return _sessions[key]
+
+
+def close_sessions():
+    """
+    Closes all sessions started by the current process.
+    """
+    for key in [key for key in _sessions if key[0] == os.getpid()]:
+        _sessions.pop(key).close()
+
+
+def _session_settings(use_session: bool=True):
+    """
+    :param use_session:
+        Whether to keep one interpreter running for all files, loading the
+        required packages only once, instead of starting it for every file.
+    """
+
+
+def interpreter_session(*session_arguments):
+    """
+    Decorator making a ``@linter`` bear wrapping an interpreter evaluate the
+    code for each file in a long-running ``InterpreterSession`` instead of
+    starting the interpreter for every file.
+
+    The code evaluated for each file is the last argument returned by
+    ``create_arguments()``, usually following an ``-e`` option. Its stdout is
+    passed to ``process_output()`` as if the interpreter was run with the
+    arguments of the bear.
+
+    :param session_arguments: The arguments to start the interpreter loop
+                              with, e.g. ``('-e', R_SESSION_LOOP)``.
+    :return:                  A decorator creating the session bear class.
+    """
+    def create_session_linter(bear):
+
+        class SessionLinter(bear):
+
+            @classmethod
+            def get_metadata(cls):
+                metadata = super().get_metadata()
+                merged_metadata = FunctionMetadata.merge(
+                    metadata,
+                    FunctionMetadata.from_function(_session_settings))
+                merged_metadata.desc = metadata.desc
+                return merged_metadata
+
+            def run(self, filename=None, file=None, use_session=True,
+                    **kwargs):
+                if not use_session or filename is None:
+                    return super().run(filename, file, **kwargs)
+
+                generate_config_kwargs = FunctionMetadata.filter_parameters(
+                    self._get_generate_config_metadata(), kwargs)
+                create_arguments_kwargs = FunctionMetadata.filter_parameters(
+                    self._get_create_arguments_metadata(), kwargs)
+                process_output_kwargs = FunctionMetadata.filter_parameters(
+                    self._get_process_output_metadata(), kwargs)
+
+                with self._create_config(
+                        filename,
+                        file,
+                        **generate_config_kwargs) as config_file:
+                    args = tuple(self.create_arguments(
+                        filename, file, config_file,
+                        **create_arguments_kwargs))
+                    session = get_session(
+                        (self.get_executable(),) + session_arguments,
+                        self.get_config_dir())
+                    self.debug('Evaluating {!r} in session.'.format(
+                        args[-1]))
+                    output = session.evaluate(args[-1])
+                    return self.process_output(output, filename, file,
+                                               **process_output_kwargs)
+
+        SessionLinter.__name__ = bear.__name__
+        SessionLinter.__qualname__ = bear.__qualname__
+        SessionLinter.__module__ = bear.__module__
+        SessionLinter.__doc__ = bear.__doc__
+        return SessionLinter
+
+    return create_session_linter
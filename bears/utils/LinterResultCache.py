@@ -0,0 +1,357 @@
+import atexit
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+
+from appdirs import user_cache_dir
+
+from coalib.misc.Shell import run_shell_command
+from coalib.settings.FunctionMetadata import FunctionMetadata
+
+from bears.utils.BatchedLinter import CONFIG_FILE_PLACEHOLDER
+
+
+DEFAULT_CACHE_FILE = os.path.join(user_cache_dir('coala-bears'),
+                                  'linter_results.sqlite3')
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+# SQLite limits the number of parameters of a query to 999 by default.
+MAX_QUERY_KEYS = 500
+
+_executable_versions = {}
+
+
+def get_executable_version(executable):
+    """
+    Returns the version string of the given executable, as printed by
+    ``executable --version``. The result is remembered for the lifetime of the
+    process.
+
+    :param executable: The executable to get the version of.
+    :return:           The output of the executable on both streams.
+    """
+    if executable not in _executable_versions:
+        try:
+            stdout, stderr = run_shell_command((executable, '--version'))
+        except OSError:
+            stdout, stderr = '', ''
+        _executable_versions[executable] = stdout + stderr
+
+    return _executable_versions[executable]
+
+
+class ResultCache:
+    """
+    A size-bounded store for pickled bear results, kept in an SQLite database
+    so it can be shared between processes and runs. When the total size of
+    the stored results exceeds ``max_size``, the least recently used entries
+    are evicted.
+
+    Lookups do not write to the database. The times entries were last used
+    at are kept in memory and written along with the next stored results or
+    when the cache is closed.
+
+    >>> from tempfile import TemporaryDirectory
+    >>> with TemporaryDirectory() as directory:
+    ...     cache = ResultCache(os.path.join(directory, 'cache'))
+    ...     cache.get('key') is None
+    ...     cache.set('key', ['result'])
+    ...     cache.get('key')
+    ...     (cache.hits, cache.misses)
+    ...     cache.close()
+    True
+    ['result']
+    (1, 1)
+    """
+
+    def __init__(self, path, max_size=DEFAULT_MAX_SIZE):
+        """
+        :param path:     The path of the database file.
+        :param max_size: The maximum total size of all pickled results in
+                         bytes.
+        """
+        self.path = path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._pid = None
+        self._last_used = {}
+
+    @property
+    def connection(self):
+        """
+        The connection to the database, opened on first use in every process
+        so forked processes do not share it.
+        """
+        if self._connection is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)),
+                        exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=30)
+            self._pid = os.getpid()
+            self._last_used = {}
+            with self._connection:
+                self._connection.execute(
+                    'CREATE TABLE IF NOT EXISTS results ('
+                    'key TEXT PRIMARY KEY, value BLOB, size INTEGER, '
+                    'last_used REAL)')
+                self._connection.execute(
+                    'CREATE INDEX IF NOT EXISTS results_last_used '
+                    'ON results (last_used)')
+                # Holds the total size of all results in its only row, so it
+                # need not be summed up for every write.
+                self._connection.execute(
+                    'CREATE TABLE IF NOT EXISTS total_size (size INTEGER)')
+                if self._connection.execute(
+                        'SELECT * FROM total_size').fetchone() is None:
+                    self._connection.execute(
+                        'INSERT INTO total_size SELECT COALESCE(SUM(size), 0) '
+                        'FROM results')
+        return self._connection
+
+    def get(self, key):
+        """
+        Retrieves the results stored for the given key.
+
+        :param key: The key to look up.
+        :return:    The stored list of results or ``None`` if there is none.
+        """
+        return self.get_many((key,)).get(key)
+
+    def get_many(self, keys):
+        """
+        Retrieves the results stored for several keys.
+
+        :param keys: The keys to look up.
+        :return:     A dictionary mapping the keys results are stored for to
+                     the results.
+        """
+        keys = list(keys)
+        rows = []
+        try:
+            connection = self.connection
+            for start in range(0, len(keys), MAX_QUERY_KEYS):
+                chunk = keys[start:start + MAX_QUERY_KEYS]
+                rows += connection.execute(
+                    'SELECT key, value FROM results WHERE key IN '
+                    '({})'.format(', '.join('?' * len(chunk))),
+                    chunk).fetchall()
+        except sqlite3.Error:
+            rows = []
+
+        now = time.time()
+        found = {}
+        for key, value in rows:
+            try:
+                results = pickle.loads(value)
+            except (pickle.UnpicklingError, AttributeError, EOFError,
+                    ImportError):
+                continue
+            if results is not None:
+                found[key] = results
+                self._last_used[key] = now
+
+        self.hits += len(found)
+        self.misses += len(set(keys)) - len(found)
+        return found
+
+    def set(self, key, results):
+        """
+        Stores the given results and evicts the least recently used entries
+        if the cache grew too large.
+
+        :param key:     The key to store the results under.
+        :param results: The list of results to store.
+        """
+        self.set_many({key: results})
+
+    def set_many(self, results):
+        """
+        Stores the results for several keys in one transaction and evicts
+        the least recently used entries if the cache grew too large.
+
+        :param results: A dictionary mapping the keys to store results under
+                        to the results.
+        """
+        now = time.time()
+        rows = []
+        for key, value in results.items():
+            value = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            rows.append((key, value, len(value), now))
+        try:
+            with self.connection as connection:
+                self._write_last_used(connection)
+                # Replaced results do not count towards the total anymore.
+                keys = [row[0] for row in rows]
+                for start in range(0, len(keys), MAX_QUERY_KEYS):
+                    chunk = keys[start:start + MAX_QUERY_KEYS]
+                    connection.execute(
+                        'UPDATE total_size SET size = size - (SELECT '
+                        'COALESCE(SUM(size), 0) FROM results WHERE key IN '
+                        '({}))'.format(', '.join('?' * len(chunk))),
+                        chunk)
+                connection.executemany(
+                    'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)',
+                    rows)
+                connection.execute('UPDATE total_size SET size = size + ?',
+                                   (sum(row[2] for row in rows),))
+                self._evict(connection)
+        except sqlite3.Error:
+            pass
+
+    def _write_last_used(self, connection):
+        connection.executemany(
+            'UPDATE results SET last_used = ? WHERE key = ?',
+            [(last_used, key) for key, last_used in self._last_used.items()])
+        self._last_used = {}
+
+    def _evict(self, connection):
+        total, = connection.execute(
+            'SELECT size FROM total_size').fetchone()
+        if total <= self.max_size:
+            return
+
+        evicted = []
+        for key, size in connection.execute(
+                'SELECT key, size FROM results ORDER BY last_used'):
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+
+        connection.executemany('DELETE FROM results WHERE key = ?', evicted)
+        connection.execute('UPDATE total_size SET size = ?', (total,))
+
+    def close(self):
+        """
+        Writes the times entries were last used at and closes the
+        connection to the database, if any.
+        """
+        if self._connection is not None:
+            if self._last_used and self._pid == os.getpid():
+                try:
+                    with self._connection as connection:
+                        self._write_last_used(connection)
+                except sqlite3.Error:
+                    pass
+            self._connection.close()
+            self._connection = None
+
+
+result_cache = ResultCache(DEFAULT_CACHE_FILE)
+atexit.register(result_cache.close)
+
+
+def _result_cache_settings(use_result_cache: bool=True):
+    """
+    :param use_result_cache:
+        Whether to reuse the results of previous runs for files with the same
+        contents, settings and linter version instead of running the linter
+        again.
+    """
+
+
+def cached_linter(bear):
+    """
+    Decorator caching the results of a ``@linter`` bear in the shared
+    ``result_cache``, skipping the executable for files checked before.
+
+    The results are stored under a hash of the bear name, the filename, the
+    version of the executable, the file contents, the arguments, the
+    generated config file contents and the settings passed to
+    ``process_output()``. Bears with settings holding the paths of config
+    files name them in a ``RESULT_CACHE_FILE_SETTINGS`` tuple, so the
+    contents of these files are hashed as well. Use it only for bears whose
+    results depend on nothing else, e.g. not on config files the executable
+    looks up on its own or on other files of the project, like included
+    headers.
+
+    :param bear: The ``@linter`` bear class to cache the results of.
+    :return:     A subclass of the bear using the cache.
+    """
+    class CachedLinter(bear):
+
+        @classmethod
+        def get_metadata(cls):
+            metadata = super().get_metadata()
+            merged_metadata = FunctionMetadata.merge(
+                metadata,
+                FunctionMetadata.from_function(_result_cache_settings))
+            merged_metadata.desc = metadata.desc
+            return merged_metadata
+
+        def get_result_cache_key(self, filename, file, kwargs):
+            """
+            Computes the key the results for the given file are cached under.
+
+            :return: The key or ``None`` if the arguments cannot be created
+                     or a config file given in the settings cannot be read.
+            """
+            config_file_hashes = []
+            for name in getattr(self, 'RESULT_CACHE_FILE_SETTINGS', ()):
+                path = kwargs.get(name)
+                if not path:
+                    continue
+                try:
+                    with open(path, 'rb') as config_file:
+                        config_file_hashes.append(
+                            hashlib.sha256(config_file.read()).hexdigest())
+                except OSError:
+                    return None
+
+            config = self.generate_config(
+                filename, file,
+                **FunctionMetadata.filter_parameters(
+                    self._get_generate_config_metadata(), kwargs))
+            try:
+                args = tuple(self.create_arguments(
+                    filename, file,
+                    None if config is None else CONFIG_FILE_PLACEHOLDER,
+                    **FunctionMetadata.filter_parameters(
+                        self._get_create_arguments_metadata(), kwargs)))
+            except TypeError:
+                return None
+
+            process_output_kwargs = FunctionMetadata.filter_parameters(
+                self._get_process_output_metadata(), kwargs)
+            executable = self.get_executable()
+
+            key = hashlib.sha256()
+            for part in (self.name,
+                         filename,
+                         get_executable_version(executable),
+                         repr((executable,) + args),
+                         repr(config),
+                         repr(config_file_hashes),
+                         repr(sorted(process_output_kwargs.items())),
+                         ''.join(file)):
+                key.update(part.encode('utf-8', 'surrogateescape'))
+                key.update(b'\0')
+            return key.hexdigest()
+
+        def run(self, filename=None, file=None, use_result_cache=True,
+                **kwargs):
+            if not use_result_cache or filename is None:
+                return super().run(filename, file, **kwargs)
+
+            key = self.get_result_cache_key(filename, file, kwargs)
+            if key is None:
+                return super().run(filename, file, **kwargs)
+
+            results = result_cache.get(key)
+            if results is not None:
+                self.debug('Reusing cached results for {}.'.format(filename))
+                return results
+
+            results = list(super().run(filename, file, **kwargs) or ())
+            result_cache.set(key, results)
+            return results
+
+    CachedLinter.__name__ = bear.__name__
+    CachedLinter.__qualname__ = bear.__qualname__
+    CachedLinter.__module__ = bear.__module__
+    CachedLinter.__doc__ = bear.__doc__
+    return CachedLinter
@@ -0,0 +1,82 @@
+from contextlib import contextmanager, ExitStack
+from multiprocessing.util import Finalize
+import os
+
+
+# Maps ``(bear name, config contents)`` to the path of the written config.
+_config_files = {}
+_config_stack = None
+_config_stack_pid = None
+# Stacks inherited from parent processes. They are kept alive so that their
+# config files are not removed when the stacks are garbage collected.
+_inherited_config_stacks = []
+
+
+def _keep_config(config_context):
+    """
+    Enters the given config file context until ``clear_config_files()`` is
+    called, which happens at the latest when the process exits.
+
+    Forked processes keep using the files of their parent but clean up the
+    ones they create themselves.
+
+    :param config_context: The context-manager creating the config file.
+    :return:               The path of the config file.
+    """
+    global _config_stack, _config_stack_pid
+    if _config_stack_pid != os.getpid():
+        if _config_stack is not None:
+            _inherited_config_stacks.append(_config_stack)
+        _config_stack = ExitStack()
+        _config_stack_pid = os.getpid()
+        Finalize(None, clear_config_files, exitpriority=10)
+
+    return _config_stack.enter_context(config_context)
+
+
+def clear_config_files():
+    """
+    Removes all config files written by this process and forgets about the
+    ones written by parent processes.
+    """
+    global _config_stack, _config_stack_pid
+    if _config_stack_pid == os.getpid():
+        _config_stack.close()
+    elif _config_stack is not None:
+        _inherited_config_stacks.append(_config_stack)
+    _config_stack = None
+    _config_stack_pid = None
+    _config_files.clear()
+
+
+def memoized_config(bear):
+    """
+    Decorator making a ``@linter`` bear write each distinct config file
+    generated by ``generate_config()`` only once, instead of writing and
+    removing a temporary file for every file checked. All files checked with
+    the same settings then share the same config file path.
+
+    :param bear: The ``@linter`` bear class to memoize the configs of.
+    :return:     A subclass of the bear reusing its config files.
+    """
+    class MemoizedConfigLinter(bear):
+
+        @classmethod
+        @contextmanager
+        def _create_config(cls, filename=None, file=None, **kwargs):
+            content = cls.generate_config(filename, file, **kwargs)
+            if content is None:
+                yield None
+                return
+
+            key = (cls.name, content)
+            if key not in _config_files:
+                _config_files[key] = _keep_config(
+                    super()._create_config(filename, file, **kwargs))
+            yield _config_files[key]
+
+    MemoizedConfigLinter.__name__ = bear.__name__
+    MemoizedConfigLinter.__qualname__ = bear.__qualname__
+    MemoizedConfigLinter.__module__ = bear.__module__
+    MemoizedConfigLinter.__doc__ = bear.__doc__
+    return MemoizedConfigLinter
@@ -0,0 +1,3 @@
+"""
+Contains utilities shared by several bears.
+"""
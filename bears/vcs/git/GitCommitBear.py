@@ -1,4 +1,3 @@
-import nltk
 import re
 import shutil
 import os
@@ -12,6 +11,23 @@ from coalib.results.Result import Result
 from coalib.settings.FunctionMetadata import FunctionMetadata
 from coalib.settings.Setting import typed_list
 
+from bears.vcs.git.ImperativeMood import get_first_word, get_verb_form
+
+
+def name_commit(revision):
+    """
+    Names the commit checked in the results.
+
+    >>> name_commit('HEAD')
+    'HEAD commit'
+    >>> name_commit(None)
+    'commit'
+
+    :param revision: The revision the commit is named by, or ``None``.
+    :return:         The name of the commit.
+    """
+    return revision + ' commit' if revision else 'commit'
+
 
 class GitCommitBear(GlobalBear):
     LANGUAGES = {'Git'}
@@ -33,14 +49,23 @@ class GitCommitBear(GlobalBear):
 
     _nltk_data_downloaded = False
 
-    def setup_dependencies(self):
-        if not self._nltk_data_downloaded and bool(
-                self.section.get('shortlog_imperative_check', True)):
+    @classmethod
+    def load_nltk(cls):
+        """
+        Imports nltk and downloads the data it needs to tag words, if not
+        done before.
+
+        :return: The ``nltk`` module.
+        """
+        import nltk
+
+        if not cls._nltk_data_downloaded:
             nltk.download([
                 'punkt',
                 'averaged_perceptron_tagger',
             ])
-            type(self)._nltk_data_downloaded = True
+            cls._nltk_data_downloaded = True
+        return nltk
 
     @classmethod
     def check_prerequisites(cls):
@@ -53,19 +78,19 @@ class GitCommitBear(GlobalBear):
     def get_shortlog_checks_metadata(cls):
         return FunctionMetadata.from_function(
             cls.check_shortlog,
-            omit={'self', 'shortlog'})
+            omit={'self', 'shortlog', 'revision'})
 
     @classmethod
     def get_body_checks_metadata(cls):
         return FunctionMetadata.from_function(
             cls.check_body,
-            omit={'self', 'body'})
+            omit={'self', 'body', 'revision'})
 
     @classmethod
     def get_issue_checks_metadata(cls):
         return FunctionMetadata.from_function(
             cls.check_issue_reference,
-            omit={'self', 'body'})
+            omit={'self', 'body', 'revision', 'remote_host'})
 
     @classmethod
     def get_metadata(cls):
@@ -96,7 +121,8 @@ class GitCommitBear(GlobalBear):
             netloc = urlparse(url)[1]
         return netloc.split('.')[0]
 
-    def run(self, allow_empty_commit_message: bool = False, **kwargs):
+    def run(self, allow_empty_commit_message: bool = False,
+            commit_range: str = '', **kwargs):
         """
         Check the current git commit message at HEAD.
 
@@ -105,7 +131,21 @@ class GitCommitBear(GlobalBear):
 
         :param allow_empty_commit_message: Whether empty commit messages are
                                            allowed or not.
+        :param commit_range:               A range of commits, like
+                                           ``origin/master..HEAD``, to check
+                                           the messages of instead of only
+                                           the message of HEAD. All messages
+                                           are retrieved with a single
+                                           ``git log`` call and the results
+                                           are prefixed with the abbreviated
+                                           SHA of their commit instead of
+                                           naming the HEAD commit.
         """
+        if commit_range:
+            yield from self.check_commit_range(
+                commit_range, allow_empty_commit_message, **kwargs)
+            return
+
         with change_directory(self.get_config_dir() or os.getcwd()):
             stdout, stderr = run_shell_command('git log -1 --pretty=%B')
 
@@ -113,24 +153,79 @@ class GitCommitBear(GlobalBear):
             self.err('git:', repr(stderr))
             return
 
-        stdout = stdout.rstrip('\n')
-        pos = stdout.find('\n')
-        shortlog = stdout[:pos] if pos != -1 else stdout
-        body = stdout[pos+1:] if pos != -1 else ''
+        yield from self.check_message(
+            stdout, allow_empty_commit_message, **kwargs)
+
+    def check_commit_range(self, commit_range, allow_empty_commit_message,
+                           **kwargs):
+        """
+        Checks the messages of all commits in the given range.
 
-        if len(stdout) == 0:
+        :param commit_range:               The range of commits to check,
+                                           in any form ``git log`` accepts.
+        :param allow_empty_commit_message: Whether empty commit messages are
+                                           allowed or not.
+        :param kwargs:                     The settings of the shortlog,
+                                           body and issue reference checks.
+        """
+        with change_directory(self.get_config_dir() or os.getcwd()):
+            stdout, stderr = run_shell_command(
+                ['git', 'log', '-z', '--format=%h%n%B', commit_range, '--'])
+
+        if stderr:
+            self.err('git:', repr(stderr))
+            return
+
+        # The remotes are looked up only once for all commits.
+        remote_host = (self.get_host_from_remotes() or ''
+                       if kwargs.get('body_close_issue') else None)
+        for entry in stdout.split('\0'):
+            if not entry:
+                continue
+            sha, _, message = entry.partition('\n')
+            for result in self.check_message(
+                    message, allow_empty_commit_message, revision=None,
+                    remote_host=remote_host, **kwargs):
+                result.message = '{}: {}'.format(sha, result.message)
+                yield result
+
+    def check_message(self, message, allow_empty_commit_message,
+                      revision='HEAD', remote_host=None, **kwargs):
+        """
+        Runs the shortlog, body and issue reference checks on the given
+        commit message.
+
+        :param message:                    The full commit message.
+        :param allow_empty_commit_message: Whether empty commit messages are
+                                           allowed or not.
+        :param revision:                   The revision the results name
+                                           the commit by, or ``None`` to
+                                           name it just "commit".
+        :param remote_host:                The host of the remotes, or
+                                           ``None`` to look it up if needed.
+        :param kwargs:                     The settings of the shortlog,
+                                           body and issue reference checks.
+        """
+        message = message.rstrip('\n')
+        pos = message.find('\n')
+        shortlog = message[:pos] if pos != -1 else message
+        body = message[pos+1:] if pos != -1 else ''
+
+        if len(message) == 0:
             if not allow_empty_commit_message:
-                yield Result(self, 'HEAD commit has no message.')
+                commit = name_commit(revision)
+                yield Result(self, '{} has no message.'.format(
+                    commit[0].upper() + commit[1:]))
             return
 
         yield from self.check_shortlog(
-            shortlog,
+            shortlog, revision=revision,
             **self.get_shortlog_checks_metadata().filter_parameters(kwargs))
         yield from self.check_body(
-            body,
+            body, revision=revision,
             **self.get_body_checks_metadata().filter_parameters(kwargs))
         yield from self.check_issue_reference(
-            body,
+            body, revision=revision, remote_host=remote_host,
             **self.get_issue_checks_metadata().filter_parameters(kwargs))
 
     def check_shortlog(self, shortlog,
@@ -138,7 +233,9 @@ class GitCommitBear(GlobalBear):
                        shortlog_regex: str='',
                        shortlog_trailing_period: bool=None,
                        shortlog_imperative_check: bool=True,
-                       shortlog_wip_check: bool=True):
+                       shortlog_nltk_fallback: bool=True,
+                       shortlog_wip_check: bool=True,
+                       revision='HEAD'):
         """
         Checks the given shortlog.
 
@@ -150,43 +247,60 @@ class GitCommitBear(GlobalBear):
         :param shortlog_trailing_period: Whether a dot shall be enforced at end
                                          end or not (or ``None`` for "don't
                                          care").
+        :param shortlog_imperative_check:
+                                         Whether the first word of the
+                                         shortlog shall be checked for being
+                                         in imperative mood.
+        :param shortlog_nltk_fallback:   Whether to tag the first word of the
+                                         shortlog with nltk if it is not in
+                                         the bundled verb lexicon. This
+                                         downloads the nltk data on first
+                                         use.
         :param shortlog_wip_check:       Whether a "WIP" in the shortlog text
                                          should yield a result or not.
+        :param revision:                 The revision the results name the
+                                         commit by, see ``check_message``.
         """
+        commit = name_commit(revision)
         diff = len(shortlog) - shortlog_length
         if diff > 0:
             yield Result(self,
-                         'Shortlog of the HEAD commit contains {} '
+                         'Shortlog of the {} contains {} '
                          'character(s). This is {} character(s) longer than '
                          'the limit ({} > {}).'.format(
-                              len(shortlog), diff,
+                              commit, len(shortlog), diff,
                               len(shortlog), shortlog_length))
 
         if (shortlog[-1] != '.') == shortlog_trailing_period:
             yield Result(self,
-                         'Shortlog of HEAD commit contains no period at end.'
+                         'Shortlog of {} contains no period at end.'.format(
+                             commit)
                          if shortlog_trailing_period else
-                         'Shortlog of HEAD commit contains a period at end.')
+                         'Shortlog of {} contains a period at end.'.format(
+                             commit))
 
         if shortlog_regex:
             match = re.fullmatch(shortlog_regex, shortlog)
             if not match:
                 yield Result(
                     self,
-                    'Shortlog of HEAD commit does not match given regex:'
-                    ' {regex}'.format(regex=shortlog_regex))
+                    'Shortlog of {commit} does not match given regex:'
+                    ' {regex}'.format(commit=commit,
+                                      regex=shortlog_regex))
 
         if shortlog_imperative_check:
             colon_pos = shortlog.find(':')
             shortlog = (shortlog[colon_pos + 1:]
                         if colon_pos != -1
                         else shortlog)
-            has_flaws = self.check_imperative(shortlog)
+            has_flaws = self.check_imperative(shortlog,
+                                              shortlog_nltk_fallback)
             if has_flaws:
                 bad_word = has_flaws[0]
                 yield Result(self,
-                             "Shortlog of HEAD commit isn't in imperative "
-                             "mood! Bad words are '{}'".format(bad_word))
+                             "Shortlog of {} isn't in imperative "
+                             "mood! Bad words are '{}'".format(commit,
+                                                               bad_word))
         if shortlog_wip_check:
             if 'wip' in shortlog.lower()[:4]:
                 yield Result(
@@ -194,21 +308,36 @@ class GitCommitBear(GlobalBear):
                     'This commit seems to be marked as work in progress and '
                     'should not be used in production. Treat carefully.')
 
-    def check_imperative(self, paragraph):
+    def check_imperative(self, paragraph, nltk_fallback=True):
         """
         Check the given sentence/s for Imperatives.
 
+        The first word is looked up in a lexicon of verb forms first. Only
+        if it is not found there, the paragraph is tagged with nltk.
+
         :param paragraph:
             The input paragraph to be tested.
+        :param nltk_fallback:
+            Whether to tag the paragraph with nltk if the first word is not
+            in the lexicon. Otherwise the word is assumed to be fine.
         :return:
-            A list of tuples having 2 elements (invalid word, parts of speech)
-            or an empty list if no invalid words are found.
+            A tuple having 2 elements (invalid word, parts of speech) or
+            ``None`` if no invalid words are found.
         """
-        words = nltk.word_tokenize(nltk.sent_tokenize(paragraph)[0])
         # VBZ : Verb, 3rd person singular present, like 'adds', 'writes'
         #       etc
         # VBD : Verb, Past tense , like 'added', 'wrote' etc
         # VBG : Verb, Present participle, like 'adding', 'writing'
+        word = get_first_word(paragraph)
+        tag = get_verb_form(word) if word else None
+        if tag is not None:
+            return (word, tag) if tag != 'VB' else None
+
+        if not nltk_fallback:
+            return None
+
+        nltk = self.load_nltk()
+        words = nltk.word_tokenize(nltk.sent_tokenize(paragraph)[0])
         word, tag = nltk.pos_tag(['I'] + words)[1:2][0]
         if(tag.startswith('VBZ') or
            tag.startswith('VBD') or
@@ -222,7 +351,8 @@ class GitCommitBear(GlobalBear):
                    body_line_length: int=72,
                    force_body: bool=False,
                    ignore_length_regex: typed_list(str)=(),
-                   body_regex: str=None):
+                   body_regex: str=None,
+                   revision='HEAD'):
         """
         Checks the given commit body.
 
@@ -235,15 +365,20 @@ class GitCommitBear(GlobalBear):
                                     expressions in this list will be ignored.
         :param body_regex:          If provided, checks the presence of regex
                                     in the commit body.
+        :param revision:            The revision the results name the
+                                    commit by, see ``check_message``.
         """
+        commit = name_commit(revision)
         if len(body) == 0:
             if force_body:
-                yield Result(self, 'No commit message body at HEAD.')
+                yield Result(self, 'No commit message body{}.'.format(
+                    ' at ' + revision if revision else ''))
             return
 
         if body[0] != '\n':
-            yield Result(self, 'No newline found between shortlog and body at '
-                               'HEAD commit. Please add one.')
+            yield Result(self, 'No newline found between shortlog and body{}. '
+                               'Please add one.'.format(
+                                   ' at ' + commit if revision else ''))
             return
 
         if body_regex and not re.fullmatch(body_regex, body.strip()):
@@ -255,15 +390,18 @@ class GitCommitBear(GlobalBear):
         if any((len(line) > body_line_length and
                 not any(regex.search(line) for regex in ignore_regexes))
                for line in body[1:]):
-            yield Result(self, 'Body of HEAD commit contains too long lines. '
+            yield Result(self, 'Body of {} contains too long lines. '
                                'Commit body lines should not exceed {} '
-                               'characters.'.format(body_line_length))
+                               'characters.'.format(commit,
+                                                    body_line_length))
 
     def check_issue_reference(self, body,
                               body_close_issue: bool=False,
                               body_close_issue_full_url: bool=False,
                               body_close_issue_on_last_line: bool=False,
-                              body_enforce_issue_reference: bool=False):
+                              body_enforce_issue_reference: bool=False,
+                              revision='HEAD',
+                              remote_host=None):
         """
         Check for matching issue related references and URLs.
 
@@ -290,21 +428,28 @@ class GitCommitBear(GlobalBear):
         :param body_enforce_issue_reference:
             Whether to enforce presence of issue reference in the body of
             commit message.
+        :param revision:
+            The revision the results name the commit by, see
+            ``check_message``.
+        :param remote_host:
+            The host of the remotes, or ``None`` to look it up.
         """
         if not body_close_issue:
             return
 
-        host = self.get_host_from_remotes()
+        commit = name_commit(revision)
+        host = (remote_host if remote_host is not None
+                else self.get_host_from_remotes())
         if host not in self.SUPPORTED_HOST_KEYWORD_REGEX:
             return
 
         if body_close_issue_on_last_line:
             body = body.splitlines()[-1]
-            result_message = ('Body of HEAD commit does not contain any {} '
-                              'reference in the last line.')
+            result_message = ('Body of ' + commit + ' does not '
+                              'contain any {} reference in the last line.')
         else:
-            result_message = ('Body of HEAD commit does not contain any {} '
-                              'reference.')
+            result_message = ('Body of ' + commit + ' does not '
+                              'contain any {} reference.')
 
         if body_close_issue_full_url:
             result_info = 'full issue'
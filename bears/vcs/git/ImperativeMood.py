@@ -0,0 +1,174 @@
+import re
+
+# Verbs commonly starting a commit shortlog, in their base form.
+BASE_VERBS = (
+    'abort', 'accept', 'access', 'adapt', 'add', 'adjust', 'align', 'allow',
+    'amend', 'annotate', 'apply', 'archive', 'assert', 'assign', 'avoid',
+    'backport', 'bind', 'block', 'bootstrap', 'bring', 'build', 'bump',
+    'cache', 'calculate', 'call', 'cancel', 'catch', 'change', 'check',
+    'choose', 'clarify', 'clean', 'cleanup', 'clear', 'clone', 'close',
+    'collect', 'combine', 'comment', 'commit', 'compare', 'compile',
+    'complete', 'compute', 'configure', 'connect', 'consolidate',
+    'construct', 'convert', 'copy', 'correct', 'cover', 'create', 'deal',
+    'debug', 'declare', 'decouple', 'decrease', 'default', 'defer', 'define',
+    'delay', 'delete', 'deprecate', 'describe', 'detect', 'disable',
+    'disallow', 'discard', 'display', 'do', 'document', 'downgrade',
+    'download', 'drop', 'dump', 'edit', 'embed', 'emit', 'enable',
+    'encode', 'enforce', 'enhance', 'ensure', 'escape', 'evaluate', 'exclude',
+    'execute', 'expand', 'expect', 'explain', 'export', 'expose', 'extend',
+    'extract', 'fetch', 'filter', 'find', 'finish', 'fix', 'flush', 'fold',
+    'force', 'format', 'forward', 'generate', 'get', 'give', 'go', 'group',
+    'guard', 'handle', 'hide', 'highlight', 'hook', 'ignore', 'implement',
+    'import', 'improve', 'include', 'increase', 'indent', 'initialize',
+    'inline', 'insert', 'install', 'integrate', 'introduce', 'invert',
+    'invoke', 'isolate', 'keep', 'label', 'launch', 'let', 'limit', 'link',
+    'lint', 'list', 'load', 'lock', 'log', 'lower', 'make', 'manage', 'map',
+    'mark', 'match', 'measure', 'merge', 'migrate', 'mock', 'modify',
+    'monitor', 'move', 'normalize', 'note', 'omit', 'open', 'optimize',
+    'order', 'output', 'override', 'parallelize', 'parse', 'pass', 'patch',
+    'pin', 'polish', 'port', 'precompute', 'prefer', 'prepare', 'preserve',
+    'prevent', 'print', 'process', 'profile', 'propagate', 'protect',
+    'provide', 'prune', 'publish', 'pull', 'push', 'put', 'raise', 'read',
+    'rebase', 'rebuild', 'record', 'recover', 'reduce', 'refactor',
+    'reformat', 'refresh', 'register', 'reimplement', 'reject', 'release',
+    'reload', 'remove', 'rename', 'reorder', 'reorganize', 'repair',
+    'replace', 'report', 'require', 'reset', 'resolve', 'restore',
+    'restrict', 'restructure', 'retry', 'return', 'reuse', 'revert',
+    'review', 'rewrite', 'rework', 'run', 'sanitize', 'save', 'scan',
+    'schedule', 'search', 'select', 'send', 'separate', 'serialize', 'set',
+    'setup', 'ship', 'show', 'shorten', 'silence', 'simplify', 'skip',
+    'sort', 'specify', 'speed', 'split', 'squash', 'start', 'stop', 'store',
+    'stream', 'strip', 'submit', 'support', 'suppress', 'switch', 'sync',
+    'tag', 'test', 'throw', 'tidy', 'track', 'translate', 'trigger', 'trim',
+    'try', 'tweak', 'unify', 'uninstall', 'unpin', 'unset', 'update',
+    'upgrade', 'upload', 'use', 'validate', 'verify', 'warn', 'wrap',
+    'write',
+)
+
+# The past forms of the irregular verbs above.
+IRREGULAR_PAST_FORMS = {
+    'bound': 'bind', 'brought': 'bring', 'built': 'build', 'caught': 'catch',
+    'chose': 'choose', 'chosen': 'choose', 'dealt': 'deal', 'did': 'do',
+    'done': 'do', 'found': 'find', 'gave': 'give', 'given': 'give',
+    'got': 'get', 'gotten': 'get', 'gone': 'go', 'went': 'go', 'hid': 'hide',
+    'hidden': 'hide', 'kept': 'keep', 'made': 'make', 'ran': 'run',
+    'read': 'read', 'rebuilt': 'rebuild', 'rewritten': 'rewrite',
+    'rewrote': 'rewrite', 'sent': 'send', 'sped': 'speed', 'split': 'split',
+    'threw': 'throw', 'thrown': 'throw', 'written': 'write', 'wrote': 'write',
+}
+
+# Words ending in "ing" that are not present participles.
+NON_PARTICIPLES = {'bring', 'ping', 'ring', 'sing', 'spring', 'string',
+                   'swing', 'thing'}
+
+WORD_REGEX = re.compile(r"\s*([^\W\d_][\w'-]*)")
+
+
+def _is_short_closed_syllable(verb):
+    return bool(re.search(r'(?:^|[^aeiou])[aeiou][^aeiouwxy]$', verb))
+
+
+def get_inflections(verb):
+    """
+    Derives the third person singular present, the past and the present
+    participle forms of a regular verb.
+
+    >>> sorted(get_inflections('fix').items())
+    [('fixed', 'VBD'), ('fixes', 'VBZ'), ('fixing', 'VBG')]
+    >>> sorted(get_inflections('apply').items())
+    [('applied', 'VBD'), ('applies', 'VBZ'), ('applying', 'VBG')]
+
+    :param verb: The base form of the verb.
+    :return:     A dictionary mapping the inflected forms to their Penn
+                 Treebank part of speech tags.
+    """
+    if verb.endswith(('s', 'x', 'z', 'ch', 'sh', 'o')):
+        forms = {verb + 'es': 'VBZ'}
+    elif re.search('[^aeiou]y$', verb):
+        forms = {verb[:-1] + 'ies': 'VBZ'}
+    else:
+        forms = {verb + 's': 'VBZ'}
+
+    if verb.endswith('e'):
+        forms[verb + 'd'] = 'VBD'
+        forms[verb[:-1] + 'ing'] = 'VBG'
+    elif re.search('[^aeiou]y$', verb):
+        forms[verb[:-1] + 'ied'] = 'VBD'
+        forms[verb + 'ing'] = 'VBG'
+    else:
+        forms[verb + 'ed'] = 'VBD'
+        forms[verb + 'ing'] = 'VBG'
+
+    # The final consonant is doubled depending on the stress, so both
+    # spellings are known, e.g. "stopped" and "edited".
+    if _is_short_closed_syllable(verb):
+        forms[verb + verb[-1] + 'ed'] = 'VBD'
+        forms[verb + verb[-1] + 'ing'] = 'VBG'
+    return forms
+
+
+def _build_lexicon():
+    lexicon = {}
+    for verb in BASE_VERBS:
+        # Third person singular forms are left to nltk, as they can as well
+        # be plural nouns, e.g. "Commits" or "Tests".
+        lexicon.update((form, tag)
+                       for form, tag in get_inflections(verb).items()
+                       if tag != 'VBZ')
+    lexicon.update(dict.fromkeys(IRREGULAR_PAST_FORMS, 'VBD'))
+    lexicon.update(dict.fromkeys(BASE_VERBS, 'VB'))
+    return lexicon
+
+
+LEXICON = _build_lexicon()
+
+
+def get_verb_form(word):
+    """
+    Looks up the form of the given word in the lexicon, falling back to
+    suffix rules for words that are not in the lexicon.
+
+    >>> get_verb_form('Add')
+    'VB'
+    >>> get_verb_form('Wrote')
+    'VBD'
+    >>> get_verb_form('Refactoring')
+    'VBG'
+    >>> get_verb_form('Tokenized')
+    'VBD'
+    >>> get_verb_form('Commits') is None
+    True
+    >>> get_verb_form('Documentation') is None
+    True
+
+    :param word: The word to look up.
+    :return:     ``'VB'`` for base forms, ``'VBD'`` or ``'VBG'`` for the past
+                 and present participle forms, or ``None`` if the form is
+                 unknown, e.g. for third person singular forms, which could
+                 be plural nouns as well.
+    """
+    word = word.lower()
+    if word in LEXICON:
+        return LEXICON[word]
+    if len(word) > 4 and word.endswith('ing') and word not in NON_PARTICIPLES:
+        return 'VBG'
+    if len(word) > 4 and word.endswith('ed') and not word.endswith('eed'):
+        return 'VBD'
+    return None
+
+
+def get_first_word(paragraph):
+    """
+    >>> get_first_word('  Fix typo')
+    'Fix'
+    >>> get_first_word("Don't fail")
+    "Don't"
+    >>> get_first_word('3 typos fixed') is None
+    True
+
+    :param paragraph: The text to get the first word of.
+    :return:          The first word or ``None`` if the text does not start
+                      with a word.
+    """
+    match = WORD_REGEX.match(paragraph)
+    return match.group(1) if match else None
@@ -0,0 +1,12 @@
+from bears.utils.BatchedLinter import batched_linter
+from bears.vimscript.VintBear import VintBear
+
+
+@batched_linter(VintBear,
+                output_filename_regex=r'(?P<filename>.+?):\d+:\d+: ')
+class VintBatchBear:
+    """
+    Check vimscript code for possible style problems, running ``vint`` once
+    for many files instead of once per file.
+    See <https://github.com/Kuniwak/vint> for more information.
+    """
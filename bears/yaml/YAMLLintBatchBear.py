@@ -0,0 +1,11 @@
+from bears.utils.BatchedLinter import batched_linter
+from bears.yaml.YAMLLintBear import YAMLLintBear
+
+
+@batched_linter(YAMLLintBear,
+                output_filename_regex=r'(?P<filename>.+?):\d+:\d+: ')
+class YAMLLintBatchBear:
+    """
+    Check yaml code for errors and possible problems, running ``yamllint``
+    once for many files instead of once per file.
+    """
@@ -3,7 +3,12 @@ from coalib.results.RESULT_SEVERITY import RESULT_SEVERITY
 from dependency_management.requirements.PipRequirement import PipRequirement
 import yaml
 
+from bears.utils.LinterResultCache import cached_linter
+from bears.utils.MemoizedConfig import memoized_config
 
+
+@cached_linter
+@memoized_config
 @linter(executable='yamllint',
         output_format='regex',
         output_regex=r'.+:(?P<line>\d+):(?P<column>\d+): '
@@ -24,6 +29,7 @@ class YAMLLintBear:
     AUTHORS_EMAILS = {'coala-devel@googlegroups.com'}
     LICENSE = 'AGPL-3.0'
     CAN_DETECT = {'Syntax', 'Formatting'}
+    RESULT_CACHE_FILE_SETTINGS = ('yamllint_config',)
 
     @staticmethod
     def generate_config(filename, file,
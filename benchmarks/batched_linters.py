@@ -0,0 +1,140 @@
+"""
+Compares the wall time of running ``@linter`` bears once per file with the
+wall time of their batched versions on a generated set of files.
+
+Run it from the repository root, e.g.::
+
+    python3 -m benchmarks.batched_linters --files 200 PyFlakesBear
+"""
+
+import argparse
+from contextlib import ExitStack
+from queue import Queue
+import time
+
+from coala_utils.ContextManagers import make_temp
+from coalib.settings.Section import Section
+
+from bears.python.BanditBatchBear import BanditBatchBear
+from bears.python.BanditBear import BanditBear
+from bears.python.PyFlakesBatchBear import PyFlakesBatchBear
+from bears.python.PyFlakesBear import PyFlakesBear
+from bears.yaml.YAMLLintBatchBear import YAMLLintBatchBear
+from bears.yaml.YAMLLintBear import YAMLLintBear
+
+
+PYTHON_FILE = """import os
+import sys
+
+
+def function_{index}(argument):
+    assert argument
+    return sys.argv[{index} % len(sys.argv)]
+"""
+
+YAML_FILE = """---
+key_{index}: value
+list:
+  - {index}
+  - {index}
+"""
+
+# Maps the name of each benchmarked bear to the bear, its batched version,
+# the suffix of the files to generate and their contents.
+BENCHMARKS = {
+    'BanditBear': (BanditBear, BanditBatchBear, '.py', PYTHON_FILE),
+    'PyFlakesBear': (PyFlakesBear, PyFlakesBatchBear, '.py', PYTHON_FILE),
+    'YAMLLintBear': (YAMLLintBear, YAMLLintBatchBear, '.yml', YAML_FILE),
+}
+
+
+def run_per_file(bear, file_dict):
+    """
+    Runs the given local bear on every file of the dict on its own.
+
+    :param bear:      The local bear class to run.
+    :param file_dict: A dict mapping filenames to their lines.
+    :return:          The number of results and the wall time taken.
+    """
+    uut = bear(Section('benchmark'), Queue())
+    start = time.perf_counter()
+    results = sum(len(uut.execute(filename, file))
+                  for filename, file in file_dict.items())
+    return results, time.perf_counter() - start
+
+
+def run_batched(bear, file_dict):
+    """
+    Runs the given batched bear on all files of the dict.
+
+    :param bear:      The batched bear class to run.
+    :param file_dict: A dict mapping filenames to their lines.
+    :return:          The number of results and the wall time taken.
+    """
+    uut = bear(file_dict, Section('benchmark'), Queue())
+    start = time.perf_counter()
+    results = len(uut.execute())
+    return results, time.perf_counter() - start
+
+
+def benchmark(name, files):
+    """
+    Generates the files for the given benchmark and times both modes.
+
+    :param name:  The name of the benchmark in ``BENCHMARKS``.
+    :param files: The number of files to generate.
+    :return:      A line describing the outcome.
+    """
+    local_bear, batched_bear, suffix, template = BENCHMARKS[name]
+    with ExitStack() as stack:
+        file_dict = {}
+        for index in range(files):
+            filename = stack.enter_context(make_temp(suffix=suffix))
+            contents = template.format(index=index)
+            with open(filename, 'w') as fl:
+                fl.write(contents)
+            file_dict[filename] = tuple(contents.splitlines(True))
+
+        per_file_results, per_file_time = run_per_file(local_bear, file_dict)
+        batched_results, batched_time = run_batched(batched_bear, file_dict)
+
+    assert per_file_results == batched_results, (
+        'Batched run yielded {} instead of {} results.'.format(
+            batched_results, per_file_results))
+
+    return ('{:<14} {:>6} files  per-file {:8.2f}s  batched {:8.2f}s  '
+            'speedup {:6.1f}x'.format(name, files, per_file_time,
+                                      batched_time,
+                                      per_file_time / batched_time))
+
+
+def create_arg_parser():
+    """
+    Creates a parser for command line arguments.
+
+    :return: Parser arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmarks batched linter bears against running their '
+                    'linters once per file.')
+    parser.add_argument('bears', nargs='*', metavar='BEAR',
+                        help='the bears to benchmark out of {}, all by '
+                             'default'.format(', '.join(sorted(BENCHMARKS))))
+    parser.add_argument('--files', '-f', type=int, default=100,
+                        help='number of files to generate')
+    return parser
+
+
+def main():
+    parser = create_arg_parser()
+    args = parser.parse_args()
+    unknown = set(args.bears) - set(BENCHMARKS)
+    if unknown:
+        parser.error('unknown bears: ' + ', '.join(sorted(unknown)))
+
+    for name in args.bears or sorted(BENCHMARKS):
+        print(benchmark(name, args.files))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -0,0 +1,173 @@
+"""
+Measures how long the ``Jinja2Bear`` takes on generated templates, once with
+a tag on every ninth line and once with tags on most lines. For each
+template, the single pass of ``iter_tags()`` is compared to matching the tag
+regexes on every line, as the bear did before, and the whole ``run()`` of
+the bear is timed.
+
+Run it from the repository root, e.g.::
+
+    python3 -m benchmarks.jinja2_tokenizer --lines 5000
+"""
+
+import argparse
+from queue import Queue
+import time
+
+from coalib.settings.Section import Section
+
+from bears.jinja2.Jinja2Bear import iter_tags, Jinja2Bear
+
+
+# A block of nine lines with a single tag.
+SPARSE_BLOCK = """<div class="item-{index}">
+  <p>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p>
+  <p>Sed do eiusmod tempor incididunt ut labore et dolore magna.</p>
+  <ul>
+    <li>Ut enim ad minim veniam, quis nostrud exercitation.</li>
+    <li>Duis aute irure dolor in reprehenderit in voluptate.</li>
+  </ul>
+  <span>{{{{ item_{index} }}}}</span>
+</div>
+"""
+
+# A block of nine lines with tags on most of them.
+DENSE_BLOCK = """{{% for item in items_{index} %}}{{# for item in items_{index} #}}
+  <p>{{{{ item.name }}}} {{{{item.value}}}}</p>
+  {{% if item.visible %}}
+    <span>{{{{ item.label }}}}</span>
+  {{% endif %}}{{# if item.visible #}}
+  {{% if item.extra %}}<b>{{{{ item.extra }}}}</b>{{% endif %}}
+  <hr>
+{{% endfor %}}{{# for item in items_{index} #}}
+<p>{{{{ footer_{index} }}}}</p>
+"""
+
+TEMPLATES = (('sparse', SPARSE_BLOCK), ('dense', DENSE_BLOCK))
+
+
+def generate_template(block, lines):
+    """
+    Generates a template by repeating a block of lines.
+
+    :param block: The block to repeat, formatted with its index.
+    :param lines: The minimum number of lines to generate.
+    :return:      A tuple of the lines.
+    """
+    block_lines = block.count('\n')
+    blocks = -(-lines // block_lines)
+    return tuple(''.join(block.format(index=index)
+                         for index in range(blocks)).splitlines(True))
+
+
+def get_tag_regexes():
+    """
+    :return: The kinds of tags and their regexes, as the bear uses them.
+    """
+    return (('variable', Jinja2Bear.VARIABLE_REGEX),
+            ('control_start', Jinja2Bear.CONTROL_START_REGEX),
+            ('control_end', Jinja2Bear.CONTROL_END_REGEX))
+
+
+def tokenize_lines(file, tag_regexes):
+    """
+    Finds the tags by matching every regex on every line, like the bear did
+    before ``iter_tags()``.
+
+    :param file:        The lines of the template.
+    :param tag_regexes: The kinds of tags and their regexes.
+    :return:            The number of tags found.
+    """
+    return sum(1 for line in file
+               for _, regex in tag_regexes
+               for _ in regex.finditer(line))
+
+
+def tokenize_single_pass(file, tag_regexes):
+    """
+    Finds the tags with ``iter_tags()``.
+
+    :param file:        The lines of the template.
+    :param tag_regexes: The kinds of tags and their regexes.
+    :return:            The number of tags found.
+    """
+    return sum(1 for _ in iter_tags(file, tag_regexes))
+
+
+def run_bear(file, tag_regexes):
+    """
+    Runs the bear on the template.
+
+    :param file:        The lines of the template.
+    :param tag_regexes: Unused, for the same signature as the tokenizers.
+    :return:            The number of results.
+    """
+    uut = Jinja2Bear(Section('benchmark'), Queue())
+    return len(list(uut.run('template.jinja2', file)))
+
+
+def measure(function, file, repeat):
+    """
+    Runs a function several times, keeping the fastest run.
+
+    :param function: The function to run with the template and the regexes.
+    :param file:     The lines of the template.
+    :param repeat:   The number of runs.
+    :return:         The return value of the function and the wall time of
+                     the fastest run.
+    """
+    tag_regexes = get_tag_regexes()
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = function(file, tag_regexes)
+        best = min(best, time.perf_counter() - start)
+    return value, best
+
+
+def benchmark(lines, repeat):
+    """
+    Times the tokenizers and the bear on the sparse and dense templates.
+
+    :param lines:  The number of lines of each template.
+    :param repeat: The number of runs to keep the fastest of.
+    :return:       A list of lines describing the outcome.
+    """
+    outcome = []
+    for name, block in TEMPLATES:
+        file = generate_template(block, lines)
+        for mode, function in (('lines', tokenize_lines),
+                               ('single', tokenize_single_pass),
+                               ('run', run_bear)):
+            value, wall_time = measure(function, file, repeat)
+            outcome.append(
+                '{:<6} {:<6} {:>8} lines  {:8.2f}ms  {:>6} {}'.format(
+                    name, mode, len(file), wall_time * 1000, value,
+                    'results' if function is run_bear else 'tags'))
+    return outcome
+
+
+def create_arg_parser():
+    """
+    Creates a parser for command line arguments.
+
+    :return: Parser arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmarks the tokenizer of the Jinja2Bear on generated '
+                    'templates.')
+    parser.add_argument('--lines', '-l', type=int, default=5000,
+                        help='number of lines of each template')
+    parser.add_argument('--repeat', '-r', type=int, default=5,
+                        help='number of runs to keep the fastest of')
+    return parser
+
+
+def main():
+    args = create_arg_parser().parse_args()
+    for line in benchmark(args.lines, args.repeat):
+        print(line)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
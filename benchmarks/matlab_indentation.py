@@ -0,0 +1,147 @@
+"""
+Measures the throughput of the ``MatlabIndentationBear`` on a generated
+Matlab corpus, once indented right and once with every line unindented. Each
+corpus is checked file by file with ``run()`` and in one batch call.
+
+Run it from the repository root, e.g.::
+
+    python3 -m benchmarks.matlab_indentation --lines 100000 --files 100
+"""
+
+import argparse
+from queue import Queue
+import time
+
+from coalib.settings.Section import Section
+
+from bears.matlab.MatlabIndentationBear import MatlabIndentationBear
+
+
+MATLAB_FUNCTION = """function result = function_{index}(values)
+  % Sums up the positive values.
+  result = 0;
+  for i = 1:numel(values)
+    if values(i) > 0
+      result = result + values(i);
+    elseif values(i) == 0
+      continue;
+    else
+      result = result - 1;
+    end
+  end
+  switch result
+    case 0
+      disp('nothing');
+    otherwise
+      disp(result);
+  end
+end
+
+"""
+
+
+def generate_file(lines, offset=0):
+    """
+    Generates Matlab code indented with two spaces per level.
+
+    :param lines:  The minimum number of lines to generate.
+    :param offset: The index of the first function to generate.
+    :return:       A tuple of the lines.
+    """
+    function_lines = MATLAB_FUNCTION.count('\n')
+    functions = -(-lines // function_lines)
+    return tuple(''.join(MATLAB_FUNCTION.format(index=index)
+                         for index in range(offset, offset + functions)
+                         ).splitlines(True))
+
+
+def generate_corpus(lines, files):
+    """
+    Generates a corpus of Matlab files.
+
+    :param lines: The total number of lines to generate.
+    :param files: The number of files to split the lines into.
+    :return:      A dict mapping filenames to their lines.
+    """
+    lines_per_file = max(lines // files, 1)
+    return {'function_{}.m'.format(index): generate_file(
+                lines_per_file, index * lines_per_file)
+            for index in range(files)}
+
+
+def run_bear(file_dict):
+    """
+    Runs the bear on every file of the dict.
+
+    :param file_dict: A dict mapping filenames to their lines.
+    :return:          The number of results and the wall time taken.
+    """
+    uut = MatlabIndentationBear(Section('benchmark'), Queue())
+    start = time.perf_counter()
+    results = sum(len(list(uut.run(filename, file)))
+                  for filename, file in file_dict.items())
+    return results, time.perf_counter() - start
+
+
+def run_batched(file_dict):
+    """
+    Reindents all files of the dict in one batch call.
+
+    :param file_dict: A dict mapping filenames to their lines.
+    :return:          The number of changed files and the wall time taken.
+    """
+    start = time.perf_counter()
+    changes = MatlabIndentationBear.get_changed_lines_of_files(file_dict, 2)
+    return len(changes), time.perf_counter() - start
+
+
+def benchmark(lines, files):
+    """
+    Times the bear on the indented and on the unindented corpus.
+
+    :param lines: The total number of lines to generate.
+    :param files: The number of files to split the lines into.
+    :return:      A list of lines describing the outcome.
+    """
+    indented = generate_corpus(lines, files)
+    unindented = {filename: tuple(line.lstrip() or line for line in file)
+                  for filename, file in indented.items()}
+    total_lines = sum(map(len, indented.values()))
+
+    outcome = []
+    for name, file_dict in (('indented', indented),
+                            ('unindented', unindented)):
+        for mode, run in (('run', run_bear), ('batch', run_batched)):
+            results, wall_time = run(file_dict)
+            outcome.append(
+                '{:<10} {:<5} {:>8} lines {:>5} files  {:8.2f}s  '
+                '{:>10.0f} lines/s  {:>6} results'.format(
+                    name, mode, total_lines, len(file_dict), wall_time,
+                    total_lines / wall_time, results))
+    return outcome
+
+
+def create_arg_parser():
+    """
+    Creates a parser for command line arguments.
+
+    :return: Parser arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmarks the MatlabIndentationBear on a generated '
+                    'corpus.')
+    parser.add_argument('--lines', '-l', type=int, default=100000,
+                        help='number of lines to generate')
+    parser.add_argument('--files', '-f', type=int, default=1,
+                        help='number of files to split the lines into')
+    return parser
+
+
+def main():
+    args = create_arg_parser().parse_args()
+    for line in benchmark(args.lines, args.files):
+        print(line)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -0,0 +1,481 @@
+"""
+Measures the throughput and peak memory of the pure Python bears and of the
+clone detection routines on generated corpora of several languages and
+sizes. Every benchmark calls ``run()`` of a bear directly, so only the bear
+itself is measured, not the coala core.
+
+Run it from the repository root, e.g.::
+
+    python3 -m benchmarks.pure_python_bears --sizes 1000 100000 \\
+        --save baseline.json
+    python3 -m benchmarks.pure_python_bears --sizes 1000 100000 \\
+        --compare baseline.json --threshold 0.2
+
+With ``--compare``, the exit status is 1 if any benchmark got slower or
+needs more memory than the baseline by more than the threshold.
+"""
+
+import argparse
+from collections import OrderedDict
+import gc
+import json
+from queue import Queue
+import random
+import sys
+import time
+import tracemalloc
+import zlib
+
+from coalib.settings.Section import Section
+
+from bears.general.AnnotationBear import AnnotationBear
+from bears.general.DuplicateFileBear import DuplicateFileBear
+from bears.general.IndentationBear import IndentationBear
+from bears.general.KeywordBear import KeywordBear
+from bears.general.LineLengthBear import LineLengthBear
+from bears.general.QuotesBear import QuotesBear
+from bears.general.SpaceConsistencyBear import SpaceConsistencyBear
+
+
+PYTHON_FUNCTION = """def function_{index}(values, name='{word}'):
+    # Sums up the values of {word}.
+    result = 0
+    for value in values:
+        if value > {number}:
+            result += value{comment}
+        else:
+            result -= "{word}".count('{word}')
+    return {{'{word}': result, "name": name}}
+
+
+"""
+
+C_FUNCTION = """int function_{index}(const int *values, int count)
+{{
+    /* Sums up the values of {word}. */
+    int result = 0;
+    for (int i = 0; i < count; i++) {{
+        if (values[i] > {number}) {{
+            result += values[i];{comment}
+        }} else {{
+            result -= strlen("{word}");
+        }}
+    }}
+    printf("%s: %d\\n", "{word}", result);
+    return result;
+}}
+
+"""
+
+JAVASCRIPT_FUNCTION = """function function_{index}(values, name) {{
+    // Sums up the values of {word}.
+    var result = 0;
+    for (var i = 0; i < values.length; i++) {{
+        if (values[i] > {number}) {{
+            result += values[i];{comment}
+        }} else {{
+            result -= '{word}'.length;
+        }}
+    }}
+    return {{name: "{word}", result: result}};
+}}
+
+"""
+
+# Maps the languages to their coalang names, the template of a function,
+# the comment starter and the file suffix.
+LANGUAGES = OrderedDict((
+    ('Python', (PYTHON_FUNCTION, '#', '.py')),
+    ('C', (C_FUNCTION, '//', '.c')),
+    ('JavaScript', (JAVASCRIPT_FUNCTION, '//', '.js')),
+))
+
+WORDS = ('alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta', 'eta',
+         'theta')
+
+COMMENTS = ('', '', '', 'TODO check the bounds', 'FIXME overflow',
+            'the sum of all values ' * 4)
+
+# Every tenth file of a corpus duplicates the file before it, so the
+# DuplicateFileBear has something to find.
+DUPLICATE_EVERY = 10
+
+
+def seed_for(*parts):
+    """
+    Computes a seed that stays the same across runs and Python versions.
+
+    >>> seed_for('C', 1000) == seed_for('C', 1000)
+    True
+
+    :param parts: The values identifying what is generated.
+    :return:      An integer to seed a ``random.Random`` with.
+    """
+    return zlib.crc32(repr(parts).encode('utf-8'))
+
+
+def generate_file(language, lines, index):
+    """
+    Generates a deterministic source file of the given language. Some lines
+    contain keywords in comments, tabs, trailing whitespace, both kinds of
+    quotes or are longer than 79 characters.
+
+    :param language: The name of the language, a key of ``LANGUAGES``.
+    :param lines:    The minimum number of lines to generate.
+    :param index:    The index of the file, making its contents unique.
+    :return:         A tuple of the lines.
+    """
+    template, comment_starter, _ = LANGUAGES[language]
+    rng = random.Random(seed_for(language, lines, index))
+    function_lines = template.count('\n')
+    generated = []
+    for function in range(-(-lines // function_lines)):
+        comment = rng.choice(COMMENTS)
+        if comment:
+            comment = '  {} {}'.format(comment_starter, comment)
+        code = template.format(
+            index='{}_{}'.format(index, function),
+            word=rng.choice(WORDS),
+            number=rng.randrange(100),
+            comment=comment)
+        for line in code.splitlines(True):
+            if rng.random() < 0.02:
+                line = line.replace('    ', '\t', 1)
+            if rng.random() < 0.02:
+                line = line[:-1] + ' \n'
+            generated.append(line)
+    return tuple(generated)
+
+
+def generate_corpus(language, lines, lines_per_file):
+    """
+    Generates a corpus of source files. Every ``DUPLICATE_EVERY``-th file
+    duplicates the file before it.
+
+    :param language:       The name of the language.
+    :param lines:          The total number of lines to generate.
+    :param lines_per_file: The number of lines of every file.
+    :return:               A dict mapping filenames to their lines.
+    """
+    suffix = LANGUAGES[language][2]
+    files = max(lines // lines_per_file, 1)
+    file_dict = OrderedDict()
+    file = ()
+    for index in range(files):
+        if index % DUPLICATE_EVERY != DUPLICATE_EVERY - 1:
+            file = generate_file(language, min(lines, lines_per_file), index)
+        file_dict['file_{}{}'.format(index, suffix)] = file
+    return file_dict
+
+
+def generate_count_matrices(language, lines, lines_per_function=20,
+                            variables=6, conditions=8):
+    """
+    Generates deterministic count matrices like the
+    ``ClangCountVectorCreator`` creates them, one for every
+    ``lines_per_function`` lines.
+
+    :param language:           The name of the language.
+    :param lines:              The number of lines the matrices stand for.
+    :param lines_per_function: The number of lines of each function.
+    :param variables:          The maximum number of variables per function.
+    :param conditions:         The number of counting conditions.
+    :return:                   A list of dicts mapping variable names to
+                               ``CountVector`` objects.
+    """
+    from bears.c_languages.codeclone_detection.CountVector import CountVector
+
+    rng = random.Random(seed_for(language, lines, 'count matrices'))
+    condition_list = [None] * conditions
+    matrices = []
+    for _ in range(max(lines // lines_per_function, 2)):
+        matrix = {}
+        for variable in range(rng.randint(2, variables)):
+            vector = CountVector(
+                'var_{}'.format(variable), CountVector.Category.reference,
+                condition_list)
+            vector.unweighted = [rng.randrange(6) for _ in condition_list]
+            vector.count_vector = list(vector.unweighted)
+            matrix[vector.name] = vector
+        matrices.append(matrix)
+    return matrices
+
+
+def create_bear(bear, *args):
+    """
+    Creates a bear with an empty section, passing the arguments first.
+    """
+    return bear(*args + (Section('benchmark'), Queue()))
+
+
+def annotate(language, file_dict):
+    """
+    Runs the ``AnnotationBear`` on every file, for the bears depending on it.
+
+    :return: A dict mapping filenames to dependency results.
+    """
+    uut = create_bear(AnnotationBear)
+    return {filename: {AnnotationBear.name: list(uut.run(
+                filename, file, language, use_result_cache=False))}
+            for filename, file in file_dict.items()}
+
+
+def count_results(results):
+    return sum(1 for _ in results or ())
+
+
+def prepare_annotation(language, file_dict):
+    uut = create_bear(AnnotationBear)
+    return lambda: sum(
+        count_results(uut.run(filename, file, language,
+                              use_result_cache=False))
+        for filename, file in file_dict.items())
+
+
+def prepare_indentation(language, file_dict):
+    uut = create_bear(IndentationBear)
+    dependency_results = annotate(language, file_dict)
+    return lambda: sum(
+        count_results(uut.run(filename, file, dependency_results[filename],
+                              language))
+        for filename, file in file_dict.items())
+
+
+def prepare_keyword(language, file_dict):
+    uut = create_bear(KeywordBear)
+    dependency_results = annotate(language, file_dict)
+    return lambda: sum(
+        count_results(uut.run(filename, file,
+                              dependency_results=dependency_results[filename]))
+        for filename, file in file_dict.items())
+
+
+def prepare_space_consistency(language, file_dict):
+    uut = create_bear(SpaceConsistencyBear)
+    return lambda: sum(count_results(uut.run(filename, file, True))
+                       for filename, file in file_dict.items())
+
+
+def prepare_line_length(language, file_dict):
+    uut = create_bear(LineLengthBear)
+    return lambda: sum(count_results(uut.run(filename, file))
+                       for filename, file in file_dict.items())
+
+
+def prepare_quotes(language, file_dict):
+    uut = create_bear(QuotesBear)
+    dependency_results = annotate(language, file_dict)
+    return lambda: sum(
+        count_results(uut.run(filename, file, dependency_results[filename]))
+        for filename, file in file_dict.items())
+
+
+def prepare_duplicate_file(language, file_dict):
+    uut = create_bear(DuplicateFileBear, file_dict)
+    return lambda: count_results(uut.run())
+
+
+def prepare_clone_detection(language, file_dict, window=5):
+    # Imported here, as it needs munkres, which the other benchmarks do not.
+    from bears.c_languages.codeclone_detection.CloneDetectionRoutines import (
+        compare_functions, exclude_function)
+
+    lines = sum(map(len, file_dict.values()))
+    matrices = generate_count_matrices(language, lines)
+
+    def compare():
+        differences = 0
+        for index, matrix in enumerate(matrices):
+            exclude_function(matrix)
+            for other in matrices[index + 1:index + 1 + window]:
+                compare_functions(matrix, other)
+                differences += 1
+        return differences
+
+    return compare
+
+
+# Maps the names of the benchmarks to functions taking the language and the
+# corpus and returning a function that runs the benchmark once and returns
+# the number of results.
+BENCHMARKS = OrderedDict((
+    ('AnnotationBear', prepare_annotation),
+    ('IndentationBear', prepare_indentation),
+    ('KeywordBear', prepare_keyword),
+    ('SpaceConsistencyBear', prepare_space_consistency),
+    ('LineLengthBear', prepare_line_length),
+    ('QuotesBear', prepare_quotes),
+    ('DuplicateFileBear', prepare_duplicate_file),
+    ('CloneDetectionRoutines', prepare_clone_detection),
+))
+
+
+def measure(function, repeat):
+    """
+    Measures the fastest of several runs of the function and, in another
+    run, the peak memory it allocates.
+
+    :param function: The function to measure.
+    :param repeat:   The number of runs to take the fastest of.
+    :return:         A tuple of the return value of the function, the wall
+                     time of the fastest run and the peak memory in bytes.
+    """
+    wall_times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        value = function()
+        wall_times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return value, min(wall_times), peak_memory
+
+
+def benchmark(names, languages, sizes, lines_per_file, repeat):
+    """
+    Runs the given benchmarks on corpora of all given languages and sizes.
+
+    :param names:          The names of the benchmarks to run.
+    :param languages:      The languages to generate corpora of.
+    :param sizes:          The numbers of lines to generate corpora of.
+    :param lines_per_file: The number of lines of every file.
+    :param repeat:         The number of runs to take the fastest of.
+    :return:               An ``OrderedDict`` mapping keys of the form
+                           ``bear/language/lines`` to dicts holding the
+                           measurements.
+    """
+    measurements = OrderedDict()
+    for language in languages:
+        for size in sizes:
+            file_dict = generate_corpus(language, size, lines_per_file)
+            lines = sum(map(len, file_dict.values()))
+            for name in names:
+                function = BENCHMARKS[name](language, file_dict)
+                results, wall_time, peak_memory = measure(function, repeat)
+                measurements['{}/{}/{}'.format(name, language, size)] = {
+                    'lines': lines,
+                    'files': len(file_dict),
+                    'results': results,
+                    'wall_time': wall_time,
+                    'lines_per_second': lines / wall_time,
+                    'peak_memory': peak_memory,
+                }
+    return measurements
+
+
+def compare_measurements(measurements, baseline, threshold):
+    """
+    Compares measurements with a baseline.
+
+    >>> compare_measurements(
+    ...     {'a': {'lines_per_second': 70.0, 'peak_memory': 100},
+    ...      'b': {'lines_per_second': 95.0, 'peak_memory': 100}},
+    ...     {'a': {'lines_per_second': 100.0, 'peak_memory': 100},
+    ...      'b': {'lines_per_second': 100.0, 'peak_memory': 100}}, 0.1)
+    ['a: 70 lines/s instead of 100 lines/s (-30%)']
+
+    :param measurements: The measurements, as ``benchmark()`` returns them.
+    :param baseline:     The measurements to compare with.
+    :param threshold:    The fraction by which the throughput may drop and
+                         the peak memory may grow before it counts as a
+                         regression.
+    :return:             A list of lines describing the regressions.
+    """
+    regressions = []
+    for key, measurement in measurements.items():
+        if key not in baseline:
+            continue
+        old = baseline[key]
+        speed = measurement['lines_per_second'] / old['lines_per_second']
+        if speed < 1 - threshold:
+            regressions.append(
+                '{}: {:.0f} lines/s instead of {:.0f} lines/s ({:+.0%})'
+                .format(key, measurement['lines_per_second'],
+                        old['lines_per_second'], speed - 1))
+        if old['peak_memory'] and (measurement['peak_memory'] /
+                                   old['peak_memory'] > 1 + threshold):
+            regressions.append(
+                '{}: {} bytes peak memory instead of {} bytes ({:+.0%})'
+                .format(key, measurement['peak_memory'], old['peak_memory'],
+                        measurement['peak_memory'] / old['peak_memory'] - 1))
+    return regressions
+
+
+def format_measurements(measurements):
+    """
+    Formats the measurements as a table.
+
+    :return: A list of lines.
+    """
+    lines = ['{:<45} {:>8} {:>5} {:>7} {:>9} {:>12} {:>10}'.format(
+        '', 'lines', 'files', 'results', 'wall', 'lines/s', 'peak MiB')]
+    lines += ['{:<45} {:>8} {:>5} {:>7} {:>8.3f}s {:>12.0f} {:>10.1f}'.format(
+        key, measurement['lines'], measurement['files'],
+        measurement['results'], measurement['wall_time'],
+        measurement['lines_per_second'], measurement['peak_memory'] / 2**20)
+        for key, measurement in measurements.items()]
+    return lines
+
+
+def create_arg_parser():
+    """
+    Creates a parser for command line arguments.
+
+    :return: Parser arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmarks the pure Python bears on generated corpora.')
+    parser.add_argument('--benchmarks', '-b', nargs='+',
+                        choices=list(BENCHMARKS), default=list(BENCHMARKS),
+                        help='benchmarks to run')
+    parser.add_argument('--languages', nargs='+', choices=list(LANGUAGES),
+                        default=list(LANGUAGES),
+                        help='languages to generate corpora of')
+    parser.add_argument('--sizes', '-s', nargs='+', type=int,
+                        default=[1000, 10000],
+                        help='numbers of lines to generate corpora of, e.g. '
+                             '1000 10000 100000 1000000')
+    parser.add_argument('--lines-per-file', type=int, default=1000,
+                        help='number of lines of every generated file')
+    parser.add_argument('--repeat', '-r', type=int, default=3,
+                        help='number of runs to take the fastest of')
+    parser.add_argument('--save', metavar='FILE',
+                        help='save the measurements as a baseline')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare the measurements with a baseline')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='fraction by which a benchmark may get slower '
+                             'or need more memory than the baseline')
+    return parser
+
+
+def main():
+    args = create_arg_parser().parse_args()
+    measurements = benchmark(args.benchmarks, args.languages, args.sizes,
+                             args.lines_per_file, args.repeat)
+    for line in format_measurements(measurements):
+        print(line)
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(measurements, file, indent=4)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare_measurements(measurements, baseline,
+                                           args.threshold)
+        for line in regressions:
+            print(line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
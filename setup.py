@@ -74,7 +74,8 @@ if __name__ == '__main__':
                             'makman@alice.de'),
           url='http://coala.rtfd.org/',
           platforms='any',
-          packages=find_packages(exclude=('build.*', 'tests', 'tests.*')),
+          packages=find_packages(exclude=('build.*', 'tests', 'tests.*',
+                                          'benchmarks', 'benchmarks.*')),
           install_requires=required,
           extras_require=extras_require,
           tests_require=test_required,
@@ -0,0 +1,10 @@
+from bears.c_languages.CPPCheckBatchBear import CPPCheckBatchBear
+from tests.c_languages.CPPCheckBearTest import bad_file, good_file, warn_file
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+CPPCheckBatchBearTest = verify_batched_linter(
+    CPPCheckBatchBear,
+    files=(good_file, warn_file, bad_file),
+    settings={'enable': 'unusedFunction'},
+    tempfile_kwargs={'suffix': '.cpp'})
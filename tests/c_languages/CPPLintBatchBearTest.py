@@ -0,0 +1,10 @@
+from bears.c_languages.CPPLintBatchBear import CPPLintBatchBear
+from tests.c_languages.CPPLintBearTest import test_file
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+CPPLintBatchBearTest = verify_batched_linter(
+    CPPLintBatchBear,
+    files=(test_file, test_file),
+    settings={'max_line_length': '13'},
+    tempfile_kwargs={'suffix': '.cpp'})
@@ -0,0 +1,21 @@
+import os
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from bears.utils.LinterResultCache import result_cache
+
+
+@pytest.fixture(autouse=True, scope='session')
+def temporary_result_cache():
+    """
+    Keeps the results cached during the tests out of the user's cache
+    directory.
+    """
+    result_cache.close()
+    path = result_cache.path
+    with TemporaryDirectory() as directory:
+        result_cache.path = os.path.join(directory, 'linter_results.sqlite3')
+        yield
+        result_cache.close()
+    result_cache.path = path
@@ -1,7 +1,14 @@
+import os
 from queue import Queue
+from tempfile import TemporaryDirectory
 import unittest
+from unittest.mock import patch
 
-from bears.general.AnnotationBear import AnnotationBear
+from bears.general import AnnotationBear as AnnotationBearModule
+from bears.general.AnnotationBear import (
+    AnnotationBear, get_annotation_key, get_delimiters)
+from bears.general.AnnotationRanges import AnnotationRanges
+from bears.utils.LinterResultCache import ResultCache
 from coalib.results.SourceRange import SourceRange
 from coalib.results.AbsolutePosition import AbsolutePosition
 from coalib.results.HiddenResult import HiddenResult
@@ -20,6 +27,15 @@ class AnnotationBearTest(unittest.TestCase):
         self.section2.append(Setting('language', 'c'))
         self.c_uut = AnnotationBear(self.section2, Queue())
 
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = ResultCache(os.path.join(directory.name, 'cache'))
+        self.addCleanup(self.cache.close)
+        patcher = patch.object(AnnotationBearModule, 'result_cache',
+                               self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_single_line_string(self):
         text = ["'from start till the end with #comments'\n", ]
         compare = (SourceRange.from_absolute_position(
@@ -150,3 +166,68 @@ class AnnotationBearTest(unittest.TestCase):
                 # That lead to a Result being yielded because of unclosed
                 # quotes, this asserts that no such thing happened.
                 self.assertEqual(type(result), HiddenResult)
+
+    def test_annotation_ranges(self):
+        text = ['a = 1  # one\n',
+                '"""multi\n',
+                'line"""  # two\n',
+                'b = "x"  # three']
+        with execute_bear(self.python_uut, 'F', text) as result:
+            strings = result[0].contents['strings']
+            comments = result[0].contents['comments']
+            self.assertIsInstance(strings, AnnotationRanges)
+            self.assertIsInstance(comments, AnnotationRanges)
+            self.assertEqual(list(strings.starts), [13, 41])
+            self.assertEqual(list(strings.ends), [28, 43])
+            self.assertEqual(list(comments.starts), [7, 31, 46])
+            self.assertEqual(list(comments.ends), [12, 36, 52])
+
+    def test_result_cache(self):
+        self.section1.append(Setting('use_result_cache', True))
+        self.section2.append(Setting('use_result_cache', True))
+        text = ['a = "b"  # c\n']
+        with execute_bear(self.python_uut, 'F', text) as results:
+            pass
+        with patch.object(AnnotationBear, 'find_annotation_ranges') as find:
+            with execute_bear(self.python_uut, 'G', text) as cached_results:
+                self.assertFalse(find.called)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        for name in ('strings', 'comments'):
+            self.assertEqual(cached_results[0].contents[name].filename, 'G')
+            self.assertEqual(cached_results[0].contents[name].starts,
+                             results[0].contents[name].starts)
+            self.assertEqual(cached_results[0].contents[name].ends,
+                             results[0].contents[name].ends)
+
+        text.append("'unclosed\n")
+        for filename in ('F', 'G'):
+            with execute_bear(self.python_uut, filename, text) as results:
+                self.assertEqual(results[0].message, "' has no closure")
+                self.assertEqual(results[0].affected_code,
+                                 (SourceRange.from_values(filename, 2, 1),))
+                self.assertEqual(results[1].contents['strings'], ())
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 2))
+
+        with execute_bear(self.c_uut, 'G', text) as results:
+            self.assertEqual(len(results[0].contents['comments']), 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 3))
+
+    def test_result_cache_disabled(self):
+        with execute_bear(self.python_uut, 'F', ['a = "b"\n']) as results:
+            self.assertEqual(len(results[0].contents['strings']), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+        self.section1.append(Setting('use_result_cache', False))
+        with execute_bear(self.python_uut, 'F', ['a = "b"\n']) as results:
+            self.assertEqual(len(results[0].contents['strings']), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_annotation_key(self):
+        python = get_delimiters('python 3')
+        self.assertIs(get_delimiters('python 3'), python)
+        self.assertEqual(get_annotation_key(['a\n'], python),
+                         get_annotation_key(['a\n'], dict(python)))
+        self.assertNotEqual(get_annotation_key(['a\n'], python),
+                            get_annotation_key(['b\n'], python))
+        self.assertNotEqual(get_annotation_key(['a\n'], python),
+                            get_annotation_key(['a\n'], get_delimiters('c')))
@@ -0,0 +1,80 @@
+import pickle
+import unittest
+
+from bears.general.AnnotationRanges import (
+    AnnotationRanges, as_annotation_ranges, get_line_starts)
+from coalib.results.SourceRange import SourceRange
+
+
+class AnnotationRangesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.file = ['a = 1  # one\n',
+                     '"""multi\n',
+                     'line"""  # two\n',
+                     'b = "x"  # three']
+        self.comments = AnnotationRanges('F', get_line_starts(self.file),
+                                         (7, 31, 46), (12, 36, 52))
+        self.strings = AnnotationRanges('F', self.comments.line_starts,
+                                        (13, 41), (28, 43))
+
+    def test_sequence(self):
+        self.assertEqual(len(self.comments), 3)
+        self.assertEqual(self.comments[0],
+                         SourceRange.from_values('F', 1, 8, 1, 13))
+        self.assertEqual(self.strings[0],
+                         SourceRange.from_values('F', 2, 1, 3, 7))
+        self.assertEqual(self.comments[-1],
+                         SourceRange.from_values('F', 4, 10, 4, 16))
+        self.assertEqual(self.comments[1:], (
+            SourceRange.from_values('F', 3, 10, 3, 15),
+            SourceRange.from_values('F', 4, 10, 4, 16)))
+        self.assertEqual(self.strings, tuple(self.strings))
+        self.assertEqual(self.strings, list(self.strings))
+        self.assertNotEqual(self.strings, self.comments)
+        self.assertNotEqual(self.strings, 'strings')
+        with self.assertRaises(IndexError):
+            self.strings[2]
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.comments)),
+                         self.comments)
+
+    def test_lookups(self):
+        self.assertEqual(self.comments.find(6), -1)
+        self.assertEqual(self.comments.find(7), 0)
+        self.assertEqual(self.comments.find(12), 0)
+        self.assertEqual(self.comments.find(13), -1)
+        self.assertEqual(self.comments.find(52), 2)
+        self.assertFalse(self.comments.contains(0))
+        self.assertTrue(self.strings.contains_position(3, 1))
+        self.assertFalse(self.strings.contains_position(3, 8))
+        self.assertEqual(self.comments.get_position(36), (3, 15))
+        self.assertEqual(self.comments.get_offset(3, 15), 36)
+
+    def test_line_ranges(self):
+        self.assertEqual(self.comments.get_line_ranges(1), [(8, 13)])
+        self.assertEqual(self.strings.get_line_ranges(2), [])
+        self.assertEqual(self.strings.get_line_ranges(4), [(5, 7)])
+
+    def test_iter_positions(self):
+        self.assertEqual(list(self.strings.iter_positions()),
+                         [(2, 1, 3, 7), (4, 5, 4, 7)])
+
+    def test_as_annotation_ranges(self):
+        self.assertIs(as_annotation_ranges('F', self.file, self.strings),
+                      self.strings)
+        strings = as_annotation_ranges('F', self.file,
+                                       tuple(reversed(self.strings)))
+        self.assertIsInstance(strings, AnnotationRanges)
+        self.assertEqual(strings, self.strings)
+        self.assertEqual(as_annotation_ranges('F', self.file, ()), ())
+        comments = as_annotation_ranges(
+            'F', self.file, (SourceRange.from_values('F', 1, 8, 1, 40),))
+        self.assertEqual(comments[0], self.comments[0])
+
+    def test_empty(self):
+        ranges = AnnotationRanges('F', get_line_starts([]))
+        self.assertEqual(ranges, ())
+        self.assertFalse(ranges)
+        self.assertEqual(ranges.find(0), -1)
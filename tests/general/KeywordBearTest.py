@@ -3,6 +3,7 @@ from queue import Queue
 import unittest
 import logging
 
+from bears.general.AnnotationRanges import AnnotationRanges, get_line_starts
 from bears.general.KeywordBear import KeywordBear
 from coalib.results.HiddenResult import HiddenResult
 from coalib.results.SourceRange import SourceRange
@@ -188,6 +189,38 @@ class KeywordBearDiffTest(unittest.TestCase):
                              ' test\n'
                              ' */\n')
 
+    def test_keyword_annotation_ranges(self):
+        text = ['int a = 0; /* TODO test\n',
+                'another test\n',
+                '*/ /* todo */\n']
+        comments = AnnotationRanges('F', get_line_starts(text),
+                                    (11, 40), (38, 49))
+        dep_results = {
+            'AnnotationBear': [
+                self.annotation_bear_result_type({'comments': comments})
+            ]
+        }
+
+        with execute_bear(self.uut, filename='F', file=text,
+                          dependency_results=dep_results) as result:
+            self.assertEqual(len(result), 2)
+            self.assertEqual(result[0].diffs['F'].unified_diff,
+                             '--- \n'
+                             '+++ \n'
+                             '@@ -1,3 +1,3 @@\n'
+                             '-int a = 0; /* TODO test\n'
+                             '+int a = 0; /*\n'
+                             ' another test\n'
+                             ' */ /* todo */\n')
+            self.assertEqual(result[1].diffs['F'].unified_diff,
+                             '--- \n'
+                             '+++ \n'
+                             '@@ -1,3 +1,3 @@\n'
+                             ' int a = 0; /* TODO test\n'
+                             ' another test\n'
+                             '-*/ /* todo */\n'
+                             '+*/\n')
+
     def test_keyword_regex(self):
         text = ['# add two given values and result the result\n',
                 'def add(a, b):',
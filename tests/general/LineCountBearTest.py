@@ -40,3 +40,9 @@ class LineCountBearTest(LocalBearTestHelper):
                                 severity=RESULT_SEVERITY.NORMAL,
                                 file='default')],
             filename='default')
+
+    def test_exclude_whitespace_only_lines(self):
+        self.section.append(Setting('exclude_blank_lines', True))
+        self.section.append(Setting('max_lines_per_file', 1))
+        self.check_validity(self.uut, ['\r\n', ' \n', '\x0c\n', 'a\n'])
+        self.check_invalidity(self.uut, ['a\n', ' b\n'])
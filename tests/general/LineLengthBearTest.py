@@ -26,3 +26,10 @@ LineLengthBearIgnoreRegexTest = verify_local_bear(
     settings={
         'max_line_length': '4',
         'ignore_length_regex': 'http://, https://, ftp://'})
+
+
+LineLengthBearTabTest = verify_local_bear(
+    LineLengthBear,
+    valid_files=('\tab', 'a\tb', 'abcdef'),
+    invalid_files=('\t\tb', 'ab\tcde', 'abcdefg'),
+    settings={'max_line_length': '6', 'indent_size': '4'})
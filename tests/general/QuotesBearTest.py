@@ -3,6 +3,7 @@ from queue import Queue
 from textwrap import dedent
 
 from coalib.results.HiddenResult import HiddenResult, Result
+from bears.general.AnnotationRanges import AnnotationRanges, get_line_starts
 from bears.general.QuotesBear import QuotesBear
 from coalib.results.SourceRange import SourceRange
 from coalib.settings.Section import Section
@@ -97,3 +98,18 @@ class QuotesBearDiffTest(unittest.TestCase):
                              '-"a string with double quotes!"\n'
                              "+'a string with double quotes!'\n"
                              " 'A single quoted string with \" in it'\n")
+
+    def test_annotation_ranges(self):
+        strings = AnnotationRanges(self.filename,
+                                   get_line_starts(self.single_quote_file),
+                                   (1, 26, 57), (24, 55, 93))
+        self.assertEqual(strings,
+                         self.dep_results['AnnotationBear'][0]
+                         .contents['strings'])
+        dep_results = {'AnnotationBear': [HiddenResult(
+            'AnnotationBear', {'comments': (), 'strings': strings})]}
+
+        with execute_bear(self.uut, self.filename, self.single_quote_file,
+                          dependency_results=dep_results) as results:
+            self.assertEqual(len(results), 1)
+            self.assertEqual(results[0].affected_code[0].start.line, 5)
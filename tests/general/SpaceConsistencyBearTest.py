@@ -1,7 +1,7 @@
 from queue import Queue
 
 from bears.general.SpaceConsistencyBear import (
-    SpaceConsistencyBear, SpacingHelper)
+    SpaceConsistencyBear, SpacingHelper, get_candidate_lines)
 from coalib.testing.LocalBearTestHelper import LocalBearTestHelper
 from coalib.settings.Section import Section
 from coalib.settings.Setting import Setting
@@ -70,3 +70,36 @@ class SpaceConsistencyBearTest(LocalBearTestHelper):
                                "    print('funny')\n",
                                "    print('the result is not funny...')"],
                               force_linebreaks=False)
+
+    def test_results(self):
+        self.section.append(Setting('use_spaces', 'true'))
+        file = ['clean\n', '\tt \n', 'clean\n', 'no newline']
+
+        results = list(self.uut.run('f', file, use_spaces=True))
+        self.assertEqual([result.affected_code[0].start.line
+                          for result in results], [2, 4])
+        self.assertEqual(results[0].message,
+                         'Line contains following spacing inconsistencies:'
+                         '\n- Trailing whitespaces.'
+                         '\n- Tabs used instead of spaces.')
+        self.assertEqual(results[0].diffs['f'].modified,
+                         ['clean\n', '    t\n', 'clean\n',
+                          'no newline'])
+        self.assertEqual(results[1].diffs['f'].modified,
+                         ['clean\n', '\tt \n', 'clean\n',
+                          'no newline\n'])
+
+    def test_candidate_lines(self):
+        file = ['a\n', '\tb\n', 'c  d\n', 'e \n', ' \tf\n', 'g h\n']
+        self.assertEqual(get_candidate_lines(file, True, True), [2, 5])
+        self.assertEqual(get_candidate_lines(file, True, False), [2, 4, 5])
+        self.assertEqual(get_candidate_lines(file, False, True), [3, 5])
+        self.assertEqual(get_candidate_lines(file, False, False), [3, 4, 5])
+        self.assertEqual(get_candidate_lines([], True, False), [])
+
+    def test_candidate_lines_missing_newlines(self):
+        self.assertEqual(get_candidate_lines(['a\n', 'b'], True, False),
+                         [2])
+        self.assertEqual(get_candidate_lines(['a\r', 'b\n', 'c'],
+                                             True, False),
+                         [1, 3])
@@ -0,0 +1,10 @@
+from bears.go.GoErrCheckBatchBear import GoErrCheckBatchBear
+from tests.go.GoErrCheckBearTest import bad_file, blank_file, good_file
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+GoErrCheckBatchBearTest = verify_batched_linter(
+    GoErrCheckBatchBear,
+    files=(good_file, bad_file, blank_file),
+    tempfile_kwargs={'suffix': '.go'},
+    separate_directories=True)
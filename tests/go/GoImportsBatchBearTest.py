@@ -0,0 +1,9 @@
+from bears.go.GoImportsBatchBear import GoImportsBatchBear
+from tests.go.GoImportsBearTest import bad_file, good_file
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+GoImportsBatchBearTest = verify_batched_linter(
+    GoImportsBatchBear,
+    files=(good_file, bad_file),
+    tempfile_kwargs={'suffix': '.go'})
@@ -0,0 +1,10 @@
+from bears.go.GoLintBatchBear import GoLintBatchBear
+from tests.go.GoLintBearTest import bad_file, good_file
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+GoLintBatchBearTest = verify_batched_linter(
+    GoLintBatchBear,
+    files=(good_file, bad_file),
+    tempfile_kwargs={'suffix': '.go'},
+    separate_directories=True)
@@ -0,0 +1,157 @@
+import os
+import sys
+import unittest
+from contextlib import ExitStack
+from queue import Queue
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from coala_utils.ContextManagers import prepare_file
+from coalib.bearlib.abstractions.Linter import linter
+from coalib.misc.Shell import run_shell_command
+from coalib.settings.Section import Section
+
+from bears.go.GoPackage import (
+    get_package_key, GoListedFilesBatch, GoPackageBatch)
+from bears.utils.BatchedLinter import batched_linter
+
+
+# Reports the number of files it was given for each file.
+COUNT_SCRIPT = """
+import sys
+for name in sys.argv[1:]:
+    print('{}:1: {} files'.format(name, len(sys.argv) - 1))
+"""
+
+# Prints the file read from stdin in upper case. With ``-l``, lists the given
+# files not in upper case and complains about files starting with ``!``.
+UPPER_CASE_SCRIPT = """
+import sys
+if sys.argv[1:2] != ['-l']:
+    print(sys.stdin.read().upper(), end='')
+for name in sys.argv[2:]:
+    with open(name) as fl:
+        content = fl.read()
+    if content.startswith('!'):
+        print(name + ':1:1: cannot parse', file=sys.stderr)
+    elif content != content.upper():
+        print(name)
+"""
+
+
+@linter(executable=sys.executable,
+        output_format='regex',
+        output_regex=r'.+:(?P<line>\d+): (?P<message>.+)')
+class FileCountBear:
+
+    @staticmethod
+    def create_arguments(filename, file, config_file):
+        return '-c', COUNT_SCRIPT, filename
+
+
+@batched_linter(FileCountBear,
+                output_filename_regex=r'(?P<filename>.+?):\d+:')
+class FileCountBatchBear(GoPackageBatch):
+    pass
+
+
+@linter(executable=sys.executable,
+        use_stdin=True,
+        output_format='corrected')
+class UpperCaseBear:
+
+    @staticmethod
+    def create_arguments(filename, file, config_file):
+        return '-c', UPPER_CASE_SCRIPT
+
+
+@batched_linter(UpperCaseBear,
+                output_filename_regex=r'(?P<filename>.+?)(?::\d+:\d+: .*)?$')
+class UpperCaseBatchBear(GoListedFilesBatch):
+    pass
+
+
+class GoPackageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stack = ExitStack()
+        self.addCleanup(self.stack.close)
+        self.directories = [self.stack.enter_context(TemporaryDirectory())
+                            for _ in range(2)]
+        self.file_dict = {}
+
+    def add_file(self, directory, content):
+        file, filename = self.stack.enter_context(prepare_file(
+            content.splitlines(keepends=True),
+            None,
+            tempfile_kwargs={'dir': directory, 'suffix': '.go'}))
+        self.file_dict[filename] = file
+        return filename
+
+    def test_get_package_key(self):
+        self.assertEqual(get_package_key(os.path.join('src', 'a.go'),
+                                         ['/* Package x */\n',
+                                          'package x // x\n']),
+                         ('src', 'x'))
+
+    def test_grouped_by_package(self):
+        first = self.add_file(self.directories[0], 'package a\n')
+        second = self.add_file(self.directories[0], '// A\npackage a\n')
+        self.add_file(self.directories[0], 'package a_test\n')
+        self.add_file(self.directories[1], 'package a\n')
+        uut = FileCountBatchBear(self.file_dict, Section('name'), Queue())
+
+        groups, single_files = uut._group_files({}, {})
+        self.assertEqual(sorted(map(sorted, groups.values())),
+                         sorted([sorted([first, second])] +
+                                [[filename] for filename in self.file_dict
+                                 if filename not in (first, second)]))
+        self.assertEqual(single_files, [])
+
+        messages = {result.affected_code[0].file: result.message
+                    for result in uut.execute()}
+        self.assertEqual(messages[first], '2 files')
+        self.assertEqual(messages[second], '2 files')
+        self.assertEqual(sorted(messages.values()),
+                         ['1 files', '1 files', '2 files', '2 files'])
+
+
+class GoListedFilesBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stack = ExitStack()
+        self.addCleanup(self.stack.close)
+        self.section = Section('name')
+        self.file_dict = {}
+        for content in ('UPPER\n', 'lower\n', '!PARSE ERROR\n', 'mixed\n'):
+            file, filename = self.stack.enter_context(
+                prepare_file([content], None))
+            self.file_dict[filename] = file
+
+    def test_listed_files(self):
+        uut = UpperCaseBatchBear(self.file_dict, self.section, Queue())
+        with patch('bears.go.GoPackage.run_shell_command',
+                   wraps=run_shell_command) as run_listing, \
+                patch('coalib.bearlib.abstractions.Linter.run_shell_command',
+                      wraps=run_shell_command) as run_single:
+            results = uut.execute()
+            self.assertEqual(run_listing.call_count, 1)
+            self.assertEqual(run_single.call_count, 3)
+
+        single_results = []
+        for filename, file in self.file_dict.items():
+            single_results += uut.linter.execute(filename, file)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(sorted(results), sorted(single_results))
+
+    def test_chunked(self):
+        uut = UpperCaseBatchBear(self.file_dict, self.section, Queue())
+        uut.max_arguments_length = 1
+        with patch('bears.go.GoPackage.run_shell_command',
+                   wraps=run_shell_command) as run_listing:
+            self.assertEqual(len(uut.execute()), 2)
+            self.assertEqual(run_listing.call_count, 4)
+
+    def test_no_files(self):
+        uut = UpperCaseBatchBear({}, self.section, Queue())
+        self.assertEqual(uut.execute(), [])
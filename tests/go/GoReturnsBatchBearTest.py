@@ -0,0 +1,10 @@
+from bears.go.GoReturnsBatchBear import GoReturnsBatchBear
+from tests.go.GoReturnsBearTest import (
+    bad_file1, bad_file2, good_file1, good_file2)
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+GoReturnsBatchBearTest = verify_batched_linter(
+    GoReturnsBatchBear,
+    files=(good_file1, good_file2, bad_file1, bad_file2),
+    tempfile_kwargs={'suffix': '.go'})
@@ -0,0 +1,10 @@
+from bears.go.GoTypeBatchBear import GoTypeBatchBear
+from tests.go.GoTypeBearTest import bad_file, good_file
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+GoTypeBatchBearTest = verify_batched_linter(
+    GoTypeBatchBear,
+    files=(good_file, bad_file),
+    tempfile_kwargs={'suffix': '.go'},
+    separate_directories=True)
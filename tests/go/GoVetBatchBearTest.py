@@ -0,0 +1,17 @@
+import os
+
+from bears.go.GoVetBatchBear import GoVetBatchBear
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+def read_test_file(name):
+    with open(os.path.join(os.path.dirname(__file__), 'test_files',
+                           name)) as fl:
+        return fl.read()
+
+
+GoVetBatchBearTest = verify_batched_linter(
+    GoVetBatchBear,
+    files=(read_test_file('vet_good.go'), read_test_file('vet_bad.go')),
+    tempfile_kwargs={'suffix': '.go'},
+    separate_directories=True)
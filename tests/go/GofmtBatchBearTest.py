@@ -0,0 +1,9 @@
+from bears.go.GofmtBatchBear import GofmtBatchBear
+from tests.go.GofmtBearTest import in_file1, out_file1, simplify_in_file1
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+GofmtBatchBearTest = verify_batched_linter(
+    GofmtBatchBear,
+    files=(in_file1, out_file1, simplify_in_file1),
+    tempfile_kwargs={'suffix': '.go'})
@@ -148,3 +148,32 @@ Jinja2BearControlBlockTest = verify_local_bear(
     valid_files=('foo {% for a in b %} bar {% endfor %}',),
     invalid_files=('This {% for a in b %} has no closing tag',
                    'This {% endif %} has no open tag'))
+
+
+class Jinja2BearTagOrderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.uut = Jinja2Bear(Section(''), Queue())
+
+    def test_start_tags_before_end_tags(self):
+        # The end tag in the second line closes the start tag before it.
+        content = ['{% if x %}\n',
+                   '{% endif %}{# if x #}{% if y %}{{z}}\n',
+                   '{% endif %}{# if y #}\n']
+        with execute_bear(self.uut, 'F', content) as result:
+            self.assertEqual(
+                [(r.message, r.affected_code[0].start.line,
+                  r.affected_code[0].start.column) for r in result],
+                [('Variable blocks should be spaced with `1` spaces on '
+                  'each side.', 2, 32),
+                 ('End tag label does not match expected label', 3, 12)])
+
+    def test_tags_in_adjacent_braces(self):
+        content = ['{{{ x }}} {{{% if y %}\n', '{%{% endif %}\n']
+        with execute_bear(self.uut, 'F', content) as result:
+            self.assertEqual(
+                [(r.message, r.affected_code[0].start.column)
+                 for r in result],
+                [('Variable blocks should be spaced with `1` spaces on '
+                  'each side.', 1),
+                 ('Unlabeled control end tag', 3)])
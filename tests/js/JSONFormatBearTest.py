@@ -1,10 +1,12 @@
+from collections import OrderedDict
 from queue import Queue
 
-from bears.js.JSONFormatBear import JSONFormatBear
+from bears.js.JSONFormatBear import JSONFormatBear, get_formatted_lines
 from coalib.testing.LocalBearTestHelper import (verify_local_bear,
                                                 LocalBearTestHelper)
 from coalib.results.Result import Result
 from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
 
 
 test_file1 = """{
@@ -63,6 +65,40 @@ class JSONTest(LocalBearTestHelper):
                                 file='default')],
             filename='default')
 
+    def test_max_diff_lines(self):
+        self.section.append(Setting('max_diff_lines', 3))
+        self.check_results(
+            self.uut,
+            test_file3.splitlines(True),
+            [Result.from_values('JSONFormatBear',
+                                'This file can be reformatted by sorting '
+                                'keys and following indentation.',
+                                file='default',
+                                line=2)],
+            filename='default')
+        self.check_validity(self.uut, test_file1.splitlines(True))
+
+        results = self.check_invalidity(self.uut, ['{"a": 5}'])
+        self.assertEqual(len(results[0].diffs), 1)
+
+    def test_max_diff_lines_default(self):
+        file = ['[\n'] + ['1,\n'] * 6000 + ['1\n', ']\n']
+        results = self.check_invalidity(self.uut, file)
+        self.assertEqual((results[0].affected_code[0].start.line,
+                          results[0].diffs), (2, None))
+
+        self.section.append(Setting('max_diff_lines', 0))
+        results = self.check_invalidity(self.uut, file)
+        self.assertEqual(len(results[0].diffs), 1)
+
+    def test_formatted_lines(self):
+        content = OrderedDict([('b', ['x' * 5000] * 2), ('a', '\u2028')])
+        self.assertEqual(
+            list(get_formatted_lines(content, True, 1, False)),
+            ['{\n', ' "a": "\u2028\n', '",\n', ' "b": [\n',
+             '  "{}",\n'.format('x' * 5000), '  "{}"\n'.format('x' * 5000),
+             ' ]\n', '}\n'])
+
 
 JSONFormatBearTest = verify_local_bear(JSONFormatBear,
                                        valid_files=(test_file1, test_file2),
@@ -1,3 +1,5 @@
+import unittest
+
 from bears.matlab.MatlabIndentationBear import MatlabIndentationBear
 from coalib.testing.LocalBearTestHelper import verify_local_bear
 
@@ -11,3 +13,24 @@ MatlabIndentationBearTest = verify_local_bear(
                    'if a ~= b\n a\nendif\n',
                    'if a ~= b\n a\nendif\n',
                    'if a ~= b\n  a\n  else\n  a\nendif\n'))
+
+
+class MatlabIndentationBearChangedLinesTest(unittest.TestCase):
+
+    def test_get_changed_lines(self):
+        self.assertEqual(
+            MatlabIndentationBear.get_changed_lines(
+                ['if a\n', 'b\n', '  else\n', 'c\n', '  end\n', '\n'], 2),
+            [(2, '  b\n'), (3, 'else\n'), (4, '  c\n'), (5, 'end\n')])
+        self.assertEqual(
+            MatlabIndentationBear.get_changed_lines(
+                ['if a\n', '    b\n', 'end\n'], 4),
+            [])
+
+    def test_get_changed_lines_of_files(self):
+        self.assertEqual(
+            MatlabIndentationBear.get_changed_lines_of_files(
+                {'a.m': ('for i\n', '  a\n', 'end\n'),
+                 'b.m': ('while b\n', 'b\n', 'end\n'),
+                 'c.m': ()}, 2),
+            {'b.m': [(2, '  b\n')]})
@@ -0,0 +1,8 @@
+from bears.natural_language.ProseLintBatchBear import ProseLintBatchBear
+from tests.natural_language.ProseLintBearTest import bad_file, good_file
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+ProseLintBatchBearTest = verify_batched_linter(
+    ProseLintBatchBear,
+    files=(good_file, bad_file, bad_file))
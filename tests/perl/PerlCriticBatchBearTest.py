@@ -0,0 +1,8 @@
+from bears.perl.PerlCriticBatchBear import PerlCriticBatchBear
+from tests.perl.PerlCriticBearTest import bad_file, good_file
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+PerlCriticBatchBearTest = verify_batched_linter(
+    PerlCriticBatchBear,
+    files=(good_file, bad_file, bad_file))
@@ -0,0 +1,11 @@
+from bears.python.BanditBatchBear import BanditBatchBear
+from tests.python.BanditBearTest import load_testfile
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+BanditBatchBearTest = verify_batched_linter(
+    BanditBatchBear,
+    files=(load_testfile('assert.py'),
+           load_testfile('exec-py2.py'),
+           load_testfile('jinja2_templating.py')),
+    tempfile_kwargs={'suffix': '.py'})
@@ -1,4 +1,13 @@
+from collections import OrderedDict
+import json
+import unittest
+from queue import Queue
+from unittest.mock import patch
+
+from coalib.results.Diff import Diff
+from coalib.settings.Section import Section
 from coalib.testing.LocalBearTestHelper import verify_local_bear
+from bears.python import PEP8NotebookBear as PEP8NotebookBearModule
 from bears.python.PEP8NotebookBear import PEP8NotebookBear
 
 
@@ -89,3 +98,56 @@ PEP8NotebookBearWithoutTrailingNewlineTest = \
                       invalid_files=(bad_file[:-1],),
                       force_linebreaks=False,
                       )
+
+
+class PEP8NotebookBearCellsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.uut = PEP8NotebookBear(Section('name'), Queue())
+        patcher = patch.object(PEP8NotebookBearModule, '_fixed_cells',
+                               OrderedDict())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_modified(self, file):
+        file = file.splitlines(True)
+        diff = Diff(file)
+        for result in self.uut.execute('filename', file):
+            diff += result.diffs['filename']
+        return diff.modified
+
+    def test_cells_diff(self):
+        notebook = json.loads(bad_file)
+        notebook['cells'] *= 20
+        notebook['cells'][5]['source'] = ['def f( ):\n', '  return 1']
+        file = json.dumps(notebook, indent=1, sort_keys=True,
+                          separators=(',', ': '), ensure_ascii=False) + '\n'
+
+        with patch.object(PEP8NotebookBearModule, 'get_cells_diff',
+                          return_value=None):
+            expected = self.get_modified(file)
+
+        with patch.object(Diff, 'from_string_arrays') as from_string_arrays:
+            self.assertEqual(self.get_modified(file), expected)
+            self.assertFalse(from_string_arrays.called)
+        self.assertIn('    "def f():\\n",\n', expected)
+        self.assertIn('    "    return 1"\n', expected)
+
+    def test_not_written_by_nbformat(self):
+        file = json.dumps(json.loads(bad_file), indent=2)
+        modified = self.get_modified(file)
+        self.assertEqual(len(modified), len(file.splitlines()))
+        self.assertIn('    "x = 1  # <-- PEP8 Error"\n', modified)
+
+    def test_unchanged_cells_skipped(self):
+        with patch.object(PEP8NotebookBearModule, 'autopep8_fix_code_cell',
+                          wraps=PEP8NotebookBearModule.autopep8_fix_code_cell
+                          ) as fix_code_cell, \
+                patch.object(PEP8NotebookBearModule,
+                             'notebook_node_to_string_list') as write:
+            self.assertEqual(self.get_modified(good_file),
+                             good_file.splitlines(True))
+            self.assertEqual(self.get_modified(good_file),
+                             good_file.splitlines(True))
+            self.assertEqual(fix_code_cell.call_count, 1)
+            self.assertFalse(write.called)
@@ -0,0 +1,15 @@
+from bears.python.PyDocStyleBatchBear import PyDocStyleBatchBear
+from tests.python.PyDocStyleBearTest import bad_file, good_file
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+PyDocStyleBatchBearTest = verify_batched_linter(
+    PyDocStyleBatchBear,
+    files=(good_file, bad_file, bad_file),
+    tempfile_kwargs={'suffix': '.py'})
+
+PyDocStyleBatchBearExecutableTest = verify_batched_linter(
+    PyDocStyleBatchBear,
+    files=(good_file, bad_file, bad_file),
+    settings={'in_process': 'False'},
+    tempfile_kwargs={'suffix': '.py'})
@@ -1,5 +1,11 @@
-from bears.python.PyDocStyleBear import PyDocStyleBear
+import unittest
+
+from pydocstyle.utils import log
+from pydocstyle.violations import Error
+
+from bears.python.PyDocStyleBear import PyDocStyleBear, run_pydocstyle
 from coalib.testing.LocalBearTestHelper import verify_local_bear
+from tests.utils.InProcessLinterTestHelper import verify_in_process_linter
 
 
 good_file = '''
@@ -84,3 +90,47 @@ PyDocStyleBearSelectAndIgnoreTest = verify_local_bear(
     settings={'pydocstyle_select': 'D200',
               'pydocstyle_ignore': 'D400'},
     tempfile_kwargs={'suffix': '.py'})
+
+syntax_error_file = '''
+def hello(:
+    """Print hello world."""
+'''
+
+all_error_file = '''
+"""Module docstring."""
+__all__ = ('a' + 'b',)
+'''
+
+PyDocStyleBearInProcessTest = verify_in_process_linter(
+    PyDocStyleBear,
+    files=(good_file, bad_file, syntax_error_file, all_error_file),
+    tempfile_kwargs={'suffix': '.py'})
+
+PyDocStyleBearInProcessIgnoreTest = verify_in_process_linter(
+    PyDocStyleBear,
+    files=(good_file, bad_file),
+    settings={'pydocstyle_ignore': 'D400, D200'},
+    tempfile_kwargs={'suffix': '.py'})
+
+PyDocStyleBearInProcessAddSelectTest = verify_in_process_linter(
+    PyDocStyleBear,
+    files=(good_file, bad_file),
+    settings={'pydocstyle_add_select': 'D212'},
+    tempfile_kwargs={'suffix': '.py'})
+
+
+class PyDocStyleEngineTest(unittest.TestCase):
+
+    def test_invalid_arguments(self):
+        with self.assertLogs(level='ERROR') as logs:
+            run_pydocstyle(('--not-an-option', 'a.py'), 'a.py', [good_file])
+        self.assertIn('pydocstyle exited with 2:', logs.output[0])
+        self.assertIn('--not-an-option', logs.output[0])
+
+    def test_global_state_restored(self):
+        state = (log.level, list(log.handlers), log.propagate,
+                 Error.explain, Error.source)
+        run_pydocstyle(('--explain', '--source', 'a.py'), 'a.py',
+                       bad_file.splitlines(True))
+        self.assertEqual((log.level, log.handlers, log.propagate,
+                          Error.explain, Error.source), state)
@@ -0,0 +1,23 @@
+from bears.python.PyFlakesBatchBear import PyFlakesBatchBear
+from tests.python.PyFlakesBearTest import bad_file, good_file
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+syntax_error_file = """
+def f(:
+    pass
+"""
+
+
+PyFlakesBatchBearTest = verify_batched_linter(
+    PyFlakesBatchBear,
+    files=(good_file, bad_file, bad_file, syntax_error_file))
+
+PyFlakesBatchBearExecutableTest = verify_batched_linter(
+    PyFlakesBatchBear,
+    files=(good_file, bad_file, bad_file, syntax_error_file),
+    settings={'in_process': 'False'})
+
+PyFlakesBatchBearJobsTest = verify_batched_linter(
+    PyFlakesBatchBear,
+    files=(good_file, bad_file, bad_file, syntax_error_file),
+    settings={'in_process_jobs': '0'})
@@ -1,5 +1,6 @@
 from bears.python.PyFlakesBear import PyFlakesBear
 from coalib.testing.LocalBearTestHelper import verify_local_bear
+from tests.utils.InProcessLinterTestHelper import verify_in_process_linter
 
 good_file = """
 print("Hi")
@@ -13,3 +14,12 @@ print("Hi")
 PyFlakesBearTest = verify_local_bear(PyFlakesBear,
                                      valid_files=(good_file,),
                                      invalid_files=(bad_file,))
+
+syntax_error_file = """
+def f(:
+    pass
+"""
+
+PyFlakesBearInProcessTest = verify_in_process_linter(
+    PyFlakesBear,
+    files=(good_file, bad_file, syntax_error_file))
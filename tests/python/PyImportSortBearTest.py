@@ -1,6 +1,7 @@
 from bears.python.PyImportSortBear import PyImportSortBear
 from coalib.testing.LocalBearTestHelper import verify_local_bear
 import unittest
+from unittest.mock import patch
 from queue import Queue
 
 from coalib.settings.Section import Section
@@ -118,3 +119,54 @@ import a, b
 
         self.assertEqual(self.uut._seperate_imports(file),
                          seperated)
+
+    def test_find_import_block(self):
+        file = (
+            '''"""
+import strings
+"""
+# Comment
+import sys
+from x import (y,
+               z)
+# import comments
+import os
+
+def f():
+    import a
+'''.splitlines(True)
+        )
+        self.assertEqual(self.uut._find_import_block(file), (5, 11))
+        self.assertEqual(self.uut._find_import_block(file[:9]), (5, 9))
+        self.assertEqual(self.uut._find_import_block(file[:4]), (0, 0))
+        self.assertEqual(self.uut._find_import_block(['x = (\n']), (0, 0))
+        self.assertIsNone(self.uut._find_import_block(
+            file + ['import late\n']))
+        self.assertIsNone(self.uut._find_import_block(
+            ['x = (\n', 'import y\n']))
+
+    def test_sort_import_block_only(self):
+        test_file = ['"""Doc."""\n', 'import sys\n', 'import os\n',
+                     'class A:\n', '    pass\n']
+        expected = ['"""Doc."""\n', 'import os\n', 'import sys\n', '\n',
+                    '\n', 'class A:\n', '    pass\n']
+        settings = {'sort_import_block_only': True}
+        self.assertEqual(list(self.uut.run('', test_file, **settings)
+                              )[0].diffs[''].modified,
+                         expected)
+        self.assertEqual(list(self.uut.run('', test_file)
+                              )[0].diffs[''].modified,
+                         expected)
+        self.assertEqual(list(self.uut.run('', expected, **settings)), [])
+
+        with patch('bears.python.PyImportSortBear.SortImports') as isort:
+            self.assertEqual(list(self.uut.run('', expected, **settings)),
+                             [])
+            self.assertFalse(isort.called)
+
+    def test_sort_import_block_only_fallback(self):
+        test_file = ['import sys\n', 'x = 1\n', 'import os\n']
+        self.assertEqual(
+            list(self.uut.run('', test_file, sort_import_block_only=True)
+                 )[0].diffs[''].modified,
+            list(self.uut.run('', test_file))[0].diffs[''].modified)
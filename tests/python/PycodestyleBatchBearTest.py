@@ -0,0 +1,18 @@
+from bears.python.PycodestyleBatchBear import PycodestyleBatchBear
+from tests.python.PycodestyleBearTest import bad_file, good_file, long_line
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+PycodestyleBatchBearTest = verify_batched_linter(
+    PycodestyleBatchBear,
+    files=(good_file, bad_file, long_line))
+
+PycodestyleBatchBearExecutableTest = verify_batched_linter(
+    PycodestyleBatchBear,
+    files=(good_file, bad_file, long_line),
+    settings={'in_process': 'False'})
+
+PycodestyleBatchBearJobsTest = verify_batched_linter(
+    PycodestyleBatchBear,
+    files=(good_file, bad_file, long_line),
+    settings={'in_process_jobs': '2'})
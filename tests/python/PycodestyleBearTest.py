@@ -1,5 +1,8 @@
-from bears.python.PycodestyleBear import PycodestyleBear
+import unittest
+
+from bears.python.PycodestyleBear import PycodestyleBear, run_pycodestyle
 from coalib.testing.LocalBearTestHelper import verify_local_bear
+from tests.utils.InProcessLinterTestHelper import verify_in_process_linter
 
 
 good_file = '''
@@ -54,3 +57,30 @@ PycodestyleBearLineLengthTest = verify_local_bear(
     invalid_files=(),
     settings={'max_line_length': 200}
 )
+
+PycodestyleBearInProcessTest = verify_in_process_linter(
+    PycodestyleBear,
+    files=(good_file, bad_file, long_line))
+
+PycodestyleBearInProcessSelectTest = verify_in_process_linter(
+    PycodestyleBear,
+    files=(good_file, bad_file, long_line),
+    settings={'pycodestyle_select': 'E501', 'max_line_length': '90'})
+
+
+class PycodestyleEngineTest(unittest.TestCase):
+
+    def test_invalid_arguments(self):
+        with self.assertLogs(level='ERROR') as logs:
+            self.assertEqual(run_pycodestyle(('--max-line-length=x', 'a.py'),
+                                             'a.py', [long_line]),
+                             '')
+        self.assertIn('pycodestyle exited with 2:', logs.output[0])
+        self.assertIn('--max-line-length', logs.output[0])
+
+    def test_excluded(self):
+        self.assertEqual(run_pycodestyle(('--exclude=a.py', 'a.py'),
+                                         'a.py', [long_line + '\n']),
+                         '')
+        self.assertIn('E501', run_pycodestyle(('a.py',), 'a.py',
+                                              [long_line + '\n']))
@@ -1,9 +1,16 @@
 import unittest
 import os.path
+import shutil
+import sys
 from queue import Queue
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from coalib.settings.Section import Section
-from bears.python.PyromaBear import PyromaBear
+from coalib.settings.Setting import Setting
+from bears.python import PyromaBear as PyromaBearModule
+from bears.python.PyromaBear import get_package_key, PyromaBear
+from bears.utils.LinterResultCache import ResultCache
 
 
 def get_testdir_path(name):
@@ -20,13 +27,21 @@ class PyromaBearTest(unittest.TestCase):
         self.section = Section('name')
         self.queue = Queue()
         self.file_dict = {}
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = ResultCache(os.path.join(directory.name, 'cache'))
+        self.addCleanup(self.cache.close)
+        patcher = patch.object(PyromaBearModule, 'result_cache', self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
-    def get_results(self, name):
-        setup_file = os.path.join(get_testdir_path(name), 'setup.py')
-        if os.path.isfile(setup_file):
-            self.file_dict[setup_file] = ''
+    def get_results(self, *names):
+        for name in names:
+            setup_file = os.path.join(get_testdir_path(name), 'setup.py')
+            if os.path.isfile(setup_file):
+                self.file_dict[setup_file] = ''
         self.uut = PyromaBear(self.file_dict, self.section, self.queue)
-        return list(self.uut.run())
+        return self.uut.execute()
 
     def test_complete(self):
         results = self.get_results('complete')
@@ -57,3 +72,42 @@ class PyromaBearTest(unittest.TestCase):
             'this package is zip_safe or not. You should specify it, as it '
             'defaults to True, which you probably do not want.',
         ])
+
+    def test_several_packages(self):
+        cwd, path = os.getcwd(), list(sys.path)
+        results = self.get_results('complete', 'minimal')
+        self.assertEqual(len(results), 11)
+        self.assertEqual({result.affected_code[0].file for result in results},
+                         {os.path.join(get_testdir_path('minimal'),
+                                       'setup.py')})
+        self.assertEqual((os.getcwd(), sys.path), (cwd, path))
+
+    def test_cached_ratings(self):
+        results = self.get_results('minimal')
+        with patch.object(PyromaBearModule, 'Pool') as pool:
+            self.assertEqual(get_message_list(self.get_results('minimal')),
+                             get_message_list(results))
+            self.assertFalse(pool.called)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_cache_disabled(self):
+        self.section.append(Setting('use_result_cache', False))
+        self.get_results('minimal')
+        self.get_results('minimal')
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_package_key(self):
+        with TemporaryDirectory() as directory:
+            directory = os.path.join(directory, 'package')
+            shutil.copytree(get_testdir_path('complete'), directory)
+            key = get_package_key(directory)
+            self.assertEqual(get_package_key(directory), key)
+
+            with open(os.path.join(directory, 'setup.cfg'), 'a') as fl:
+                fl.write('\n')
+            changed_key = get_package_key(directory)
+            self.assertNotEqual(changed_key, key)
+
+            with open(os.path.join(directory, 'MANIFEST.in'), 'w'):
+                pass
+            self.assertNotEqual(get_package_key(directory), changed_key)
@@ -1,5 +1,16 @@
+import ast
+from queue import Queue
+from unittest.mock import patch
+
+from radon.metrics import h_visit, mi_visit
+from radon.raw import analyze
+
 from bears.python.RadonBear import RadonBear
-from coalib.testing.LocalBearTestHelper import verify_local_bear
+from coalib.results.HiddenResult import HiddenResult
+from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
+from coalib.testing.LocalBearTestHelper import (
+    LocalBearTestHelper, verify_local_bear)
 
 test_file1 = """
 def simple():
@@ -14,6 +25,14 @@ class class1():
 
 test_file3 = 'def f():\n' + ('    assert True\n' * 50)
 
+test_file4 = '''
+def add(a, b):
+    # Adds the numbers.
+    if a:
+        return a + b * 2
+    return b - 1
+'''
+
 
 RadonBearDefaultsTest = verify_local_bear(
     RadonBear,
@@ -37,3 +56,60 @@ RadonBearReportsTest = verify_local_bear(
     settings={'radon_ranks_info': '',
               'radon_ranks_normal': 'A',
               'radon_ranks_major': ''})
+
+
+RadonBearMaintainabilityTest = verify_local_bear(
+    RadonBear,
+    valid_files=(test_file1,),
+    invalid_files=(test_file3,),
+    settings={'radon_mi_ranks_normal': 'B, C'})
+
+
+RadonBearHalsteadTest = verify_local_bear(
+    RadonBear,
+    valid_files=(test_file1, test_file2),
+    invalid_files=(test_file4,),
+    settings={'radon_max_halstead_effort': '20'})
+
+
+RadonBearLogicalLinesTest = verify_local_bear(
+    RadonBear,
+    valid_files=(test_file1, test_file2, test_file4),
+    invalid_files=(test_file3,),
+    settings={'radon_ranks_normal': '',
+              'radon_ranks_major': '',
+              'radon_max_logical_lines': '10'})
+
+
+class RadonBearMetricsTest(LocalBearTestHelper):
+
+    def setUp(self):
+        self.section = Section('name')
+        self.uut = RadonBear(self.section, Queue())
+
+    def get_metrics(self, source):
+        self.section.append(Setting('radon_hidden_metrics', True))
+        results = self.uut.execute('filename', source.splitlines(True))
+        self.assertIsInstance(results[-1], HiddenResult)
+        return results[-1].contents
+
+    def test_metrics(self):
+        metrics = self.get_metrics(test_file4)
+        self.assertEqual(
+            metrics['complexity'],
+            [{'name': 'add', 'line': 2, 'complexity': 2, 'rank': 'A'}])
+        self.assertEqual(metrics['halstead'],
+                         h_visit(test_file4)._asdict())
+        self.assertEqual(metrics['raw'], analyze(test_file4)._asdict())
+        self.assertEqual(metrics['maintainability'],
+                         {'score': mi_visit(test_file4, True),
+                          'rank': 'A'})
+
+    def test_parsed_once(self):
+        with patch('ast.parse', wraps=ast.parse) as parse:
+            self.get_metrics(test_file3 + '\n')
+            self.assertEqual(parse.call_count, 1)
+
+    def test_no_hidden_metrics(self):
+        self.check_results(self.uut, test_file4.splitlines(True), [],
+                           filename='filename')
@@ -0,0 +1,67 @@
+import ast
+import unittest
+from unittest.mock import patch
+
+from bears.python import SourceCache
+from bears.python.SourceCache import (
+    get_python_source, PythonSource, SourceCache as Cache)
+
+
+class PythonSourceTest(unittest.TestCase):
+
+    def test_computed_once(self):
+        source = PythonSource(['def f():\n', '    pass\n'])
+        self.assertEqual(source.text, 'def f():\n    pass\n')
+        with patch('ast.parse', wraps=ast.parse) as parse:
+            tree = source.tree
+            self.assertIs(source.tree, tree)
+            self.assertEqual(parse.call_count, 1)
+        self.assertIsInstance(tree.body[0], ast.FunctionDef)
+
+    def test_errors(self):
+        source = PythonSource(['def f(:\n', '    pass\n', '"""\n'])
+        with patch('ast.parse', wraps=ast.parse) as parse:
+            for _ in range(2):
+                with self.assertRaises(SyntaxError):
+                    source.tree
+            self.assertEqual(parse.call_count, 1)
+
+
+class SourceCacheTest(unittest.TestCase):
+
+    def test_get(self):
+        uut = Cache()
+        source = uut.get(['a = 1\n'])
+        self.assertIs(uut.get(('a = 1\n',)), source)
+        self.assertIsNot(uut.get(['a = 2\n']), source)
+        self.assertEqual(len(uut), 2)
+        self.assertEqual(uut.size, 12)
+
+        uut.clear()
+        self.assertEqual(len(uut), 0)
+        self.assertEqual(uut.size, 0)
+
+    def test_eviction(self):
+        uut = Cache(max_size=12)
+        first = uut.get(['first\n'])
+        uut.get(['second\n'])
+        self.assertEqual(len(uut), 1)
+
+        uut.max_size = 100
+        second = uut.get(['second\n'])
+        uut.get(['third\n'])
+        uut.get(['second\n'])
+        uut.max_size = 14
+        uut.get(['fourth\n'])
+        self.assertIs(uut.get(['second\n']), second)
+        self.assertIsNot(uut.get(['first\n']), first)
+
+    def test_oversized_source(self):
+        uut = Cache(max_size=1)
+        source = uut.get(['long line\n'])
+        self.assertIs(uut.get(['long line\n']), source)
+
+    def test_get_python_source(self):
+        with patch.object(SourceCache, 'source_cache', Cache()) as cache:
+            source = get_python_source(['x\n'])
+            self.assertIs(cache.get(['x\n']), source)
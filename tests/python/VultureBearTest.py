@@ -1,12 +1,18 @@
+import os
 import unittest
 from queue import Queue
+from tempfile import TemporaryDirectory
 from textwrap import dedent
 from contextlib import ExitStack, contextmanager
+from unittest.mock import patch
 
 from coala_utils.ContextManagers import prepare_file
 from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
 
+from bears.python import VultureBear as VultureBearModule
 from bears.python.VultureBear import VultureBear
+from bears.utils.LinterResultCache import ResultCache
 
 
 class VultureBearTest(unittest.TestCase):
@@ -16,6 +22,13 @@ class VultureBearTest(unittest.TestCase):
         self.queue = Queue()
         self.file_dict = {}
         self.uut = VultureBear(self.file_dict, self.section, self.queue)
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = ResultCache(os.path.join(directory.name, 'cache'))
+        self.addCleanup(self.cache.close)
+        patcher = patch.object(VultureBearModule, 'result_cache', self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def get_results(self, *files):
         """
@@ -35,12 +48,12 @@ class VultureBearTest(unittest.TestCase):
                         tempfile_kwargs={'suffix': '.py'}
                     ) as lines_filename:
                         lines, filename = lines_filename
-                        self.file_dict[filename] = file
+                        self.file_dict[filename] = lines
                         yield
 
                 stack.enter_context(prep_file())
 
-            return list(self.uut.run())
+            return self.uut.execute()
 
     def test_used_variable(self):
         good_file = """
@@ -124,3 +137,43 @@ class VultureBearTest(unittest.TestCase):
         result = self.get_results(bad_file)
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0].confidence, 70)
+
+    def test_index_reused(self):
+        used_file = """
+        from module import function
+        function()
+        """
+        definition_file = """
+        def function():
+            pass
+
+        def unused():
+            pass
+        """
+        results = self.get_results(used_file, definition_file)
+        self.assertEqual([result.message for result in results],
+                         ['Unused function: unused'])
+        self.assertEqual(self.cache.misses, 2)
+
+        with patch.object(VultureBearModule, 'get_file_index',
+                          wraps=VultureBearModule.get_file_index) as scan:
+            self.file_dict.clear()
+            self.assertEqual(
+                [result.message
+                 for result in self.get_results(used_file, definition_file)],
+                ['Unused function: unused'])
+            self.assertFalse(scan.called)
+
+            self.file_dict.clear()
+            results = self.get_results(
+                used_file.replace('function()', 'print()'), definition_file)
+            self.assertEqual(scan.call_count, 1)
+        self.assertEqual(sorted(result.message for result in results),
+                         ['Unused function: function',
+                          'Unused function: unused',
+                          'Unused import: function'])
+
+    def test_cache_disabled(self):
+        self.section.append(Setting('use_result_cache', False))
+        self.assertEqual(len(self.get_results('x = 2\n')), 1)
+        self.assertEqual(self.cache.misses, 0)
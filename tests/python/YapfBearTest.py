@@ -1,8 +1,13 @@
+import os
 import sys
 from queue import Queue
+from tempfile import TemporaryDirectory
 from unittest.case import skipIf
+from unittest.mock import patch
 
-from bears.python.YapfBear import YapfBear
+from yapf.yapflib import style
+
+from bears.python.YapfBear import get_style, YapfBear
 from coalib.testing.LocalBearTestHelper import LocalBearTestHelper
 from coalib.testing.BearTestHelper import generate_skip_decorator
 from coalib.settings.Section import Section
@@ -85,3 +90,49 @@ class YapfBearTest(LocalBearTestHelper):
                              'xxxxxxxxxxxxxxxxxxx + 222222222\n',
                              ')\n'],
                             valid=True)
+
+    def test_style_reused(self):
+        get_style.cache_clear()
+        with patch.object(style, 'CreateStyleFromConfig',
+                          wraps=style.CreateStyleFromConfig) as create:
+            self.check_validity(self.uut, ['a = 2\n'], valid=True)
+            self.check_invalidity(self.uut, ['a=2\n'])
+            # FormatCode itself only looks up the global style.
+            configs = [call[0][0] for call in create.call_args_list]
+            self.assertEqual(len([config for config in configs
+                                  if config is not None]), 1)
+
+            self.section.append(Setting('max_line_length', 20))
+            self.check_invalidity(self.uut,
+                                  ['a = [1111111, 2222222, 3333]\n'])
+            self.assertEqual(get_style.cache_info().currsize, 2)
+
+    def test_vcs_diff_file(self):
+        file = ['a=1\n', 'b = 2\n', 'c=3\n', 'd=4\n']
+        with TemporaryDirectory() as directory:
+            diff_file = os.path.join(directory, 'changes.diff')
+            with open(diff_file, 'w') as fl:
+                fl.write('diff --git a/x.py b/x.py\n'
+                         '--- a/x.py\n'
+                         '+++ b/x.py\n'
+                         '@@ -2,0 +3 @@ b = 2\n'
+                         '+c=3\n'
+                         '--- a/y.py\n'
+                         '+++ /dev/null\n'
+                         '@@ -1 +0,0 @@\n'
+                         '-y = 1\n')
+            self.section.append(Setting('vcs_diff_file', diff_file))
+            self.section.append(Setting('project_dir', directory))
+
+            results = self.check_invalidity(
+                self.uut, file, filename=os.path.join(directory, 'x.py'))
+            self.assertEqual(len(results), 1, str(results))
+            self.assertEqual(results[0].affected_code[0].start.line, 3)
+
+            self.check_validity(self.uut, file, valid=True,
+                                filename=os.path.join(directory, 'y.py'))
+
+            self.section.append(Setting('vcs_diff_file',
+                                        diff_file + '.missing'))
+            self.check_validity(self.uut, file, valid=True,
+                                filename=os.path.join(directory, 'x.py'))
@@ -1,62 +1,88 @@
+import json
+import os
 from queue import Queue
+from tempfile import TemporaryDirectory
 from unittest import mock
 
-from safety.safety import Vulnerability
+from safety.errors import DatabaseFetchError
 
 from bears.python.requirements.PySafetyBear import PySafetyBear, Package
+from bears.python.requirements.VulnerabilityIndex import VulnerabilityIndex
 from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
 from coalib.testing.LocalBearTestHelper import LocalBearTestHelper
 
 
+DATABASE = {
+    '$meta': {},
+    'bar': [{'v': '<0.2', 'description': 'foo', 'changelog': 'bar'}],
+    'baz': [{'v': '<2.0', 'description': 'foo', 'cve': 'CVE-2016-9999'}],
+}
+
+
 class PySafetyBearTest(LocalBearTestHelper):
 
     def setUp(self):
-        self.uut = PySafetyBear(Section('name'), Queue())
+        self.section = Section('name')
+        self.uut = PySafetyBear(self.section, Queue())
+        self.index = VulnerabilityIndex(DATABASE)
+
+    def patch_index(self):
+        return mock.patch(
+            'bears.python.requirements.PySafetyBear.get_vulnerability_index',
+            return_value=self.index)
 
     def test_without_vulnerability(self):
-        with mock.patch(
-            'bears.python.requirements.PySafetyBear.safety.check',
-            return_value=[],
-        ) as check:
+        with self.patch_index() as get_index, \
+                mock.patch.object(self.index, 'check',
+                                  wraps=self.index.check) as check:
             self.check_validity(self.uut, ['# whee', 'foo==1.0', '# whee'])
-            check.assert_called_once_with(packages=[Package('foo', '1.0')])
+            get_index.assert_called_once_with('')
+            check.assert_called_once_with([Package('foo', '1.0')])
 
     def test_with_vulnerability(self):
-        vuln_data = {
-            'description': 'foo',
-            'changelog': 'bar',
-        }
-        with mock.patch(
-            'bears.python.requirements.PySafetyBear.safety.check',
-            return_value=[Vulnerability('bar', '<0.2', '0.1', vuln_data)],
-        ) as check:
+        with self.patch_index():
             self.check_invalidity(self.uut, ['foo<2', 'bar==0.1'])
-            check.assert_called_once_with(packages=[Package('bar', '0.1')])
 
     def test_with_cve_vulnerability(self):
-        vuln_data = {
-            'description': 'foo',
-            'cve': 'CVE-2016-9999',
-        }
-        with mock.patch(
-            'bears.python.requirements.PySafetyBear.safety.check',
-            return_value=[Vulnerability('baz', '<2.0', '1.10', vuln_data)],
-        ) as check:
-            self.check_invalidity(self.uut, ['baz==1.10', '-e .'])
-            check.assert_called_once_with(packages=[Package('baz', '1.10')])
+        with self.patch_index():
+            results = self.uut.execute('requirements.txt',
+                                       ['barbaz==1.0\n', 'Baz==1.10\n',
+                                        '-e .\n'])
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].message,
+                         'baz<2.0 is vulnerable to CVE-2016-9999 and your '
+                         'project is using 1.10.')
+        self.assertEqual(results[0].additional_info, 'foo')
+        affected_code = results[0].affected_code[0]
+        self.assertEqual((affected_code.start.line, affected_code.start.column,
+                          affected_code.end.column), (2, 6, 10))
 
     def test_with_no_requirements(self):
-        with mock.patch(
-            'bears.python.requirements.PySafetyBear.safety.check',
-            return_value=[],
-        ) as check:
+        with self.patch_index() as get_index:
             self.check_validity(self.uut, [])
-            assert not check.called
+            assert not get_index.called
 
     def test_with_no_pinned_requirements(self):
-        with mock.patch(
-            'bears.python.requirements.PySafetyBear.safety.check',
-            return_value=[],
-        ) as check:
+        with self.patch_index() as get_index:
             self.check_validity(self.uut, ['foo', 'bar>2'])
-            assert not check.called
+            assert not get_index.called
+
+    def test_local_database(self):
+        with TemporaryDirectory() as directory:
+            database = os.path.join(directory, 'insecure_full.json')
+            with open(database, 'w') as fl:
+                json.dump(DATABASE, fl)
+            self.section.append(Setting('safety_database', database))
+            with mock.patch('bears.python.requirements.VulnerabilityIndex.'
+                            '_indices', {}):
+                self.check_invalidity(self.uut, ['bar==0.1'])
+
+    def test_database_error(self):
+        with mock.patch(
+                'bears.python.requirements.PySafetyBear.'
+                'get_vulnerability_index',
+                side_effect=DatabaseFetchError()), \
+                mock.patch.object(self.uut, 'err') as err:
+            self.check_validity(self.uut, ['bar==0.1'])
+            self.assertTrue(err.called)
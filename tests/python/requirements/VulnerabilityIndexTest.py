@@ -0,0 +1,81 @@
+import json
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from bears.python.requirements import VulnerabilityIndex as IndexModule
+from bears.python.requirements.VulnerabilityIndex import (
+    clear_vulnerability_indices, get_vulnerability_index, VulnerabilityIndex)
+
+
+DATABASE = {
+    '$meta': {'advisory': 'x'},
+    'Django': [{'v': '<1.8.10,>=1.8', 'cve': 'CVE-1', 'description': 'a'},
+               {'v': '<1.8.10,>=1.8', 'changelog': 'b'},
+               {'v': '<1.4', 'changelog': 'c'}],
+    'py_foo': [{'v': '==0.1', 'changelog': 'd'}],
+}
+
+
+class VulnerabilityIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.uut = VulnerabilityIndex(DATABASE)
+
+    def test_index(self):
+        self.assertEqual(sorted(self.uut.vulnerabilities),
+                         ['django', 'py-foo'])
+        self.assertEqual(len(self.uut.vulnerabilities['django']), 2)
+
+    def test_check(self):
+        vulnerabilities = self.uut.check([('django', '1.8.5'),
+                                          ('Django', '1.9'),
+                                          ('py-foo', '0.1'),
+                                          ('unknown', '1.0')])
+        self.assertEqual(
+            [(vulnerability.name, vulnerability.spec, vulnerability.version,
+              vulnerability.description)
+             for vulnerability in vulnerabilities],
+            [('django', '<1.8.10,>=1.8', '1.8.5', 'a'),
+             ('django', '<1.8.10,>=1.8', '1.8.5', 'b'),
+             ('py-foo', '==0.1', '0.1', 'd')])
+
+    def test_load_file(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'insecure_full.json')
+            with open(path, 'w') as fl:
+                json.dump(DATABASE, fl)
+            index = VulnerabilityIndex.load(path)
+        self.assertEqual(index.vulnerabilities.keys(),
+                         self.uut.vulnerabilities.keys())
+
+        with self.assertRaises(OSError):
+            VulnerabilityIndex.load(path)
+
+    def test_load_url(self):
+        with mock.patch('requests.get') as get:
+            get.return_value.json.return_value = DATABASE
+            index = VulnerabilityIndex.load('https://example.com/db.json')
+            self.assertEqual(get.call_args[1]['url'],
+                             'https://example.com/db.json')
+        self.assertIn('py-foo', index.vulnerabilities)
+
+    def test_load_mirror(self):
+        with mock.patch.object(IndexModule, 'fetch_database',
+                               return_value=DATABASE) as fetch_database:
+            index = VulnerabilityIndex.load()
+            fetch_database.assert_called_once_with(full=True)
+        self.assertIn('django', index.vulnerabilities)
+
+    def test_get_vulnerability_index(self):
+        self.addCleanup(clear_vulnerability_indices)
+        with mock.patch.object(IndexModule, 'fetch_database',
+                               return_value=DATABASE) as fetch_database:
+            index = get_vulnerability_index()
+            self.assertIs(get_vulnerability_index(''), index)
+            self.assertEqual(fetch_database.call_count, 1)
+
+            clear_vulnerability_indices()
+            self.assertIsNot(get_vulnerability_index(), index)
+            self.assertEqual(fetch_database.call_count, 2)
@@ -0,0 +1,9 @@
+from bears.shell.ShellCheckBatchBear import ShellCheckBatchBear
+from tests.shell.ShellCheckBearTest import (
+    invalid_file, trigger_sc2060, trigger_sc2164, valid_file)
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+
+
+ShellCheckBatchBearTest = verify_batched_linter(
+    ShellCheckBatchBear,
+    files=(valid_file, invalid_file, trigger_sc2164, trigger_sc2060))
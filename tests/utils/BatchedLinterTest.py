@@ -0,0 +1,180 @@
+import os
+import sys
+import unittest
+from contextlib import ExitStack
+from queue import Queue
+from unittest.mock import patch
+
+from coala_utils.ContextManagers import prepare_file
+from coalib.bearlib.abstractions.Linter import linter
+from coalib.misc.Shell import run_shell_command
+from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
+
+from bears.utils.BatchedLinter import (
+    batched_linter, chunk_filenames, get_max_arguments_length)
+
+
+# Prints the first line of every file given, optionally prefixed with
+# ``--file=``, together with the config file contents if there are any.
+LINT_SCRIPT = """
+import sys
+args = sys.argv[1:]
+config = ''
+if args[0].startswith('--config='):
+    with open(args.pop(0)[len('--config='):]) as fl:
+        config = fl.read()
+for arg in args:
+    name = arg[len('--file='):] if arg.startswith('--file=') else arg
+    with open(name) as fl:
+        print('{}:1: {}{}'.format(arg, config, fl.readline().strip()))
+        print('  continued')
+"""
+
+
+@linter(executable=sys.executable,
+        output_format='regex',
+        output_regex=r'.+:(?P<line>\d+): (?P<message>.+)\n  continued')
+class FirstLineBear:
+
+    @staticmethod
+    def generate_config(filename, file, config_per_file: bool=False):
+        return file[0].strip() + ' ' if config_per_file else None
+
+    @staticmethod
+    def create_arguments(filename, file, config_file,
+                         separate_filename: bool=True):
+        args = ('-c', LINT_SCRIPT)
+        if config_file:
+            args += ('--config=' + config_file,)
+        return args + ((filename,) if separate_filename
+                       else ('--file=' + filename,))
+
+
+@batched_linter(FirstLineBear, output_filename_regex=r'(?P<filename>.+):1: ')
+class FirstLineBatchBear:
+    """
+    Batched version of ``FirstLineBear``.
+    """
+
+
+class BatchedLinterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.section = Section('name')
+        self.stack = ExitStack()
+        self.file_dict = {}
+        for content in ('first\n', 'second\n', 'first\n'):
+            file, filename = self.stack.enter_context(
+                prepare_file([content], None))
+            self.file_dict[filename] = file
+        self.uut = FirstLineBatchBear(self.file_dict, self.section, Queue())
+
+    def tearDown(self):
+        self.stack.close()
+
+    def get_single_results(self):
+        results = []
+        for filename, file in self.file_dict.items():
+            results += self.uut.linter.execute(filename, file)
+        return results
+
+    def test_metadata(self):
+        self.assertEqual(FirstLineBatchBear.get_metadata().desc,
+                         'Batched version of ``FirstLineBear``.')
+        self.assertEqual(
+            set(FirstLineBatchBear.get_metadata().optional_params),
+            {'config_per_file', 'separate_filename'})
+        self.assertTrue(FirstLineBatchBear.check_prerequisites())
+        self.assertIn('batched linter object', repr(self.uut))
+
+    def test_invalid_options(self):
+        with self.assertRaisesRegex(ValueError, 'output streams'):
+            batched_linter(FirstLineBear, output_filename_regex='.*',
+                           use_stdout=False)
+
+        with self.assertRaisesRegex(ValueError, 'split_output'):
+            batched_linter(FirstLineBear)(type('Bear', (), {}))
+
+    def test_same_results(self):
+        with patch('bears.utils.BatchedLinter.run_shell_command',
+                   wraps=run_shell_command) as run:
+            results = self.uut.execute()
+            self.assertEqual(run.call_count, 1)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(sorted(result.message for result in results),
+                         ['first', 'first', 'second'])
+        self.assertEqual(sorted(results), sorted(self.get_single_results()))
+
+    def test_chunked(self):
+        self.uut.max_arguments_length = 1
+        with patch('bears.utils.BatchedLinter.run_shell_command',
+                   wraps=run_shell_command) as run:
+            results = self.uut.execute()
+            self.assertEqual(run.call_count, 3)
+
+        self.assertEqual(sorted(results), sorted(self.get_single_results()))
+
+    def test_grouped_by_config(self):
+        self.section.append(Setting('config_per_file', 'True'))
+        groups, single_files = self.uut._group_files(
+            {'config_per_file': True}, {})
+        self.assertEqual(sorted(len(group) for group in groups.values()),
+                         [1, 2])
+        self.assertEqual(single_files, [])
+
+        results = self.uut.execute()
+        self.assertEqual(sorted(result.message for result in results),
+                         ['first first', 'first first', 'second second'])
+        self.assertEqual(sorted(results), sorted(self.get_single_results()))
+
+    def test_single_files(self):
+        self.section.append(Setting('separate_filename', 'False'))
+        groups, single_files = self.uut._group_files(
+            {}, {'separate_filename': False})
+        self.assertEqual(groups, {})
+        self.assertEqual(single_files, sorted(self.file_dict))
+
+        results = self.uut.execute()
+        self.assertEqual(sorted(results), sorted(self.get_single_results()))
+
+    def test_split_output(self):
+        filenames = sorted(self.file_dict)
+        output = ('garbage\n' +
+                  filenames[0] + ':1: first\n' +
+                  'unknown:1: continued\n' +
+                  filenames[1] + ':1: second\n')
+        self.assertEqual(self.uut.split_output(output, filenames),
+                         {filenames[0]: (filenames[0] + ':1: first\n'
+                                         'unknown:1: continued\n'),
+                          filenames[1]: filenames[1] + ':1: second\n',
+                          filenames[2]: ''})
+
+
+@batched_linter(FirstLineBear, output_filename_regex=r'(?P<filename>[^:]+):',
+                strip_filename=True)
+class StrippingBatchBear:
+    pass
+
+
+class BatchedLinterStripFilenameTest(unittest.TestCase):
+
+    def test_split_output(self):
+        uut = StrippingBatchBear({}, Section('name'), Queue())
+        self.assertEqual(uut.split_output('a.py:1: x\nb.py:2: y\n',
+                                          ['a.py', 'b.py']),
+                         {'a.py': '1: x\n', 'b.py': '2: y\n'})
+
+
+class BatchedLinterUtilitiesTest(unittest.TestCase):
+
+    def test_chunk_filenames(self):
+        self.assertEqual(list(chunk_filenames([], 0, 10)), [])
+        self.assertEqual(list(chunk_filenames(['ab', 'cd', 'ef'], 2, 8)),
+                         [['ab', 'cd'], ['ef']])
+
+    def test_get_max_arguments_length(self):
+        with patch.dict(os.environ, {'X': 'x' * 100}):
+            length = get_max_arguments_length()
+        self.assertGreaterEqual(length, 4096)
@@ -0,0 +1,65 @@
+import unittest
+from contextlib import ExitStack
+from queue import Queue
+from tempfile import TemporaryDirectory
+
+from coala_utils.ContextManagers import prepare_file
+from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
+from coalib.testing.BearTestHelper import generate_skip_decorator
+
+
+def verify_batched_linter(batched_bear,
+                          files,
+                          settings={},
+                          tempfile_kwargs={},
+                          separate_directories=False):
+    """
+    Generates a test checking that a batched linter yields the same results
+    as the linter it wraps does when run on every file on its own.
+
+    :param batched_bear:    The batched bear class to test.
+    :param files:           The file contents to check, at least one of them
+                            has to yield results.
+    :param settings:        A dictionary of keys and values (both string)
+                            from which settings will be created.
+    :param tempfile_kwargs: Kwargs passed to tempfile.mkstemp() when creating
+                            the files.
+    :param separate_directories:
+                            Whether to create every file in a directory of
+                            its own, e.g. so that they belong to different
+                            packages.
+    :return:                A unittest.TestCase object.
+    """
+    @generate_skip_decorator(batched_bear)
+    class BatchedLinterTest(unittest.TestCase):
+
+        def setUp(self):
+            self.section = Section('name')
+            for name, value in settings.items():
+                self.section.append(Setting(name, value))
+
+        def test_same_results(self):
+            with ExitStack() as stack:
+                file_dict = {}
+                for content in files:
+                    kwargs = dict(tempfile_kwargs)
+                    if separate_directories:
+                        kwargs['dir'] = stack.enter_context(
+                            TemporaryDirectory())
+                    file, filename = stack.enter_context(prepare_file(
+                        content.splitlines(keepends=True),
+                        None,
+                        tempfile_kwargs=kwargs))
+                    file_dict[filename] = file
+
+                uut = batched_bear(file_dict, self.section, Queue())
+                batched_results = uut.execute()
+                single_results = []
+                for filename, file in file_dict.items():
+                    single_results += uut.linter.execute(filename, file)
+
+            self.assertNotEqual(batched_results, [])
+            self.assertEqual(sorted(batched_results), sorted(single_results))
+
+    return BatchedLinterTest
@@ -0,0 +1,205 @@
+import os
+import subprocess
+import sys
+import threading
+import unittest
+from queue import Queue
+from tempfile import TemporaryDirectory
+
+from coalib.bearlib.abstractions.Linter import linter
+from coalib.bears.GlobalBear import GlobalBear
+from coalib.bears.LocalBear import LocalBear
+from coalib.misc import Shell
+from coalib.results.HiddenResult import HiddenResult
+from coalib.results.Result import Result
+from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
+
+from bears.utils.BearInstrumentation import (
+    aggregate_records, format_report, instrumented_bear,
+    InstrumentedBearMixin, measure_subprocesses, new_record, read_records,
+    write_record)
+
+
+@instrumented_bear
+class LineBear(LocalBear):
+    """
+    Yields a result for every line.
+    """
+
+    def run(self, filename, file, prefix: str=''):
+        for line_nr, line in enumerate(file, start=1):
+            yield Result.from_values(self, prefix + line, filename, line_nr)
+
+
+class FileCountBear(InstrumentedBearMixin, GlobalBear):
+
+    def run(self):
+        yield Result(self, str(len(self.file_dict)))
+
+
+@instrumented_bear
+@linter(executable=sys.executable,
+        output_format='regex',
+        output_regex=r'(?P<line>\d+): (?P<message>.*)')
+class EmptyLineBear:
+    """
+    Finds empty lines.
+    """
+
+    @staticmethod
+    def create_arguments(filename, file, config_file):
+        return ('-c',
+                'import sys\n'
+                'for nr, line in enumerate(open(sys.argv[1]), 1):\n'
+                '    if not line.strip(): print(nr, ": empty", sep="")',
+                filename)
+
+
+class MeasureSubprocessesTest(unittest.TestCase):
+
+    def test_measurements(self):
+        record = new_record('Bear', None, 0)
+        with measure_subprocesses(record):
+            Shell.run_shell_command((sys.executable, '-c', 'pass'))
+            Shell.run_shell_command((sys.executable, '-c', 'print(1)'))
+            subprocess.check_output((sys.executable, '-c', 'print(1)'))
+        self.assertEqual(record['subprocesses'], 2)
+        self.assertGreater(record['spawn_time'], 0)
+        self.assertGreater(record['wait_time'], 0)
+
+    def test_other_threads(self):
+        record = new_record('Bear', None, 0)
+        with measure_subprocesses(record):
+            thread = threading.Thread(target=Shell.run_shell_command,
+                                      args=((sys.executable, '-c', 'pass'),))
+            thread.start()
+            thread.join()
+        self.assertEqual(record['subprocesses'], 0)
+        self.assertEqual(record['wait_time'], 0)
+
+    def test_restored(self):
+        popen = Shell.Popen
+        with self.assertRaises(OSError):
+            with measure_subprocesses(new_record('Bear', None, 0)) as record:
+                Shell.Popen(('not-an-executable-xyz',))
+        self.assertIs(Shell.Popen, popen)
+        self.assertEqual(record['subprocesses'], 0)
+
+
+class InstrumentedBearTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.records_file = os.path.join(self.directory.name, 'sub',
+                                         'records.jsonl')
+        self.section = Section('name')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_disabled(self):
+        results = LineBear(self.section, Queue()).execute('f', ['a\n', 'b\n'])
+        self.assertEqual(len(results), 2)
+        self.assertFalse(any(isinstance(result, HiddenResult)
+                             for result in results))
+        self.assertEqual(LineBear.__name__, 'LineBear')
+        self.assertIn('prefix', LineBear.get_metadata().optional_params)
+
+    def test_local_bear(self):
+        self.section.append(Setting('instrumentation_file',
+                                    self.records_file))
+        self.section.append(Setting('instrumentation_result', 'True'))
+        self.section.append(Setting('prefix', '>'))
+        uut = LineBear(self.section, Queue())
+        results = uut.execute('f', ['a\n', 'bc\n'])
+        results += uut.execute('g', [])
+
+        self.assertEqual(results[0].message, '>a\n')
+        hidden_results = [result for result in results
+                          if isinstance(result, HiddenResult)]
+        self.assertEqual(len(hidden_results), 2)
+        record = hidden_results[0].contents
+        self.assertEqual((record['bear'], record['file'], record['bytes'],
+                          record['results'], record['subprocesses']),
+                         ('LineBear', 'f', 5, 2, 0))
+        self.assertGreaterEqual(record['wall_time'], 0)
+        self.assertGreaterEqual(record['cpu_time'], 0)
+
+        records = read_records(self.records_file)
+        self.assertEqual([dict(record) for record in records],
+                         [dict(result.contents)
+                          for result in hidden_results])
+
+    def test_global_bear(self):
+        self.section.append(Setting('instrumentation_result', 'True'))
+        uut = FileCountBear({'a': ['ab\n'], 'b': ['c\n']},
+                            self.section, Queue())
+        results = uut.execute()
+        self.assertEqual(results[0].message, '2')
+        record = results[1].contents
+        self.assertEqual((record['bear'], record['file'], record['bytes'],
+                          record['results']),
+                         ('FileCountBear', None, 5, 1))
+
+    def test_linter_bear(self):
+        filename = os.path.join(self.directory.name, 'file')
+        file = ['a\n', '\n', 'b\n']
+        with open(filename, 'w') as fl:
+            fl.writelines(file)
+        self.section.append(Setting('instrumentation_file',
+                                    self.records_file))
+        uut = EmptyLineBear(self.section, Queue())
+        results = uut.execute(filename, file)
+        self.assertEqual([result.message for result in results], ['empty'])
+
+        record, = read_records(self.records_file)
+        self.assertEqual((record['bear'], record['file'], record['results'],
+                          record['subprocesses']),
+                         ('EmptyLineBear', filename, 1, 1))
+        self.assertGreater(record['wait_time'], 0)
+        self.assertGreaterEqual(record['wall_time'], record['wait_time'])
+
+
+class ReportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.records = []
+        for bear, filename, wall_time in (('A', 'x', 1), ('A', 'y', 3),
+                                          ('B', 'x', 2), ('A', 'x', 0.5),
+                                          ('C', None, 0.1)):
+            record = new_record(bear, filename, 10)
+            record['wall_time'] = wall_time
+            self.records.append(record)
+
+    def test_aggregate_records(self):
+        self.assertEqual(
+            [(entry['bear'], entry['file'], entry['wall_time'],
+              entry['bytes'], entry['runs'])
+             for entry in aggregate_records(self.records)],
+            [('A', 'y', 3, 10, 1), ('B', 'x', 2, 10, 1),
+             ('A', 'x', 1.5, 20, 2), ('C', None, 0.1, 10, 1)])
+        self.assertEqual(
+            [(entry['bear'], entry['wall_time'])
+             for entry in aggregate_records(self.records, ('bear',))],
+            [('A', 4.5), ('B', 2), ('C', 0.1)])
+
+    def test_read_records(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'records.jsonl')
+            write_record(path, self.records[0])
+            with open(path, 'a') as file:
+                file.write('{"bear": \n')
+            write_record(path, self.records[1])
+            self.assertEqual(read_records(path), self.records[:2])
+
+    def test_format_report(self):
+        lines = format_report(self.records, count=2)
+        self.assertEqual(lines[0], 'Bears by total time:')
+        self.assertTrue(lines[2].startswith('A '))
+        self.assertIn('4.500s', lines[2])
+        self.assertEqual(lines[5:7], ['', 'Slowest bear/file pairs:'])
+        self.assertEqual(lines[7], lines[1])
+        self.assertTrue(lines[8].startswith('A '))
+        self.assertTrue(lines[10].startswith('B '))
+        self.assertEqual((lines[9], lines[11:]), ('  y', ['  x']))
@@ -0,0 +1,186 @@
+import os
+import sys
+import unittest
+from contextlib import ExitStack
+from queue import Queue
+from unittest.mock import patch
+
+from coala_utils.ContextManagers import prepare_file
+from coalib.bearlib.abstractions.Linter import linter
+from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
+
+from bears.utils.BatchedLinter import batched_linter
+from bears.utils.InProcessLinter import captured_output, in_process_linter
+
+
+# Prints the first line of every file given, prefixed with the process id if
+# ``--pid`` is given.
+LINT_SCRIPT = """
+import os
+import sys
+args = sys.argv[1:]
+prefix = ''
+if args[0] == '--pid':
+    prefix = str(os.getpid()) + ' '
+    args.pop(0)
+for name in args:
+    with open(name) as fl:
+        print('{}:1: {}{}'.format(name, prefix, fl.readline().strip()))
+"""
+
+
+def first_line_engine(arguments, filename, file):
+    with captured_output() as (stdout, stderr):
+        prefix = str(os.getpid()) + ' ' if '--pid' in arguments else ''
+        print('{}:1: {}{}'.format(filename, prefix, file[0].strip()))
+    return stdout.getvalue()
+
+
+@in_process_linter(first_line_engine)
+@linter(executable=sys.executable,
+        output_format='regex',
+        output_regex=r'.+:(?P<line>\d+): (?P<message>.+)')
+class FirstLineBear:
+    """
+    Reports the first line of a file.
+    """
+
+    @staticmethod
+    def create_arguments(filename, file, config_file,
+                         print_pid: bool=False,
+                         broken_arguments: bool=False):
+        if broken_arguments:
+            return None
+        return ('-c', LINT_SCRIPT) + (('--pid',) if print_pid else ()) + (
+            filename,)
+
+
+@batched_linter(FirstLineBear, output_filename_regex=r'(?P<filename>.+):1: ')
+class FirstLineBatchBear:
+    """
+    Batched version of ``FirstLineBear``.
+    """
+
+
+class CapturedOutputTest(unittest.TestCase):
+
+    def test_captured_output(self):
+        argv = sys.argv
+        with captured_output(['tool', 'argument']) as (stdout, stderr):
+            self.assertEqual(sys.argv, ['tool', 'argument'])
+            print('out')
+            print('err', file=sys.stderr)
+        self.assertIs(sys.argv, argv)
+        self.assertEqual(stdout.getvalue(), 'out\n')
+        self.assertEqual(stderr.getvalue(), 'err\n')
+
+    def test_argv_restored_on_error(self):
+        argv = sys.argv
+        with self.assertRaises(SystemExit):
+            with captured_output(['tool']):
+                sys.exit(1)
+        self.assertIs(sys.argv, argv)
+
+
+class InProcessLinterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.section = Section('name')
+        self.uut = FirstLineBear(self.section, Queue())
+        stack = ExitStack()
+        self.addCleanup(stack.close)
+        self.file, self.filename = stack.enter_context(prepare_file(
+            ['first\n', 'second\n'], None))
+
+    def execute(self):
+        return self.uut.execute(self.filename, self.file)
+
+    def test_metadata(self):
+        self.assertEqual(FirstLineBear.__name__, 'FirstLineBear')
+        metadata = FirstLineBear.get_metadata()
+        self.assertEqual(metadata.desc, 'Reports the first line of a file.')
+        self.assertIn('in_process', metadata.optional_params)
+        self.assertIn('print_pid', metadata.optional_params)
+
+    def test_in_process(self):
+        self.section.append(Setting('print_pid', True))
+        with patch('coalib.bearlib.abstractions.Linter.run_shell_command'
+                   ) as run_shell_command:
+            results = self.execute()
+            self.assertFalse(run_shell_command.called)
+
+        self.assertEqual([result.message for result in results],
+                         ['{} first'.format(os.getpid())])
+
+    def test_executable(self):
+        self.section.append(Setting('in_process', False))
+        self.section.append(Setting('print_pid', True))
+        results = self.execute()
+        self.assertEqual(len(results), 1)
+        self.assertNotEqual(results[0].message,
+                            '{} first'.format(os.getpid()))
+        self.assertTrue(results[0].message.endswith(' first'))
+
+    def test_same_results(self):
+        results = self.execute()
+        self.section.append(Setting('in_process', False))
+        self.assertEqual(sorted(results), sorted(self.execute()))
+
+    def test_invalid_arguments(self):
+        self.section.append(Setting('broken_arguments', True))
+        with patch.object(FirstLineBear, 'err') as err:
+            self.assertEqual(self.execute(), [])
+            err.assert_called_once_with(
+                'The given arguments None are not iterable.')
+
+
+class InProcessBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stack = ExitStack()
+        self.addCleanup(self.stack.close)
+        self.section = Section('name')
+        self.file_dict = {}
+        for content in ('a\n', 'b\n', 'c\n', 'd\n'):
+            file, filename = self.stack.enter_context(
+                prepare_file([content], None))
+            self.file_dict[filename] = file
+
+    def execute(self):
+        uut = FirstLineBatchBear(self.file_dict, self.section, Queue())
+        return uut.execute()
+
+    def test_metadata(self):
+        metadata = FirstLineBatchBear.get_metadata()
+        self.assertIn('in_process', metadata.optional_params)
+        self.assertIn('in_process_jobs', metadata.optional_params)
+
+    def test_in_process(self):
+        with patch('bears.utils.BatchedLinter.run_shell_command'
+                   ) as run_shell_command, \
+                patch('bears.utils.BatchedLinter.Pool') as pool:
+            results = self.execute()
+            self.assertFalse(run_shell_command.called)
+            self.assertFalse(pool.called)
+
+        self.assertEqual(sorted(result.message for result in results),
+                         ['a', 'b', 'c', 'd'])
+        self.section.append(Setting('in_process', False))
+        self.assertEqual(sorted(results), sorted(self.execute()))
+
+    def test_jobs(self):
+        self.section.append(Setting('in_process_jobs', 2))
+        self.section.append(Setting('print_pid', True))
+        results = self.execute()
+        self.assertEqual(len(results), 4)
+        pids = {result.message.split()[0] for result in results}
+        self.assertNotIn(str(os.getpid()), pids)
+        self.assertLessEqual(len(pids), 2)
+
+    def test_invalid_arguments(self):
+        self.section.append(Setting('broken_arguments', True))
+        uut = FirstLineBatchBear(self.file_dict, self.section, Queue())
+        with patch.object(uut, 'err') as err:
+            self.assertEqual(uut.execute(), [])
+            self.assertEqual(err.call_count, 4)
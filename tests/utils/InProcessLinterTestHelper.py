@@ -0,0 +1,61 @@
+import unittest
+from contextlib import ExitStack
+from queue import Queue
+
+from coala_utils.ContextManagers import prepare_file
+from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
+from coalib.testing.BearTestHelper import generate_skip_decorator
+
+
+def verify_in_process_linter(bear,
+                             files,
+                             settings={},
+                             tempfile_kwargs={}):
+    """
+    Generates a test checking that a linter running its tool in process
+    yields the same results as when running the executable of the tool.
+
+    :param bear:            The in-process linter bear class to test.
+    :param files:           The file contents to check, at least one of them
+                            has to yield results.
+    :param settings:        A dictionary of keys and values (both string)
+                            from which settings will be created.
+    :param tempfile_kwargs: Kwargs passed to tempfile.mkstemp() when creating
+                            the files.
+    :return:                A unittest.TestCase object.
+    """
+    @generate_skip_decorator(bear)
+    class InProcessLinterTest(unittest.TestCase):
+
+        def get_results(self, in_process, file_dict):
+            section = Section('name')
+            for name, value in settings.items():
+                section.append(Setting(name, value))
+            section.append(Setting('in_process', str(in_process)))
+            section.append(Setting('use_result_cache', 'False'))
+
+            uut = bear(section, Queue())
+            results = []
+            for filename, file in file_dict.items():
+                results += uut.execute(filename, file)
+            return results
+
+        def test_same_results(self):
+            with ExitStack() as stack:
+                file_dict = {}
+                for content in files:
+                    file, filename = stack.enter_context(prepare_file(
+                        content.splitlines(keepends=True),
+                        None,
+                        tempfile_kwargs=tempfile_kwargs))
+                    file_dict[filename] = file
+
+                in_process_results = self.get_results(True, file_dict)
+                executable_results = self.get_results(False, file_dict)
+
+            self.assertNotEqual(in_process_results, [])
+            self.assertEqual(sorted(in_process_results),
+                             sorted(executable_results))
+
+    return InProcessLinterTest
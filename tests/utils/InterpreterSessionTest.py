@@ -0,0 +1,129 @@
+import os
+import sys
+import unittest
+from queue import Queue
+from unittest.mock import patch
+
+from coalib.bearlib.abstractions.Linter import linter
+from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
+
+from bears.utils import InterpreterSession
+from bears.utils.InterpreterSession import (
+    close_sessions, get_session, interpreter_session)
+
+
+PYTHON_SESSION_LOOP = """import os, sys
+calls = 0
+for line in sys.stdin:
+    calls += 1
+    try:
+        exec(line)
+    except Exception as error:
+        print(error, file=sys.stderr)
+    print('\\n' + os.environ['COALA_SESSION_DELIMITER'], flush=True)
+"""
+
+
+@interpreter_session('-c', PYTHON_SESSION_LOOP)
+@linter(executable=sys.executable,
+        output_format='regex',
+        output_regex=r'(?P<line>\d+): (?P<message>.+)')
+class LineCountBear:
+    """
+    Reports the number of lines of each file.
+    """
+
+    @staticmethod
+    def create_arguments(filename, file, config_file, prefix: str='lines'):
+        return ('-c',
+                'print("1: {} %d" % len(open({!r}).readlines()))'.format(
+                    prefix, filename))
+
+
+class InterpreterSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(close_sessions)
+        self.session = get_session((sys.executable, '-c',
+                                    PYTHON_SESSION_LOOP))
+
+    def test_evaluate(self):
+        self.assertEqual(self.session.evaluate('print(1)\nprint(2)'), '')
+        self.assertEqual(self.session.evaluate('print(1); print(2)'),
+                         '1\n2\n')
+        self.assertEqual(self.session.evaluate('print(calls, end="")'), '3')
+        self.assertEqual(self.session.evaluate('print("no newline", '
+                                               'end="")'),
+                         'no newline')
+
+    def test_restart(self):
+        self.assertEqual(self.session.evaluate('print("a"); sys.exit()'),
+                         'a\n')
+        self.assertIsNone(self.session.process)
+        self.assertEqual(self.session.evaluate('print(calls)'), '1\n')
+
+    def test_broken_pipe(self):
+        self.session.start()
+        with patch.object(self.session.process.stdin, 'write',
+                          side_effect=BrokenPipeError):
+            self.assertEqual(self.session.evaluate('print(1)'), '')
+        self.assertIsNone(self.session.process)
+
+    def test_get_session(self):
+        self.assertIs(get_session((sys.executable, '-c',
+                                   PYTHON_SESSION_LOOP)),
+                      self.session)
+        self.assertIsNot(get_session((sys.executable, '-c',
+                                      PYTHON_SESSION_LOOP), cwd='/'),
+                         self.session)
+
+    def test_close_sessions(self):
+        self.session.evaluate('')
+        process = self.session.process
+        close_sessions()
+        self.assertIsNotNone(process.poll())
+        self.assertEqual(InterpreterSession._sessions, {})
+
+
+class InterpreterSessionLinterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(close_sessions)
+        self.section = Section('name')
+        self.uut = LineCountBear(self.section, Queue())
+        self.filename = os.path.abspath(__file__)
+        with open(self.filename) as fl:
+            self.file = fl.readlines()
+
+    def run_bear(self):
+        results = self.uut.execute(self.filename, self.file)
+        return [result.message for result in results]
+
+    def test_metadata(self):
+        metadata = LineCountBear.get_metadata()
+        self.assertIn('use_session', metadata.optional_params)
+        self.assertEqual(metadata.desc,
+                         'Reports the number of lines of each file.')
+        self.assertEqual(LineCountBear.__name__, 'LineCountBear')
+
+    def test_session(self):
+        expected = ['lines {}'.format(len(self.file))]
+        with patch('coalib.bearlib.abstractions.Linter.run_shell_command'
+                   ) as run:
+            self.assertEqual(self.run_bear(), expected)
+            self.assertEqual(self.run_bear(), expected)
+            self.assertFalse(run.called)
+
+        session, = InterpreterSession._sessions.values()
+        self.assertEqual(session.evaluate('print(calls)'), '3\n')
+
+        self.section.append(Setting('prefix', 'count'))
+        self.assertEqual(self.run_bear(),
+                         ['count {}'.format(len(self.file))])
+
+    def test_session_disabled(self):
+        self.section.append(Setting('use_session', 'False'))
+        self.assertEqual(self.run_bear(),
+                         ['lines {}'.format(len(self.file))])
+        self.assertEqual(InterpreterSession._sessions, {})
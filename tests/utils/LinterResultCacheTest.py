@@ -0,0 +1,240 @@
+import os
+import pickle
+import sqlite3
+import sys
+import unittest
+from queue import Queue
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from coalib.bearlib.abstractions.Linter import linter
+from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
+
+from bears.utils import LinterResultCache
+from bears.utils.LinterResultCache import (
+    cached_linter, get_executable_version, ResultCache)
+
+
+@cached_linter
+@linter(executable=sys.executable,
+        output_format='corrected')
+class UpperCaseBear:
+    """
+    Suggests writing everything in upper case.
+    """
+
+    RESULT_CACHE_FILE_SETTINGS = ('prefix_file',)
+
+    @staticmethod
+    def generate_config(filename, file, config: str=''):
+        return config or None
+
+    @staticmethod
+    def create_arguments(filename, file, config_file, fail: bool=False,
+                         prefix_file: str=''):
+        if fail:
+            return 42
+        return ('-c',
+                'import sys; print(*(open(name).read().upper() '
+                'for name in sys.argv[:0:-1]), sep="", end="")',
+                filename) + ((prefix_file,) if prefix_file else ())
+
+
+class ResultCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.uut = ResultCache(os.path.join(self.directory.name, 'sub',
+                                            'cache.sqlite3'),
+                               max_size=100)
+
+    def tearDown(self):
+        self.uut.close()
+        self.directory.cleanup()
+
+    def test_get_set(self):
+        self.assertIsNone(self.uut.get('a'))
+        self.uut.set('a', [1, 2])
+        self.assertEqual(self.uut.get('a'), [1, 2])
+        self.uut.set('a', [])
+        self.assertEqual(self.uut.get('a'), [])
+        self.assertEqual((self.uut.hits, self.uut.misses), (2, 1))
+
+    def test_get_set_many(self):
+        self.uut.max_size = 10000
+        self.uut.set_many({str(key): key for key in range(600)})
+        keys = [str(key) for key in range(-1, 700)]
+        with patch('bears.utils.LinterResultCache.MAX_QUERY_KEYS', 7):
+            self.assertEqual(self.uut.get_many(keys),
+                             {str(key): key for key in range(600)})
+        self.assertEqual((self.uut.hits, self.uut.misses), (600, 101))
+        self.assertEqual(self.uut.get_many([]), {})
+
+    def test_persistence(self):
+        self.uut.set('a', ['result'])
+        self.uut.close()
+        other = ResultCache(self.uut.path)
+        self.assertEqual(other.get('a'), ['result'])
+        other.close()
+
+    def test_eviction(self):
+        size = len(pickle.dumps('x' * 10, pickle.HIGHEST_PROTOCOL))
+        self.uut.max_size = 3 * size
+        with patch('time.time', side_effect=range(100)):
+            for key in 'abc':
+                self.uut.set(key, 'x' * 10)
+            self.assertEqual(self.uut.get('a'), 'x' * 10)
+            self.uut.set('d', 'x' * 10)
+
+        self.assertIsNone(self.uut.get('b'))
+        for key in 'acd':
+            self.assertEqual(self.uut.get(key), 'x' * 10)
+
+    def test_total_size(self):
+        self.uut.max_size = 10000
+        self.uut.set_many({'a': 'x', 'b': 'y' * 10})
+        self.uut.set('a', 'x' * 20)
+        self.uut.close()
+
+        other = ResultCache(self.uut.path)
+        with other.connection as connection:
+            self.assertEqual(
+                connection.execute('SELECT * FROM total_size').fetchall(),
+                connection.execute(
+                    'SELECT SUM(size) FROM results').fetchall())
+        other.close()
+
+    def test_last_used_written_later(self):
+        with patch('time.time', side_effect=range(100)):
+            self.uut.set('a', 1)
+            self.assertEqual(self.uut.get('a'), 1)
+
+            def last_used():
+                return self.uut.connection.execute(
+                    'SELECT last_used FROM results').fetchone()[0]
+
+            self.assertEqual(last_used(), 0)
+            self.uut.close()
+            self.assertEqual(last_used(), 1)
+
+    def test_corrupt_entry(self):
+        self.uut.set('a', 'value')
+        with self.uut.connection as connection:
+            connection.execute("UPDATE results SET value = x'00'")
+        self.assertIsNone(self.uut.get('a'))
+        self.assertEqual(self.uut.misses, 1)
+
+    def test_database_error(self):
+        connection = sqlite3.connect(':memory:')
+        connection.close()
+        self.uut._connection = connection
+        self.uut._pid = os.getpid()
+        self.uut.set('a', 'value')
+        self.assertIsNone(self.uut.get('a'))
+        self.assertEqual(self.uut.misses, 1)
+
+
+class GetExecutableVersionTest(unittest.TestCase):
+
+    def test_version(self):
+        version = get_executable_version(sys.executable)
+        self.assertIn('Python', version)
+        with patch('bears.utils.LinterResultCache.run_shell_command') as run:
+            self.assertEqual(get_executable_version(sys.executable), version)
+            self.assertFalse(run.called)
+
+    def test_missing_executable(self):
+        self.assertEqual(get_executable_version('not-an-executable-xyz'), '')
+
+
+class CachedLinterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.cache = ResultCache(os.path.join(self.directory.name, 'cache'))
+        patcher = patch.object(LinterResultCache, 'result_cache', self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.section = Section('name')
+        self.uut = UpperCaseBear(self.section, Queue())
+
+    def tearDown(self):
+        self.cache.close()
+        self.directory.cleanup()
+
+    def run_bear(self, lines):
+        filename = os.path.join(self.directory.name, 'upper_case_file')
+        with open(filename, 'w') as fl:
+            fl.writelines(lines)
+
+        with patch('coalib.bearlib.abstractions.Linter.run_shell_command',
+                   wraps=LinterResultCache.run_shell_command) as run:
+            results = self.uut.execute(filename, lines)
+        return results, run.call_count
+
+    def test_metadata(self):
+        metadata = UpperCaseBear.get_metadata()
+        self.assertIn('use_result_cache', metadata.optional_params)
+        self.assertEqual(metadata.desc,
+                         'Suggests writing everything in upper case.')
+        self.assertEqual(UpperCaseBear.__name__, 'UpperCaseBear')
+
+    def test_cache_hit(self):
+        results, calls = self.run_bear(['a\n', 'b\n'])
+        self.assertEqual(calls, 1)
+        self.assertEqual(len(results), 1)
+
+        cached_results, calls = self.run_bear(['a\n', 'b\n'])
+        self.assertEqual(calls, 0)
+        self.assertEqual(cached_results, results)
+        self.assertEqual(len(cached_results[0].diffs), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_cache_miss(self):
+        self.run_bear(['a\n'])
+        _, calls = self.run_bear(['b\n'])
+        self.assertEqual(calls, 1)
+
+        self.section.append(Setting('config', 'x'))
+        _, calls = self.run_bear(['b\n'])
+        self.assertEqual(calls, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 3))
+
+    def test_config_file_setting(self):
+        prefix_file = os.path.join(self.directory.name, 'prefix')
+        with open(prefix_file, 'w') as fl:
+            fl.write('x\n')
+        self.section.append(Setting('prefix_file', prefix_file))
+        results, calls = self.run_bear(['a\n'])
+        self.assertEqual(calls, 1)
+        diff, = results[0].diffs.values()
+        self.assertEqual(diff.modified, ['X\n', 'A\n'])
+        _, calls = self.run_bear(['a\n'])
+        self.assertEqual(calls, 0)
+
+        with open(prefix_file, 'w') as fl:
+            fl.write('y\n')
+        _, calls = self.run_bear(['a\n'])
+        self.assertEqual(calls, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+        # Without the config file, the linter runs and nothing is cached.
+        os.remove(prefix_file)
+        self.run_bear(['a\n'])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_cache_disabled(self):
+        self.section.append(Setting('use_result_cache', 'False'))
+        self.run_bear(['a\n'])
+        _, calls = self.run_bear(['a\n'])
+        self.assertEqual(calls, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_invalid_arguments(self):
+        self.section.append(Setting('fail', 'True'))
+        results, calls = self.run_bear(['a\n'])
+        self.assertEqual(results, [])
+        self.assertEqual(calls, 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
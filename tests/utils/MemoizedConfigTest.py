@@ -0,0 +1,90 @@
+import os
+import sys
+import unittest
+from queue import Queue
+from unittest.mock import patch
+
+from coala_utils.ContextManagers import make_temp
+from coalib.bearlib.abstractions.Linter import linter
+from coalib.settings.Section import Section
+from coalib.settings.Setting import Setting
+
+from bears.utils import MemoizedConfig
+from bears.utils.MemoizedConfig import clear_config_files, memoized_config
+
+
+@memoized_config
+@linter(executable=sys.executable,
+        output_format='regex',
+        output_regex=r'(?P<message>.+)')
+class ConfigPrintBear:
+    """
+    Prints the contents of its config file as a result.
+    """
+
+    @staticmethod
+    def generate_config(filename, file, config: str=''):
+        return config or None
+
+    @staticmethod
+    def create_arguments(filename, file, config_file):
+        if config_file is None:
+            return ('-c', 'print("no config")')
+        return ('-c',
+                'import sys; print(open(sys.argv[1]).read(), sys.argv[1])',
+                config_file)
+
+
+class MemoizedConfigTest(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(clear_config_files)
+        self.section = Section('name')
+        self.uut = ConfigPrintBear(self.section, Queue())
+
+    def run_bear(self, filename='file'):
+        results = self.uut.execute(filename, ['line\n'])
+        self.assertEqual(len(results), 1)
+        return results[0].message.rsplit(' ', 1)
+
+    def test_metadata(self):
+        self.assertEqual(ConfigPrintBear.__name__, 'ConfigPrintBear')
+        self.assertEqual(ConfigPrintBear.get_metadata().desc,
+                         'Prints the contents of its config file as a '
+                         'result.')
+
+    def test_no_config(self):
+        self.assertEqual(self.run_bear(), ['no', 'config'])
+        self.assertEqual(MemoizedConfig._config_files, {})
+
+    def test_config_reused(self):
+        self.section.append(Setting('config', 'first'))
+        with patch('coalib.bearlib.abstractions.Linter.make_temp',
+                   wraps=make_temp) as make_temp_mock:
+            content, path = self.run_bear('a')
+            self.assertEqual(self.run_bear('b'), [content, path])
+            self.assertEqual(make_temp_mock.call_count, 1)
+
+        self.assertEqual(content, 'first')
+        self.assertTrue(os.path.isfile(path))
+
+        self.section.append(Setting('config', 'second'))
+        other_content, other_path = self.run_bear()
+        self.assertEqual(other_content, 'second')
+        self.assertNotEqual(other_path, path)
+
+        clear_config_files()
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(os.path.exists(other_path))
+        self.assertEqual(MemoizedConfig._config_files, {})
+
+    def test_other_process(self):
+        self.section.append(Setting('config', 'first'))
+        _, path = self.run_bear()
+        with patch('os.getpid', return_value=-1):
+            clear_config_files()
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(MemoizedConfig._config_files, {})
+
+        MemoizedConfig._inherited_config_stacks.pop().close()
+        self.assertFalse(os.path.exists(path))
@@ -463,6 +463,69 @@ class GitCommitBearTest(unittest.TestCase):
                           ' reference in the last line.'])
         self.assert_no_msgs()
 
+    def get_short_sha(self, revision):
+        return run_shell_command(
+            ['git', 'rev-parse', '--short', revision])[0].strip()
+
+    def test_commit_range(self):
+        self.git_commit('Add base commit')
+        self.git_commit('Added bad shortlog.')
+        self.git_commit('')
+        self.git_commit('Add good shortlog\n\n'
+                        'With a body line that is far too long for the '
+                        'default limit of 72 characters.')
+        bad_shortlog = self.get_short_sha('HEAD~2')
+        empty = self.get_short_sha('HEAD~1')
+        long_body = self.get_short_sha('HEAD')
+
+        self.assertEqual(
+            self.run_uut(commit_range='HEAD~3..HEAD'),
+            [long_body + ': Body of commit contains too long lines. Commit '
+                         'body lines should not exceed 72 characters.',
+             empty + ': Commit has no message.',
+             bad_shortlog + ": Shortlog of commit isn't in imperative "
+                            "mood! Bad words are 'Added'"])
+        self.assert_no_msgs()
+
+        self.assertEqual(
+            self.run_uut(commit_range='HEAD~3..HEAD~2',
+                         shortlog_trailing_period=False, force_body=True),
+            [bad_shortlog + ': Shortlog of commit contains a period at end.',
+             bad_shortlog + ": Shortlog of commit isn't in imperative "
+                            "mood! Bad words are 'Added'",
+             bad_shortlog + ': No commit message body.'])
+        # The results of HEAD name it again.
+        self.assertEqual(self.run_uut(shortlog_trailing_period=False),
+                         ['Body of HEAD commit contains too long lines. '
+                          'Commit body lines should not exceed 72 '
+                          'characters.'])
+        self.assertEqual(self.run_uut(commit_range='HEAD..HEAD'), [])
+        self.assert_no_msgs()
+
+    def test_commit_range_issue_reference(self):
+        self.run_git_command('remote', 'add', 'test',
+                             'git@github.com:user/repo.git')
+        self.git_commit('Add base commit')
+        self.git_commit('Shortlog\n\nFixes #1')
+        self.git_commit('Shortlog\n\nFixes #abc')
+        invalid = self.get_short_sha('HEAD')
+
+        with unittest.mock.patch.object(
+                GitCommitBear, 'get_host_from_remotes',
+                wraps=GitCommitBear.get_host_from_remotes) as get_host:
+            self.assertEqual(
+                self.run_uut(commit_range='HEAD~2..',
+                             shortlog_imperative_check=False,
+                             body_close_issue=True),
+                [invalid + ': Invalid issue number: #abc'])
+        self.assertEqual(get_host.call_count, 1)
+
+    def test_commit_range_git_failure(self):
+        self.git_commit('Add base commit')
+        self.assertEqual(self.run_uut(commit_range='nonexistent..HEAD'), [])
+        self.assertEqual(self.msg_queue.get().message[:4], 'git:')
+        self.assert_no_msgs()
+
     def test_different_path(self):
         no_git_dir = mkdtemp()
         self.git_commit('Add a very long shortlog for a bad project history.')
@@ -482,37 +545,49 @@ class GitCommitBearTest(unittest.TestCase):
         os.chdir(self.gitdir)
         os.rmdir(no_git_dir)
 
-    def test_nltk_download_disabled(self):
-        # setUp has already initialised GitCommitBear.
-        self.assertTrue(GitCommitBear._nltk_data_downloaded)
-
-        section = Section('commit')
-        section.append(Setting('shortlog_imperative_check', 'False'))
-
-        GitCommitBear._nltk_data_downloaded = False
-        GitCommitBear(None, section, self.msg_queue)
+    def test_shortlog_checks_imperative_lexicon(self):
+        with unittest.mock.patch.object(GitCommitBear, 'load_nltk') as nltk:
+            self.assertIsNone(self.uut.check_imperative('Add lexicon'))
+            self.assertEqual(self.uut.check_imperative('Wrote tests'),
+                             ('Wrote', 'VBD'))
+            self.assertEqual(self.uut.check_imperative('Tokenizing words'),
+                             ('Tokenizing', 'VBG'))
+            self.assertIsNone(self.uut.check_imperative(
+                'Documentation for lexicon', nltk_fallback=False))
+        self.assertFalse(nltk.called)
+
+        self.git_commit('tag: Removed shortlog')
+        self.assertEqual(self.run_uut(shortlog_nltk_fallback=False),
+                         ["Shortlog of HEAD commit isn't in imperative "
+                          "mood! Bad words are 'Removed'"])
+
+    def test_nltk_fallback(self):
+        nltk = unittest.mock.Mock()
+        nltk.sent_tokenize.return_value = ['Documentation for lexicon']
+        nltk.word_tokenize.return_value = ['Documentation', 'for', 'lexicon']
+        nltk.pos_tag.return_value = [('I', 'PRP'), ('Documentation', 'NN')]
+        with unittest.mock.patch.object(GitCommitBear, 'load_nltk',
+                                        return_value=nltk):
+            self.assertIsNone(self.uut.check_imperative(
+                'Documentation for lexicon'))
+            nltk.pos_tag.return_value = [('I', 'PRP'), ('Ran', 'VBD')]
+            self.assertEqual(self.uut.check_imperative('Ran lexicon'),
+                             ('Ran', 'VBD'))
+            nltk.pos_tag.return_value = [('I', 'PRP'), ('Fixes', 'VBZ')]
+            self.assertEqual(self.uut.check_imperative(' Fixes bug'),
+                             ('Fixes', 'VBZ'))
+        self.assertEqual(nltk.pos_tag.call_count, 2)
+
+    @unittest.mock.patch.object(GitCommitBear, '_nltk_data_downloaded',
+                                False)
+    def test_nltk_download_lazy(self):
+        GitCommitBear(None, Section('commit'), self.msg_queue)
         self.assertFalse(GitCommitBear._nltk_data_downloaded)
 
-        # reset
-        GitCommitBear._nltk_data_downloaded = True
-
-    def test_nltk_download(self):
-        # setUp has already initialised GitCommitBear.
-        self.assertTrue(GitCommitBear._nltk_data_downloaded)
-
-        section = Section('commit')
-        section.append(Setting('shortlog_imperative_check', 'True'))
-
-        GitCommitBear._nltk_data_downloaded = False
-        GitCommitBear(None, section, self.msg_queue)
-        self.assertTrue(GitCommitBear._nltk_data_downloaded)
-
-    def test_nltk_download_default(self):
-        # setUp has already initialised GitCommitBear.
-        self.assertTrue(GitCommitBear._nltk_data_downloaded)
-
-        section = Section('commit')
-
-        GitCommitBear._nltk_data_downloaded = False
-        GitCommitBear(None, section, self.msg_queue)
+        with unittest.mock.patch('nltk.download') as download:
+            nltk = GitCommitBear.load_nltk()
+            GitCommitBear.load_nltk()
+        download.assert_called_once_with(['punkt',
+                                          'averaged_perceptron_tagger'])
         self.assertTrue(GitCommitBear._nltk_data_downloaded)
+        self.assertEqual(nltk.__name__, 'nltk')
@@ -0,0 +1,42 @@
+import unittest
+
+from bears.vcs.git.ImperativeMood import (
+    BASE_VERBS, get_first_word, get_inflections, get_verb_form)
+
+
+class ImperativeMoodTest(unittest.TestCase):
+
+    def test_get_inflections(self):
+        self.assertEqual(get_inflections('remove'),
+                         {'removes': 'VBZ', 'removed': 'VBD',
+                          'removing': 'VBG'})
+        self.assertEqual(get_inflections('stop'),
+                         {'stops': 'VBZ', 'stoped': 'VBD', 'stopping': 'VBG',
+                          'stopped': 'VBD', 'stoping': 'VBG'})
+        self.assertEqual(get_inflections('push'),
+                         {'pushes': 'VBZ', 'pushed': 'VBD',
+                          'pushing': 'VBG'})
+
+    def test_get_verb_form(self):
+        for verb in BASE_VERBS:
+            self.assertEqual(get_verb_form(verb.capitalize()), 'VB', verb)
+
+        self.assertIsNone(get_verb_form('Updates'))
+        self.assertIsNone(get_verb_form('Commits'))
+        self.assertEqual(get_verb_form('Copied'), 'VBD')
+        self.assertEqual(get_verb_form('Dropped'), 'VBD')
+        self.assertEqual(get_verb_form('Built'), 'VBD')
+        self.assertEqual(get_verb_form('Read'), 'VB')
+        self.assertEqual(get_verb_form('Embed'), 'VB')
+        self.assertEqual(get_verb_form('Mocking'), 'VBG')
+        self.assertEqual(get_verb_form('Vectorizing'), 'VBG')
+        self.assertEqual(get_verb_form('Vectorized'), 'VBD')
+        self.assertIsNone(get_verb_form('String'))
+        self.assertIsNone(get_verb_form('Proceed'))
+        self.assertIsNone(get_verb_form('Lexicon'))
+
+    def test_get_first_word(self):
+        self.assertEqual(get_first_word(' Add x'), 'Add')
+        self.assertEqual(get_first_word('Re-add x'), 'Re-add')
+        self.assertIsNone(get_first_word(''))
+        self.assertIsNone(get_first_word('[wip] Add x'))
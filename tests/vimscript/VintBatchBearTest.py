@@ -0,0 +1,8 @@
+from bears.vimscript.VintBatchBear import VintBatchBear
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+from tests.vimscript.VintBearTest import bad_file, good_file
+
+
+VintBatchBearTest = verify_batched_linter(
+    VintBatchBear,
+    files=(good_file, bad_file, bad_file))
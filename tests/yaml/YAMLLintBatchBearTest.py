@@ -0,0 +1,9 @@
+from bears.yaml.YAMLLintBatchBear import YAMLLintBatchBear
+from tests.utils.BatchedLinterTestHelper import verify_batched_linter
+from tests.yaml.YAMLLintBearTest import no_start_yaml_file, test_file
+
+
+YAMLLintBatchBearTest = verify_batched_linter(
+    YAMLLintBatchBear,
+    files=(test_file, no_start_yaml_file),
+    settings={'document_start': 'yes'})